@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Benchmark the AI review pipeline offline with the stub agent.
+
+Runs the stages of the review workflows
+(run-cursor -> extract-toon -> extract-json -> create-label -> create-issues -> summary)
+--runs times against ai-review-stub-agent.py, which stands in for `cursor-agent`
+and `gh`. The stub is configured from the command line (output size, issue
+count, malformation rate, failure shares, latency); see its docstring.
+
+Per stage the report lists successes and the p50/p95/max wall time; for the
+agent run also the exit reasons, retries and partial results, and for the
+extraction the recovery rate (issues extracted / complete issues the stub
+emitted, from its manifest; synthetic outputs only). extract-json is the
+fallback for JSON answers and fails on TOON output by design.
+--output writes the raw measurements as JSON.
+
+With --stop-on-complete the runner stops the agent once its document detector
+sees a complete answer. Every early stop whose output holds fewer complete
+issues than the stub emitted is reported as premature and fails the benchmark
+(exit code 1), for TOON as well as --format json; --malformed adds progress
+lines and truncated answers the detector must not take for a complete document.
+
+ai-review-create-issues.py and ai-review-summary.py read the fixed
+/tmp/analysis-output.json; an existing file is restored afterwards.
+
+Usage:
+    python scripts/ai-review-benchmark.py --runs 20 --issues 40 --malformed 0.2 \\
+        --failures "rate_limit=0.1,stall=0.05" --latency 0.5
+"""
+
+import argparse
+import functools
+import importlib.util
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+STUB = SCRIPT_DIR / 'ai-review-stub-agent.py'
+STAGES = ['run-cursor', 'extract-toon', 'extract-json', 'create-label', 'create-issues', 'summary']
+SCRIPTS = {
+    'run-cursor': SCRIPT_DIR / 'ai-review-run-cursor.py',
+    'extract-toon': SCRIPT_DIR / 'ai-review-extract-toon.py',
+    'extract-json': SCRIPT_DIR / 'ai-review-extract-json.py',
+    'create-label': SCRIPT_DIR / 'ai-review-create-label.py',
+    'create-issues': SCRIPT_DIR / 'ai-review-create-issues.py',
+    'summary': SCRIPT_DIR / 'ai-review-summary.py',
+}
+
+# Fixed input of ai-review-create-issues.py / ai-review-summary.py
+if sys.platform == "win32":
+    ANALYSIS_JSON = Path(os.environ.get("TEMP", "C:\\temp")) / "analysis-output.json"
+else:
+    ANALYSIS_JSON = Path("/tmp/analysis-output.json")
+
+# Per-stage limit so a broken stage cannot block the benchmark
+STAGE_TIMEOUT = 600
+
+
+def percentile(values, share):
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(share * len(ordered)) - 1)]
+
+
+def synthetic_prompt(index, prompt_bytes, file_count):
+    """Prompt with a file list (picked up by the stub) padded to about prompt_bytes."""
+    files = [f"src/domain/benchmark/file-{index:03d}-{n:03d}.ts" for n in range(file_count)]
+    prompt = f"# Benchmark-Lauf {index}\n\n## Zu analysierende Dateien\n\n" + '\n'.join(files) + '\n\n'
+    filler = "Analysiere die Dateien auf SOLID-, Result-Pattern- und Architektur-Verstöße.\n"
+    missing = prompt_bytes - len(prompt.encode('utf-8'))
+    if missing > 0:
+        prompt += (filler * (missing // len(filler) + 1))[:missing]
+    return prompt
+
+
+def run_stage(command, env, log_path, cwd=None):
+    """Runs one stage; returns (ok, seconds, exit code)."""
+    started = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        try:
+            process = subprocess.run(command, env=env, cwd=cwd, stdout=log, stderr=subprocess.STDOUT,
+                                     stdin=subprocess.DEVNULL, timeout=STAGE_TIMEOUT, check=False)
+            exit_code = process.returncode
+        except subprocess.TimeoutExpired:
+            exit_code = 124
+    return exit_code == 0, round(time.perf_counter() - started, 3), exit_code
+
+
+def read_json(path):
+    try:
+        return json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def read_manifest(state):
+    """Answers of the stub in this run (one entry per agent call)."""
+    try:
+        lines = (state / 'manifest.jsonl').read_text(encoding='utf-8').splitlines()
+    except OSError:
+        return []
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+@functools.lru_cache(maxsize=None)
+def load_stub():
+    """The stub agent as a module (for its complete-issue count)."""
+    spec = importlib.util.spec_from_file_location('ai_review_stub_agent', STUB)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def benchmark_run(index, args, env, work_dir, stages):
+    """Runs all stages once; returns the measurements of this run."""
+    run_dir = work_dir / f"run-{index:03d}"
+    state = run_dir / 'stub-state'
+    # Fresh stub state per run, also when a --work-dir is reused
+    shutil.rmtree(run_dir, ignore_errors=True)
+    state.mkdir(parents=True)
+    env = dict(env, STUB_AGENT_STATE_DIR=str(state))
+    prompt_file = run_dir / 'prompt.md'
+    raw_file = run_dir / 'output-raw.txt'
+    status_file = run_dir / 'status.json'
+    toon_json = run_dir / 'output.json'
+    fallback_json = run_dir / 'output-fallback.json'
+
+    if args.prompt_file:
+        prompt = Path(args.prompt_file).read_text(encoding='utf-8') + f"\n<!-- Benchmark-Lauf {index} -->\n"
+    else:
+        prompt = synthetic_prompt(index, args.prompt_bytes, args.files)
+    prompt_file.write_text(prompt, encoding='utf-8')
+    result = {'run': index, 'stages': {}}
+
+    def measure(stage, command):
+        ok, seconds, exit_code = run_stage(command, env, run_dir / f"{stage}.log")
+        result['stages'][stage] = {'ok': ok, 'seconds': seconds, 'exit_code': exit_code}
+        return ok
+
+    if 'run-cursor' in stages:
+        measure('run-cursor', [
+            sys.executable, str(SCRIPTS['run-cursor']),
+            '--prompt-file', str(prompt_file), '--output-file', str(raw_file),
+            '--status-file', str(status_file), '--timeout', str(args.timeout),
+            '--first-byte-timeout', str(args.first_byte_timeout), '--idle-timeout', str(args.idle_timeout),
+            '--retries', str(args.retries), '--backoff-base', str(args.backoff_base),
+            '--backoff-max', str(args.backoff_max), '--transport', args.transport,
+        ] + (['--stop-on-complete'] if args.stop_on_complete else []))
+        status = read_json(status_file) or {}
+        result['stages']['run-cursor'].update({
+            'reason': status.get('reason'),
+            'attempts': len(status.get('attempts') or []),
+            'partial': bool(status.get('partial')),
+            'output_bytes': status.get('output_bytes', 0),
+        })
+    answers = read_manifest(state)
+    final = answers[-1] if answers else {}
+    # Unknown (None) for replayed outputs
+    result['emitted_issues'] = final.get('issues')
+    result['complete_issues'] = final.get('complete_issues')
+    raw_bytes = raw_file.stat().st_size if raw_file.exists() else 0
+    agent = result['stages'].get('run-cursor', {})
+    if agent.get('reason') == 'complete_document' and final.get('mode') == 'synthetic':
+        # Early stop must not cut off issues the stub emitted completely
+        kept = load_stub().complete_issues(raw_file.read_text(encoding='utf-8', errors='replace'), final['format'])
+        agent['premature'] = kept < final['complete_issues']
+
+    if 'extract-toon' in stages and raw_bytes:
+        shutil.copyfile(raw_file, toon_json)
+        ok = measure('extract-toon', [sys.executable, str(SCRIPTS['extract-toon']), '--raw-file', str(raw_file),
+                                      '--toon-file', str(run_dir / 'output.toon'), '--output-file', str(toon_json)])
+        analysis = read_json(toon_json) if ok else None
+        result['stages']['extract-toon'].update({
+            'bytes': raw_bytes,
+            'issues': len(analysis.get('issues') or []) if isinstance(analysis, dict) else 0,
+            'partial': bool(analysis.get('partial')) if isinstance(analysis, dict) else False,
+        })
+    if 'extract-json' in stages and raw_bytes:
+        shutil.copyfile(raw_file, fallback_json)
+        ok = measure('extract-json', [sys.executable, str(SCRIPTS['extract-json']), '--output-file', str(fallback_json)])
+        analysis = read_json(fallback_json) if ok else None
+        result['stages']['extract-json'].update({
+            'bytes': raw_bytes,
+            'issues': len(analysis.get('issues') or []) if isinstance(analysis, dict) else 0,
+        })
+
+    # Downstream stages read the fixed path, like in the workflows
+    extracted = result['stages'].get('extract-toon', {})
+    if extracted.get('ok'):
+        shutil.copyfile(toon_json, ANALYSIS_JSON)
+    elif ANALYSIS_JSON.exists():
+        ANALYSIS_JSON.unlink()
+    if 'create-label' in stages:
+        measure('create-label', [sys.executable, str(SCRIPTS['create-label'])])
+    if 'create-issues' in stages:
+        measure('create-issues', [sys.executable, str(SCRIPTS['create-issues'])])
+        result['stages']['create-issues']['created'] = len(read_json(state / 'gh-issues.json') or [])
+    if 'summary' in stages:
+        measure('summary', [sys.executable, str(SCRIPTS['summary'])])
+    return result
+
+
+def aggregate(runs, stages):
+    """Per-stage statistics over all runs."""
+    report = {}
+    for stage in stages:
+        entries = [run['stages'][stage] for run in runs if stage in run['stages']]
+        seconds = [entry['seconds'] for entry in entries]
+        stats = {
+            'runs': len(entries),
+            'ok': sum(1 for entry in entries if entry['ok']),
+            'p50': percentile(seconds, 0.5),
+            'p95': percentile(seconds, 0.95),
+            'max': max(seconds, default=None),
+        }
+        if stage == 'run-cursor':
+            reasons = {}
+            for entry in entries:
+                reasons[entry['reason']] = reasons.get(entry['reason'], 0) + 1
+            stats.update(reasons=reasons,
+                         retries=sum(max(0, entry['attempts'] - 1) for entry in entries),
+                         partial=sum(1 for entry in entries if entry['partial']),
+                         premature=sum(1 for entry in entries if entry.get('premature')))
+        if stage in ('extract-toon', 'extract-json'):
+            total_bytes = sum(entry['bytes'] for entry in entries)
+            total_seconds = sum(seconds)
+            stats['mb_per_second'] = round(total_bytes / total_seconds / 1024 / 1024, 3) if total_seconds else None
+            stats['issues'] = sum(entry['issues'] for entry in entries)
+        report[stage] = stats
+
+    known = [run for run in runs if run['complete_issues'] is not None]
+    complete = sum(run['complete_issues'] for run in known)
+    recovered = sum(run['stages'].get('extract-toon', {}).get('issues', 0) for run in known)
+    report['recovery'] = {
+        'runs': len(known),
+        'emitted_issues': sum(run['emitted_issues'] or 0 for run in known),
+        'complete_issues': complete,
+        'extracted_issues': recovered,
+        'rate': round(recovered / complete, 3) if complete else None,
+    }
+    return report
+
+
+def format_seconds(value):
+    return '-' if value is None else f"{value:.2f}s"
+
+
+def print_report(report, stages, duration):
+    print("")
+    print(f"{'Stage':<14} {'ok':>9} {'p50':>8} {'p95':>8} {'max':>8}  details")
+    for stage in stages:
+        stats = report[stage]
+        details = ''
+        if stage == 'run-cursor':
+            reasons = ', '.join(f"{reason}={count}" for reason, count in sorted(stats['reasons'].items(), key=str))
+            details = f"{reasons}; retries={stats['retries']}, partial={stats['partial']}"
+            if stats['premature']:
+                details += f", premature stops={stats['premature']}"
+        elif 'mb_per_second' in stats:
+            speed = '-' if stats['mb_per_second'] is None else f"{stats['mb_per_second']:.2f} MB/s"
+            details = f"{speed}, {stats['issues']} issues"
+        print(f"{stage:<14} {stats['ok']:>4}/{stats['runs']:<4} {format_seconds(stats['p50']):>8} "
+              f"{format_seconds(stats['p95']):>8} {format_seconds(stats['max']):>8}  {details}")
+    recovery = report['recovery']
+    if 'extract-toon' in stages and recovery['runs']:
+        rate = '-' if recovery['rate'] is None else f"{recovery['rate']:.0%}"
+        print("")
+        print(f"🩹 Recovery: {recovery['extracted_issues']}/{recovery['complete_issues']} complete issues extracted "
+              f"({rate}; {recovery['emitted_issues']} emitted)")
+    print(f"⏱️ Total: {duration:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the AI review pipeline with the stub agent')
+    parser.add_argument('--runs', type=int, default=5, help='Pipeline runs (default: 5)')
+    parser.add_argument('--stages', default=','.join(STAGES), help="Comma-separated stages (default: all)")
+    parser.add_argument('--work-dir', default=None, help='Directory for prompts, outputs and logs (default: temp)')
+    parser.add_argument('--output', default=None, help='Write measurements and statistics as JSON')
+    stub = parser.add_argument_group('stub agent')
+    stub.add_argument('--replay', default=None, help='Recorded output file or directory instead of synthetic output')
+    stub.add_argument('--format', choices=['toon', 'json'], default='toon', help='Synthetic output format')
+    stub.add_argument('--issues', type=int, default=5, help='Issues per output (default: 5)')
+    stub.add_argument('--size', type=int, default=0, help='Target output size in bytes (default: unpadded)')
+    stub.add_argument('--malformed', type=float, default=0.0, help='Share of malformed outputs, 0..1')
+    stub.add_argument('--failures', default='', help='Failure shares, e.g. "rate_limit=0.1,crash=0.05,stall=0.05"')
+    stub.add_argument('--latency', type=float, default=0.0, help='Seconds until the first byte')
+    stub.add_argument('--throughput', type=float, default=0.0, help='Output bytes per second (0 = unlimited)')
+    stub.add_argument('--hang-seconds', type=float, default=30.0, help='How long hang/stall failures block')
+    stub.add_argument('--gh-latency', type=float, default=0.0, help='Seconds per stub gh call')
+    stub.add_argument('--seed', default='0', help='Seed of the stub (default: 0)')
+    prompt = parser.add_argument_group('prompt')
+    prompt.add_argument('--prompt-file', default=None, help='Use this prompt instead of a synthetic one')
+    prompt.add_argument('--prompt-bytes', type=int, default=20000, help='Synthetic prompt size (default: 20000)')
+    prompt.add_argument('--files', type=int, default=10, help='Files listed in the synthetic prompt (default: 10)')
+    runner = parser.add_argument_group('runner')
+    runner.add_argument('--timeout', type=int, default=120, help='Runner --timeout (default: 120)')
+    runner.add_argument('--first-byte-timeout', type=int, default=5, help='Runner --first-byte-timeout (default: 5)')
+    runner.add_argument('--idle-timeout', type=int, default=5, help='Runner --idle-timeout (default: 5)')
+    runner.add_argument('--retries', type=int, default=2, help='Runner --retries (default: 2)')
+    runner.add_argument('--backoff-base', type=float, default=0.5, help='Runner --backoff-base (default: 0.5)')
+    runner.add_argument('--backoff-max', type=float, default=2.0, help='Runner --backoff-max (default: 2)')
+    runner.add_argument('--transport', default='auto', help='Runner --transport (default: auto)')
+    runner.add_argument('--stop-on-complete', action='store_true',
+                        help='Runner --stop-on-complete; premature early stops fail the benchmark')
+    args = parser.parse_args()
+
+    stages = [stage.strip() for stage in args.stages.split(',') if stage.strip()]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        print(f"❌ Error: Unknown stage(s): {', '.join(unknown)} (known: {', '.join(STAGES)})", file=sys.stderr)
+        sys.exit(1)
+
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix='ai-review-benchmark-'))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    bin_dir = work_dir / 'bin'
+    subprocess.run([sys.executable, str(STUB), 'install', str(bin_dir)], check=True, stdout=subprocess.DEVNULL)
+
+    env = dict(os.environ)
+    env.update({
+        'PATH': f"{bin_dir}{os.pathsep}{env.get('PATH', '')}",
+        'CURSOR_API_KEY': 'benchmark',
+        'GITHUB_SHA': 'benchmark',
+        'STUB_AGENT_FORMAT': args.format,
+        'STUB_AGENT_ISSUES': str(args.issues),
+        'STUB_AGENT_SIZE': str(args.size),
+        'STUB_AGENT_MALFORMED': str(args.malformed),
+        'STUB_AGENT_FAILURES': args.failures,
+        'STUB_AGENT_LATENCY': str(args.latency),
+        'STUB_AGENT_THROUGHPUT': str(args.throughput),
+        'STUB_AGENT_HANG_SECONDS': str(args.hang_seconds),
+        'STUB_AGENT_SEED': str(args.seed),
+        'STUB_GH_LATENCY': str(args.gh_latency),
+        # Runner telemetry goes to the work dir, not the real ledger
+        'AI_REVIEW_METRICS_FILE': str(work_dir / 'metrics.jsonl'),
+    })
+    if args.replay:
+        env['STUB_AGENT_REPLAY'] = str(Path(args.replay).resolve())
+    else:
+        env.pop('STUB_AGENT_REPLAY', None)
+
+    backup = None
+    if ANALYSIS_JSON.exists():
+        backup = work_dir / 'analysis-output.json.backup'
+        shutil.copyfile(ANALYSIS_JSON, backup)
+
+    print(f"🏁 Benchmark: {args.runs} runs, stages: {', '.join(stages)}")
+    print(f"   Work dir: {work_dir}")
+    started = time.perf_counter()
+    runs = []
+    try:
+        for index in range(1, args.runs + 1):
+            result = benchmark_run(index, args, env, work_dir, stages)
+            runs.append(result)
+            agent = result['stages'].get('run-cursor', {})
+            print(f"  Run {index}/{args.runs}: " + ', '.join(
+                f"{stage} {'✅' if entry['ok'] else '❌'} {entry['seconds']:.2f}s"
+                for stage, entry in result['stages'].items())
+                + (f" ({agent['reason']})" if agent else ''), flush=True)
+    finally:
+        if backup:
+            shutil.copyfile(backup, ANALYSIS_JSON)
+        elif ANALYSIS_JSON.exists():
+            ANALYSIS_JSON.unlink()
+
+    duration = time.perf_counter() - started
+    report = aggregate(runs, stages)
+    print_report(report, stages, duration)
+    if args.output:
+        Path(args.output).write_text(json.dumps({'config': vars(args), 'report': report, 'runs': runs},
+                                                indent=2), encoding='utf-8')
+        print(f"✅ Report written to: {args.output}")
+    premature = report.get('run-cursor', {}).get('premature')
+    if premature:
+        print(f"❌ {premature} run(s) stopped before the document was complete", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
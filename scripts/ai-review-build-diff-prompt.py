@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Build the diff section of the incremental review prompt.
+
+Instead of a list of changed file names (which makes the agent run `git diff`
+and `cat` itself and review whole files), the changed hunks are embedded
+directly: `git diff -U<context>` output per file plus the enclosing class and
+function signatures of every hunk. A TOON table gives the overview of all
+changed files. Hunks are added until --token-budget is used up; whatever does
+not fit is listed so the agent can still fetch it with git.
+
+Usage:
+    python scripts/ai-review-build-diff-prompt.py --base HEAD~1 --head HEAD \\
+        --files changed_files.txt --context 5 >> /tmp/analysis-prompt.md
+"""
+
+import argparse
+import math
+import re
+import subprocess
+import sys
+
+# Same ratio as the prompt size estimate in ai-review-run-cursor.py
+DEFAULT_CHARS_PER_TOKEN = 4.0
+DEFAULT_TOKEN_BUDGET = 40000
+DEFAULT_CONTEXT = 5
+
+HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+# Declarations that open a scope in TypeScript/JavaScript/Svelte scripts
+DECLARATIONS = [
+    re.compile(r'^\s*(?:export\s+)?(?:default\s+)?(?:declare\s+)?(?:abstract\s+)?'
+               r'(?:class|interface|enum|namespace|module)\s+[\w$]+'),
+    # Class expressions (mixins): `const Mixed = class extends Base {`, `return class extends Base {`
+    re.compile(r'^\s*(?:(?:export\s+)?(?:const|let|var)\s+[\w$]+\s*=|return)\s*class\b'),
+    re.compile(r'^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*[\w$]*\s*[<(]'),
+    re.compile(r'^\s*(?:export\s+)?(?:const|let|var)\s+[\w$]+\s*(?::[^=]+)?=\s*(?:async\s+)?'
+               r'(?:function\b|\([^)]*\)?\s*(?::[^=]+)?=>|\(|[\w$]+\s*=>)'),
+    re.compile(r'^\s*(?:(?:public|private|protected|static|readonly|abstract|override|async|get|set)\s+)*'
+               r'(?:#?[\w$]+)\s*(?:<[^>]*>)?\s*\([^;]*$'),
+]
+# Control-flow lines that look like method declarations
+NOT_DECLARATIONS = re.compile(r'^\s*(?:if|for|while|switch|catch|return|await|throw|new|else|do|try)\b')
+CLASS_EXPRESSION = DECLARATIONS[1]
+
+
+def git(args):
+    return subprocess.run(['git'] + args, capture_output=True, text=True, encoding='utf-8',
+                          errors='replace', check=True).stdout
+
+
+def estimate_tokens(text, chars_per_token=DEFAULT_CHARS_PER_TOKEN):
+    return math.ceil(len(text.encode('utf-8')) / chars_per_token)
+
+
+def parse_diff(diff_text):
+    """Splits `git diff` output into files with their hunks.
+
+    Returns:
+        list: [{'path', 'status', 'added', 'removed', 'hunks': [{'header', 'new_start', 'lines'}]}]
+    """
+    files = []
+    current = None
+    hunk = None
+    for line in diff_text.splitlines():
+        if line.startswith('diff --git '):
+            current = {'path': None, 'status': 'M', 'added': 0, 'removed': 0, 'hunks': [], 'binary': False}
+            files.append(current)
+            hunk = None
+            continue
+        if current is None:
+            continue
+        if hunk is None:
+            if line.startswith('new file mode'):
+                current['status'] = 'A'
+            elif line.startswith('rename from '):
+                current['status'] = 'R'
+            elif line.startswith('Binary files '):
+                current['binary'] = True
+            elif line.startswith('+++ '):
+                path = line[4:]
+                current['path'] = path[2:] if path.startswith('b/') else path
+        match = HUNK_HEADER.match(line)
+        if match:
+            hunk = {'header': line, 'new_start': int(match.group(3)), 'lines': []}
+            current['hunks'].append(hunk)
+            continue
+        if hunk is not None:
+            if line.startswith('+'):
+                current['added'] += 1
+            elif line.startswith('-'):
+                current['removed'] += 1
+            hunk['lines'].append(line)
+    return [entry for entry in files if entry['path'] and not entry['binary']]
+
+
+def first_changed_line(hunk):
+    """Line number (new file) of the first added line, else of the hunk start."""
+    number = hunk['new_start']
+    for line in hunk['lines']:
+        if line.startswith('+'):
+            return number
+        if not line.startswith('-'):
+            number += 1
+    return hunk['new_start']
+
+
+def enclosing_scopes(source_lines, line_number):
+    """Signatures of the declarations enclosing `line_number` (1-based), outermost first."""
+    if not source_lines or line_number < 1:
+        return []
+    index = min(line_number, len(source_lines)) - 1
+    target = source_lines[index]
+    indent = len(target) - len(target.lstrip()) if target.strip() else None
+    scopes = []
+    # Indents of blocks closed between the declaration and the target (sibling methods)
+    closed = set()
+    for i in range(index - 1, -1, -1):
+        line = source_lines[i]
+        if not line.strip():
+            continue
+        line_indent = len(line) - len(line.lstrip())
+        if indent is not None and line_indent >= indent:
+            continue
+        if line.lstrip().startswith('}'):
+            closed.add(line_indent)
+            continue
+        if not any(p.match(line) for p in DECLARATIONS) or (
+                NOT_DECLARATIONS.match(line) and not CLASS_EXPRESSION.match(line)):
+            continue
+        if line_indent in closed:
+            closed.discard(line_indent)
+            continue
+        scopes.append((i + 1, line.strip().rstrip('{').strip()))
+        indent = line_indent
+        if line_indent == 0:
+            break
+    return list(reversed(scopes))
+
+
+def toon_value(value):
+    text = str(value)
+    return f'"{text}"' if any(c in text for c in ',:"\n') else text
+
+
+def format_overview(files):
+    """TOON table of all changed files."""
+    lines = [f"changes[{len(files)}]{{file,status,added,removed,hunks}}:"]
+    for entry in files:
+        lines.append('  ' + ','.join(toon_value(v) for v in (
+            entry['path'], entry['status'], entry['added'], entry['removed'], len(entry['hunks']))))
+    return '\n'.join(lines)
+
+
+def format_hunk(hunk, scopes):
+    scope_text = ' › '.join(f"`{signature}` (Zeile {number})" for number, signature in scopes)
+    header = f"{hunk['header']}" + (f" — in {scope_text}" if scope_text else '')
+    return f"{header}\n```diff\n" + '\n'.join(hunk['lines']) + "\n```\n"
+
+
+def build_section(files, base, head, token_budget, chars_per_token=DEFAULT_CHARS_PER_TOKEN, read_source=None):
+    """Builds the Markdown section; hunks beyond the token budget are listed as omitted."""
+    read_source = read_source or (lambda path: git(['show', f'{head}:{path}']).splitlines())
+    parts = [
+        "## Änderungen (Diff-Hunks)",
+        "",
+        "Die Änderungen sind hier vollständig eingebettet - du musst sie nicht selbst mit `git diff` "
+        "ermitteln. Analysiere genau diese Änderungen; lies weitere Dateien nur, wenn du zusätzlichen "
+        "Kontext brauchst.",
+        "",
+        "```toon",
+        format_overview(files),
+        "```",
+        "",
+    ]
+    used = estimate_tokens('\n'.join(parts), chars_per_token)
+    omitted = []
+
+    for entry in files:
+        try:
+            source = read_source(entry['path'])
+        except (OSError, subprocess.CalledProcessError):
+            source = []
+        file_header = f"### {entry['path']} ({entry['status']}, +{entry['added']} -{entry['removed']})\n"
+        file_parts = []
+        skipped = 0
+        for hunk in entry['hunks']:
+            text = format_hunk(hunk, enclosing_scopes(source, first_changed_line(hunk)))
+            cost = estimate_tokens(text, chars_per_token)
+            header_cost = 0 if file_parts else estimate_tokens(file_header, chars_per_token)
+            if used + cost + header_cost > token_budget:
+                skipped += 1
+                continue
+            file_parts.append(text)
+            used += cost + header_cost
+        if file_parts:
+            parts.append(file_header)
+            parts.extend(file_parts)
+        if skipped:
+            omitted.append((entry['path'], skipped))
+
+    if omitted:
+        parts.append("### Nicht eingebettet (Token-Budget)")
+        parts.append("")
+        parts.append("Diese Hunks passten nicht ins Budget. Lies sie bei Bedarf mit "
+                     f"`git diff {base} {head} -- <datei>`:")
+        parts.append("")
+        parts.extend(f"- {path}: {count} Hunk(s)" for path, count in omitted)
+        parts.append("")
+    return '\n'.join(parts), used, omitted
+
+
+def read_file_list(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the diff-hunk section of the review prompt')
+    parser.add_argument('--base', default='HEAD~1', help='Base revision (default: HEAD~1)')
+    parser.add_argument('--head', default='HEAD', help='Head revision (default: HEAD)')
+    parser.add_argument('--files', default=None, help='Only these files (one path per line, e.g. changed_files.txt)')
+    parser.add_argument('--context', type=int, default=DEFAULT_CONTEXT,
+                        help=f'Context lines around each hunk (default: {DEFAULT_CONTEXT})')
+    parser.add_argument('--token-budget', type=int, default=DEFAULT_TOKEN_BUDGET,
+                        help=f'Estimated tokens for the whole section (default: {DEFAULT_TOKEN_BUDGET})')
+    parser.add_argument('--chars-per-token', type=float, default=DEFAULT_CHARS_PER_TOKEN,
+                        help=f'Tokenizer ratio, bytes per token (default: {DEFAULT_CHARS_PER_TOKEN})')
+    parser.add_argument('--output', default=None, help='Write the section to this file (default: stdout)')
+    args = parser.parse_args()
+
+    try:
+        paths = read_file_list(args.files) if args.files else []
+        diff_text = git(['diff', f'-U{args.context}', '--no-color', '--no-ext-diff', '-M',
+                         '--diff-filter=ACMR', args.base, args.head, '--'] + paths)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"❌ Error: could not read diff: {getattr(e, 'stderr', None) or e}", file=sys.stderr)
+        sys.exit(1)
+
+    files = parse_diff(diff_text)
+    if not files:
+        print("❌ Error: No changes found", file=sys.stderr)
+        sys.exit(1)
+
+    section, used, omitted = build_section(files, args.base, args.head, args.token_budget, args.chars_per_token)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(section)
+    else:
+        sys.stdout.write(section)
+    hunks = sum(len(entry['hunks']) for entry in files)
+    print(f"✅ Diff section: {len(files)} files, {hunks - sum(c for _, c in omitted)}/{hunks} hunks, "
+          f"~{used:,} tokens", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 """
 Extract JSON from Cursor AI output (may be embedded in Markdown or text).
+
+If the output was cut off (agent killed or failed, see ai-review-run-cursor.py),
+the complete issues emitted so far are salvaged and written with a recalculated
+summary and "partial": true.
 """
+import argparse
 import re
 import json
 import sys
@@ -21,6 +26,81 @@ if sys.platform == "win32":
 else:
     OUTPUT_FILE = "/tmp/analysis-output.json"
 
+# Schlüssel der Summary, die ai-review-summary.py erwartet
+ISSUE_TYPES = ['solid_violation', 'result_pattern_violation', 'architecture_violation', 'code_smell', 'bug']
+SEVERITIES = ['critical', 'high', 'medium', 'low']
+
+
+def salvage_partial(content):
+    """Rettet die vollständigen Issues aus abgeschnittenem JSON.
+
+    Liest das "issues"-Array Element für Element, bis ein Element unvollständig ist.
+    Die Summary wird aus den geretteten Issues neu berechnet.
+
+    Returns:
+        dict oder None: Analyse mit "partial": true, None wenn kein Issue vollständig ist
+    """
+    match = re.search(r'"issues"\s*:\s*\[', content)
+    if not match:
+        return None
+    decoder = json.JSONDecoder()
+    issues = []
+    pos = match.end()
+    while True:
+        while pos < len(content) and content[pos] in ' \t\r\n,':
+            pos += 1
+        if pos >= len(content) or content[pos] == ']':
+            break
+        try:
+            item, pos = decoder.raw_decode(content, pos)
+        except ValueError:
+            break
+        if isinstance(item, dict):
+            issues.append(item)
+    if not issues:
+        return None
+
+    files_analyzed = 0
+    summary_match = re.search(r'"files_analyzed"\s*:\s*(\d+)', content[:match.start()])
+    if summary_match:
+        files_analyzed = int(summary_match.group(1))
+    by_type = {key: 0 for key in ISSUE_TYPES}
+    by_severity = {key: 0 for key in SEVERITIES}
+    for issue in issues:
+        issue_type = str(issue.get('type') or '').lower()
+        severity = str(issue.get('severity') or '').lower()
+        if issue_type:
+            by_type[issue_type] = by_type.get(issue_type, 0) + 1
+        if severity:
+            by_severity[severity] = by_severity.get(severity, 0) + 1
+    return {
+        'summary': {
+            'total_issues': len(issues),
+            'files_analyzed': files_analyzed,
+            'by_type': by_type,
+            'by_severity': by_severity,
+        },
+        'issues': issues,
+        'partial': True,
+    }
+
+
+def write_salvaged(content):
+    """Schreibt gerettete Teilergebnisse; beendet mit 0 bei Erfolg, sonst 1."""
+    salvaged = salvage_partial(content)
+    if salvaged is None:
+        sys.exit(1)
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(salvaged, f, indent=2, ensure_ascii=False)
+    print(f"🩹 Output incomplete - salvaged {len(salvaged['issues'])} complete issue(s)")
+    sys.exit(0)
+
+
+# Die Datei wird gelesen und mit dem extrahierten JSON überschrieben
+_parser = argparse.ArgumentParser(description="Extract JSON from Cursor AI output")
+_parser.add_argument("--output-file", default=OUTPUT_FILE, help=f"Ein- und Ausgabedatei (Standard: {OUTPUT_FILE})")
+OUTPUT_FILE = _parser.parse_args().output_file
+
 try:
     with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
         content = f.read()
@@ -90,9 +170,9 @@ if json_str:
     except json.JSONDecodeError as e:
         print(f"Failed to parse extracted JSON: {e}")
         print(f"Attempted to parse: {json_str[:200]}...")
-        sys.exit(1)
+        write_salvaged(content)
 else:
     print("No JSON found in output")
     print(f"Output preview (first 500 chars):\n{content[:500]}")
-    sys.exit(1)
+    write_salvaged(content)
 
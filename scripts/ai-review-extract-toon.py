@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 """
 Extract TOON from Cursor AI output and convert to JSON for compatibility.
+
+Output that was cut off (agent killed or failed, see ai-review-run-cursor.py) is
+still converted: an incomplete last issue is dropped, the summary is recalculated
+from the remaining issues and the result is marked with "partial": true.
 """
+import argparse
 import re
 import json
 import sys
@@ -37,6 +42,61 @@ else:
     TOON_FILE = "/tmp/analysis-output.toon"
     RAW_FILE = "/tmp/analysis-output-raw.txt"
 
+# Pfade können überschrieben werden (z.B. pro Shard in ai-review-sharded.py)
+_parser = argparse.ArgumentParser(description="Extract TOON from Cursor AI output and convert to JSON")
+_parser.add_argument("--raw-file", default=RAW_FILE, help=f"Raw-Output von cursor-agent (Standard: {RAW_FILE})")
+_parser.add_argument("--toon-file", default=TOON_FILE, help=f"Extrahierte TOON-Datei (Standard: {TOON_FILE})")
+_parser.add_argument("--output-file", default=OUTPUT_FILE, help=f"JSON-Ausgabe (Standard: {OUTPUT_FILE})")
+_args = _parser.parse_args()
+RAW_FILE, TOON_FILE, OUTPUT_FILE = _args.raw_file, _args.toon_file, _args.output_file
+JSON_EXTRACTOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ai-review-extract-json.py")
+
+def mark_partial(json_obj, toon_str):
+    """Erkennt abgeschnittene TOON-Ausgaben und behält nur vollständige Issues.
+
+    Ein Issue ist vollständig, wenn nach seinem Header (issues[N]{felder}:) das
+    letzte deklarierte Feld folgt (wie DocumentDetector in ai-review-run-cursor.py).
+    Fehlen Issues gegenüber summary.total_issues, wird die Summary neu berechnet.
+    """
+    issues = json_obj.get('issues') if isinstance(json_obj, dict) else None
+    if not isinstance(issues, list):
+        return json_obj
+
+    truncated = False
+    headers = list(re.finditer(r'^issues\[\d+\]\{([^}]*)\}:\s*$', toon_str, re.MULTILINE))
+    if headers and issues:
+        last_field = headers[-1].group(1).split(',')[-1].strip()
+        item_text = toon_str[headers[-1].end():]
+        if not re.search(r'^\s+' + re.escape(last_field) + r'(?:\[\d*\])?:', item_text, re.MULTILINE):
+            issues.pop()
+            truncated = True
+
+    summary = json_obj.get('summary')
+    summary = summary if isinstance(summary, dict) else {}
+    declared = summary.get('total_issues')
+    if isinstance(declared, int) and declared > len(issues):
+        truncated = True
+    if not truncated:
+        return json_obj
+
+    by_type = {key: 0 for key in (summary.get('by_type') or {})}
+    by_severity = {key: 0 for key in (summary.get('by_severity') or {})}
+    for issue in issues:
+        if not isinstance(issue, dict):
+            continue
+        issue_type = str(issue.get('type') or '').lower()
+        severity = str(issue.get('severity') or '').lower()
+        if issue_type:
+            by_type[issue_type] = by_type.get(issue_type, 0) + 1
+        if severity:
+            by_severity[severity] = by_severity.get(severity, 0) + 1
+    summary.update(total_issues=len(issues), by_type=by_type, by_severity=by_severity)
+    json_obj['summary'] = summary
+    json_obj['partial'] = True
+    print(f"🩹 Output incomplete - kept {len(issues)} complete issue(s)"
+          + (f" of {declared} announced" if isinstance(declared, int) else ""), file=sys.stderr)
+    return json_obj
+
 def parse_toon_manually(toon_str):
     """
     Manueller TOON-Parser für AI-generiertes Format.
@@ -322,7 +382,7 @@ if not TOON_AVAILABLE:
     print("⚠️ TOON-Bibliothek nicht verfügbar, versuche JSON-Extraktion...", file=sys.stderr)
     # Fallback zu JSON-Extraktion
     import subprocess
-    result = subprocess.run([sys.executable, "scripts/ai-review-extract-json.py"],
+    result = subprocess.run([sys.executable, JSON_EXTRACTOR, "--output-file", OUTPUT_FILE],
                           capture_output=True, text=True)
     sys.exit(result.returncode)
 
@@ -418,6 +478,7 @@ except Exception as e:
         parse_error = e2
 
 if json_obj:
+    json_obj = mark_partial(json_obj, toon_str)
     # Speichere als JSON (für Kompatibilität mit bestehenden Skripten)
     with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
         json.dump(json_obj, f, indent=2, ensure_ascii=False)
@@ -430,6 +491,6 @@ else:
     # Fallback zu JSON-Extraktion
     print("⚠️ Falling back to JSON extraction...", file=sys.stderr)
     import subprocess
-    result = subprocess.run([sys.executable, "scripts/ai-review-extract-json.py"],
+    result = subprocess.run([sys.executable, JSON_EXTRACTOR, "--output-file", OUTPUT_FILE],
                           capture_output=True, text=True)
     sys.exit(result.returncode)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Aggregate the agent run telemetry ledger written by ai-review-run-cursor.py.
+
+Reads the JSONL ledger (--metrics-file) and reports per model the number of
+runs, success rate, p50/p95 duration and time to first byte and the estimated
+token volume, plus the trend per day or week. Costs are only estimated when
+prices are given (--price MODEL=INPUT:OUTPUT in USD per million tokens, `*`
+for all models); token counts are the byte-based estimates of the runner.
+
+Usage:
+    python scripts/ai-review-metrics.py --metrics-file .ai-review-cache/metrics.jsonl \\
+        --period week --price "sonnet-4.5=3:15" --markdown >> $GITHUB_STEP_SUMMARY
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+DEFAULT_METRICS_FILE = '.ai-review-cache/metrics.jsonl'
+# Same exit reasons as SUCCESS_REASONS in ai-review-run-cursor.py
+SUCCESS_REASONS = ('completed', 'complete_document')
+
+
+def percentile(values, share):
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(share * len(ordered)) - 1)]
+
+
+def parse_prices(specs):
+    """['sonnet-4.5=3:15', '*=1:5'] -> {'sonnet-4.5': (3.0, 15.0), '*': (1.0, 5.0)}"""
+    prices = {}
+    for spec in specs or []:
+        model, _, values = spec.partition('=')
+        input_price, _, output_price = values.partition(':')
+        try:
+            prices[model.strip()] = (float(input_price), float(output_price or input_price))
+        except ValueError:
+            raise ValueError(f"Invalid price '{spec}' (expected MODEL=INPUT:OUTPUT)")
+    return prices
+
+
+def load_records(path, since=None):
+    """Records of the ledger (newer than `since`); returns (records, skipped lines)."""
+    records, skipped = [], 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                record['_time'] = datetime.fromisoformat(record['timestamp'])
+            except (ValueError, KeyError, TypeError):
+                skipped += 1
+                continue
+            if since is None or record['_time'] >= since:
+                records.append(record)
+    return records, skipped
+
+
+def period_of(moment, period):
+    if period == 'day':
+        return moment.strftime('%Y-%m-%d')
+    year, week, _ = moment.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def summarize(records, prices):
+    """Statistics of a group of records."""
+    durations = [r['duration_seconds'] for r in records if isinstance(r.get('duration_seconds'), (int, float))]
+    first_bytes = [r['first_byte_seconds'] for r in records if isinstance(r.get('first_byte_seconds'), (int, float))]
+    prompt_tokens = sum(r.get('prompt_tokens') or 0 for r in records)
+    output_tokens = sum(r.get('output_tokens') or 0 for r in records)
+    cost = None
+    for record in records:
+        price = prices.get(record.get('model')) or prices.get('*')
+        if price:
+            cost = (cost or 0.0) + ((record.get('prompt_tokens') or 0) * price[0]
+                                    + (record.get('output_tokens') or 0) * price[1]) / 1_000_000
+    return {
+        'runs': len(records),
+        'succeeded': sum(1 for r in records if r.get('reason') in SUCCESS_REASONS),
+        'partial': sum(1 for r in records if r.get('partial')),
+        'retries': sum(max(0, (r.get('attempts') or 1) - 1) for r in records),
+        'duration_p50': percentile(durations, 0.5),
+        'duration_p95': percentile(durations, 0.95),
+        'first_byte_p50': percentile(first_bytes, 0.5),
+        'first_byte_p95': percentile(first_bytes, 0.95),
+        'prompt_tokens': prompt_tokens,
+        'output_tokens': output_tokens,
+        'cost': round(cost, 4) if cost is not None else None,
+    }
+
+
+def build_report(records, period, prices):
+    by_model = {}
+    for record in records:
+        by_model.setdefault(record.get('model') or 'unknown', []).append(record)
+    report = {}
+    for model in sorted(by_model):
+        model_records = by_model[model]
+        reasons = {}
+        trend = {}
+        for record in model_records:
+            reasons[record.get('reason')] = reasons.get(record.get('reason'), 0) + 1
+            trend.setdefault(period_of(record['_time'], period), []).append(record)
+        report[model] = {
+            'total': summarize(model_records, prices),
+            'reasons': reasons,
+            'trend': {key: summarize(trend[key], prices) for key in sorted(trend)},
+        }
+    return report
+
+
+def seconds(value):
+    return '-' if value is None else f"{value:.0f}s" if value >= 10 else f"{value:.1f}s"
+
+
+def tokens(value):
+    return f"{value / 1000:,.0f}k" if value >= 10000 else f"{value:,}"
+
+
+def money(value):
+    return '-' if value is None else f"${value:,.2f}"
+
+
+def table_rows(report):
+    """(title, header, rows) per model for text and Markdown output."""
+    header = ['', 'Runs', 'OK', 'Retries', 'p50', 'p95', 'TTFB p50', 'TTFB p95',
+              'Prompt-Tokens', 'Output-Tokens', 'Kosten']
+    for model, data in report.items():
+        rows = []
+        for label, stats in [('Gesamt', data['total'])] + list(data['trend'].items()):
+            rows.append([label, str(stats['runs']), f"{stats['succeeded']}/{stats['runs']}", str(stats['retries']),
+                         seconds(stats['duration_p50']), seconds(stats['duration_p95']),
+                         seconds(stats['first_byte_p50']), seconds(stats['first_byte_p95']),
+                         tokens(stats['prompt_tokens']), tokens(stats['output_tokens']), money(stats['cost'])])
+        reasons = ', '.join(f"{reason}: {count}" for reason, count in
+                            sorted(data['reasons'].items(), key=lambda item: -item[1]))
+        yield f"{model} ({reasons})", header, rows
+
+
+def print_text(report):
+    for title, header, rows in table_rows(report):
+        widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+        print(f"🤖 {title}")
+        for row in [header] + rows:
+            print('  ' + '  '.join(cell.ljust(widths[i]) if i == 0 else cell.rjust(widths[i])
+                                   for i, cell in enumerate(row)))
+        print("")
+
+
+def print_markdown(report, period):
+    print(f"## 📈 AI Review Telemetrie (pro {'Tag' if period == 'day' else 'Woche'})")
+    print("")
+    for title, header, rows in table_rows(report):
+        print(f"### {title}")
+        print("")
+        print('| ' + ' | '.join(header) + ' |')
+        print('|' + '|'.join(['---'] + ['---:'] * (len(header) - 1)) + '|')
+        for row in rows:
+            print('| ' + ' | '.join(row) + ' |')
+        print("")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Aggregate the AI review run telemetry')
+    parser.add_argument('--metrics-file', default=os.environ.get('AI_REVIEW_METRICS_FILE', DEFAULT_METRICS_FILE),
+                        help=f'Telemetry ledger (default: AI_REVIEW_METRICS_FILE or {DEFAULT_METRICS_FILE})')
+    parser.add_argument('--period', choices=['day', 'week'], default='week', help='Trend granularity (default: week)')
+    parser.add_argument('--since', type=int, default=None, help='Only runs of the last N days')
+    parser.add_argument('--model', default=None, help='Only this model')
+    parser.add_argument('--price', action='append', default=[],
+                        help='USD per million tokens, MODEL=INPUT:OUTPUT (`*` for all models); repeatable')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--markdown', action='store_true', help='Markdown tables (e.g. for $GITHUB_STEP_SUMMARY)')
+    output.add_argument('--json', action='store_true', help='Report as JSON')
+    args = parser.parse_args()
+
+    try:
+        prices = parse_prices(args.price)
+        since = datetime.now(timezone.utc) - timedelta(days=args.since) if args.since else None
+        records, skipped = load_records(args.metrics_file, since)
+    except FileNotFoundError:
+        print(f"⚠️ No telemetry yet: {args.metrics_file} not found", file=sys.stderr)
+        sys.exit(0)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.model:
+        records = [record for record in records if record.get('model') == args.model]
+    if skipped:
+        print(f"⚠️ Skipped {skipped} unreadable line(s) in {args.metrics_file}", file=sys.stderr)
+    if not records:
+        print("⚠️ No matching runs in the telemetry ledger", file=sys.stderr)
+        sys.exit(0)
+
+    report = build_report(records, args.period, prices)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    elif args.markdown:
+        print_markdown(report, args.period)
+    else:
+        print(f"📊 {len(records)} runs from {args.metrics_file}\n")
+        print_text(report)
+
+
+if __name__ == '__main__':
+    main()
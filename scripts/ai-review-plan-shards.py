@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Plan review shards under a token budget.
+
+Estimates the prompt tokens of every file from its byte and line count
+(bytes / --chars-per-token plus a small per-line and per-file overhead) and
+packs the files into shards of at most --token-budget tokens using first-fit
+decreasing. Files of the same directory are packed as one unit so the agent
+sees related code together; a directory that does not fit into one shard is
+split into as few pieces as possible. Shards never mix Clean Architecture
+layers (see layer_of()).
+
+Byte/line counts are cached in --cache, keyed by the git blob SHA of clean
+tracked files (stable across fresh CI checkouts) or else by size and mtime, so
+only changed files are read again.
+
+The plan (JSON) is consumed by ai-review-sharded.py (--plan):
+
+    {
+      "version": 1, "token_budget": 60000, "chars_per_token": 4.0, "total_tokens": 123456,
+      "shards": [
+        {"id": "001-domain", "group": "domain", "tokens": 59000, "bytes": 230000, "lines": 6100,
+         "directories": ["src/domain/entities"], "files": ["src/domain/entities/a.ts"]}
+      ]
+    }
+
+Usage:
+    python scripts/ai-review-plan-shards.py --files files_to_analyze.txt --output /tmp/ai-review-plan.json
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PLAN_VERSION = 1
+
+DEFAULT_TOKEN_BUDGET = 60000
+# Same ratio as the prompt size estimate in ai-review-run-cursor.py
+DEFAULT_CHARS_PER_TOKEN = 4.0
+# Indentation/newline tokens the byte ratio does not cover, and the list entry per file
+TOKENS_PER_LINE = 0.5
+TOKENS_PER_FILE = 16
+
+DEFAULT_CACHE = '.ai-review-cache/file-stats.json'
+
+# Clean Architecture layers in review order; other directories follow alphabetically
+LAYERS = ['domain', 'application', 'infrastructure', 'framework']
+
+
+def layer_of(path):
+    """Group of a file: the layer below src/ (e.g. 'domain'), otherwise the top-level directory."""
+    parts = Path(path).parts
+    if len(parts) > 2 and parts[0] == 'src':
+        return parts[1]
+    return parts[0] if len(parts) > 1 else '.'
+
+
+def group_order(group):
+    return (LAYERS.index(group), '') if group in LAYERS else (len(LAYERS), group)
+
+
+def git_blob_ids():
+    """Blob SHA per tracked file whose worktree content matches the index ({} outside git)."""
+    try:
+        staged = subprocess.run(['git', 'ls-files', '-s', '-z'], capture_output=True, check=True).stdout
+        dirty = subprocess.run(['git', 'status', '--porcelain', '-z', '--untracked-files=no'],
+                               capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+    blobs = {}
+    for record in staged.decode('utf-8', errors='replace').split('\0'):
+        if '\t' in record:
+            meta, path = record.split('\t', 1)
+            blobs[path] = meta.split()[1]
+    records = iter(dirty.decode('utf-8', errors='replace').split('\0'))
+    for record in records:
+        if len(record) > 3:
+            # Second status column: worktree differs from the index (staged-only changes keep their blob)
+            if record[1] != ' ':
+                blobs.pop(record[3:], None)
+            # Renames/copies are followed by the original path as a field of its own
+            if 'R' in record[:2] or 'C' in record[:2]:
+                next(records, None)
+    return blobs
+
+
+class FileStatsCache:
+    """Byte/line counts per file, reused while the file content is unchanged."""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.entries = {}
+        self.blobs = git_blob_ids() if path else {}
+        self.hits = 0
+        self.misses = 0
+        if self.path and self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding='utf-8')).get('files', {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def stats(self, path):
+        """Returns {'bytes', 'lines'}; missing files count as empty."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return {'bytes': 0, 'lines': 0}
+        key = f"blob:{self.blobs[path]}" if path in self.blobs else f"stat:{st.st_size}:{st.st_mtime_ns}"
+        cached = self.entries.get(path)
+        if cached and cached.get('key') == key:
+            self.hits += 1
+            return {'bytes': cached['bytes'], 'lines': cached['lines']}
+
+        self.misses += 1
+        lines = 0
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                lines += chunk.count(b'\n')
+        if st.st_size and lines == 0:
+            lines = 1
+        self.entries[path] = {'key': key, 'bytes': st.st_size, 'lines': lines}
+        return {'bytes': st.st_size, 'lines': lines}
+
+    def save(self):
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'files': self.entries}, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+
+def estimate_tokens(file_bytes, lines, chars_per_token=DEFAULT_CHARS_PER_TOKEN):
+    return math.ceil(file_bytes / chars_per_token + lines * TOKENS_PER_LINE) + TOKENS_PER_FILE
+
+
+def first_fit_decreasing(units, budget):
+    """Packs units ({'tokens', ...}) into bins of at most `budget` tokens.
+
+    Oversized units get a bin of their own. Returns a list of unit lists.
+    """
+    bins = []
+    for unit in sorted(units, key=lambda u: (-u['tokens'], u['files'][0]['path'])):
+        for packed in bins:
+            if packed['tokens'] + unit['tokens'] <= budget:
+                packed['units'].append(unit)
+                packed['tokens'] += unit['tokens']
+                break
+        else:
+            bins.append({'tokens': unit['tokens'], 'units': [unit]})
+    return [packed['units'] for packed in bins]
+
+
+def directory_units(files, budget):
+    """Groups the files of one layer by directory; oversized directories are split with FFD."""
+    by_dir = {}
+    for entry in files:
+        by_dir.setdefault(os.path.dirname(entry['path']), []).append(entry)
+
+    units = []
+    for directory in sorted(by_dir):
+        entries = by_dir[directory]
+        total = sum(entry['tokens'] for entry in entries)
+        if total <= budget:
+            units.append({'directory': directory, 'files': entries, 'tokens': total})
+            continue
+        single = [{'directory': directory, 'files': [entry], 'tokens': entry['tokens']} for entry in entries]
+        for packed in first_fit_decreasing(single, budget):
+            units.append({
+                'directory': directory,
+                'files': [unit['files'][0] for unit in packed],
+                'tokens': sum(unit['tokens'] for unit in packed),
+            })
+    return units
+
+
+def build_plan(files, token_budget=DEFAULT_TOKEN_BUDGET, chars_per_token=DEFAULT_CHARS_PER_TOKEN, cache=None):
+    """Creates the shard plan for the given file list (see module docstring)."""
+    cache = cache or FileStatsCache()
+    groups = {}
+    for path in sorted(set(files)):
+        stats = cache.stats(path)
+        groups.setdefault(layer_of(path), []).append({
+            'path': path,
+            'bytes': stats['bytes'],
+            'lines': stats['lines'],
+            'tokens': estimate_tokens(stats['bytes'], stats['lines'], chars_per_token),
+        })
+
+    shards = []
+    for group in sorted(groups, key=group_order):
+        packed_bins = first_fit_decreasing(directory_units(groups[group], token_budget), token_budget)
+        for units in packed_bins:
+            entries = sorted((entry for unit in units for entry in unit['files']), key=lambda e: e['path'])
+            shards.append({
+                'group': group,
+                'tokens': sum(entry['tokens'] for entry in entries),
+                'bytes': sum(entry['bytes'] for entry in entries),
+                'lines': sum(entry['lines'] for entry in entries),
+                'directories': sorted({unit['directory'] for unit in units}),
+                'files': [entry['path'] for entry in entries],
+            })
+
+    for index, shard in enumerate(shards, start=1):
+        shard['id'] = f"{index:03d}-{shard['group']}"
+        shard['oversized'] = shard['tokens'] > token_budget
+    return {
+        'version': PLAN_VERSION,
+        'token_budget': token_budget,
+        'chars_per_token': chars_per_token,
+        'total_tokens': sum(shard['tokens'] for shard in shards),
+        'shards': shards,
+    }
+
+
+def read_file_list(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def load_plan(path):
+    """Reads a plan written by this script."""
+    plan = json.loads(Path(path).read_text(encoding='utf-8'))
+    if plan.get('version') != PLAN_VERSION:
+        raise ValueError(f"Unsupported shard plan version: {plan.get('version')}")
+    return plan
+
+
+def format_overview(plan):
+    """Markdown overview of a plan per layer (for the single-run prompt)."""
+    groups = {}
+    for shard in plan['shards']:
+        group = groups.setdefault(shard['group'], {'files': 0, 'tokens': 0, 'directories': set()})
+        group['files'] += len(shard['files'])
+        group['tokens'] += shard['tokens']
+        group['directories'].update(shard['directories'])
+    lines = []
+    for name in sorted(groups, key=group_order):
+        group = groups[name]
+        lines.append(f"- **{name}**: {group['files']} Dateien in {len(group['directories'])} "
+                     f"Verzeichnissen (~{group['tokens']:,} Tokens)")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Plan review shards under a token budget')
+    parser.add_argument('--files', default='files_to_analyze.txt', help='File list, one path per line')
+    parser.add_argument('--output', help='Shard plan (JSON)')
+    parser.add_argument('--token-budget', type=int, default=DEFAULT_TOKEN_BUDGET,
+                        help=f'Estimated prompt tokens per shard (default: {DEFAULT_TOKEN_BUDGET})')
+    parser.add_argument('--chars-per-token', type=float, default=DEFAULT_CHARS_PER_TOKEN,
+                        help=f'Tokenizer ratio, bytes per token (default: {DEFAULT_CHARS_PER_TOKEN})')
+    parser.add_argument('--cache', default=DEFAULT_CACHE, help=f'Byte/line count cache (default: {DEFAULT_CACHE})')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the cache')
+    parser.add_argument('--overview', metavar='PLAN', help='Print a Markdown overview of an existing plan and exit')
+    args = parser.parse_args()
+
+    if args.overview:
+        try:
+            print(format_overview(load_plan(args.overview)))
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    if not args.output:
+        parser.error('--output is required')
+
+    try:
+        files = read_file_list(args.files)
+    except OSError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.token_budget <= 0 or args.chars_per_token <= 0:
+        print("❌ Error: --token-budget and --chars-per-token must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    cache = FileStatsCache(None if args.no_cache else args.cache)
+    plan = build_plan(files, args.token_budget, args.chars_per_token, cache)
+    cache.save()
+
+    Path(args.output).write_text(json.dumps(plan, indent=2), encoding='utf-8')
+    sizes = [shard['tokens'] for shard in plan['shards']]
+    oversized = sum(1 for shard in plan['shards'] if shard['oversized'])
+    print(f"🧩 {len(files)} files, ~{plan['total_tokens']:,} tokens -> {len(sizes)} shards "
+          f"(budget {args.token_budget:,}, largest ~{max(sizes, default=0):,}, smallest ~{min(sizes, default=0):,})")
+    print(f"   Cache: {cache.hits} hits, {cache.misses} misses")
+    if oversized:
+        print(f"⚠️ {oversized} shard(s) exceed the budget (single files larger than the budget)")
+    print(f"✅ Plan written to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,20 +1,739 @@
 #!/usr/bin/env python3
 """
 Run Cursor AI analysis with large prompt support.
-Avoids "Argument list too long" errors by using Python subprocess instead of shell timeout.
+
+The prompt reaches cursor-agent through a pluggable transport (see PromptTransport):
+as an argv element while it fits, otherwise through stdin, a temp file the agent
+reads itself, or a chunked multi-turn session. Prompt size is then limited by the
+model context (--max-prompt-tokens) instead of the OS argument limits.
+
+Each attempt runs the agent once; its stdout is streamed into --output-file while it arrives.
+With --stop-on-complete the agent is stopped as soon as a complete TOON/JSON
+document has been received. A watchdog kills a silent agent early
+(--first-byte-timeout, --idle-timeout) instead of waiting for --timeout.
+
+Failed runs are classified from the exit code and stderr (timeout, rate limit,
+auth, network, crash); transient failures are retried up to --retries times
+with jittered exponential backoff within the --timeout budget. If the last
+attempt still fails, the largest partial output of all attempts is left in
+--output-file so the extractors can keep the complete issues already emitted.
+--status-file records the final reason and every attempt.
+
+With --metrics-file (or AI_REVIEW_METRICS_FILE) one JSON line per run is
+appended to a telemetry ledger (model, prompt size, time to first byte,
+duration, output size, exit reason, shard); ai-review-metrics.py aggregates it.
 """
 
 import subprocess
 import sys
 import os
 import argparse
+import codecs
+import json
+import random
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+# Rough token estimate used for all limit checks (bytes per token)
+CHARS_PER_TOKEN = 4
+DEFAULT_MAX_PROMPT_TOKENS = 200000
+
+# Streaming of the agent output (bytes per read, seconds between flushes)
+READ_CHUNK_BYTES = 64 * 1024
+FLUSH_INTERVAL = 2.0
+# Only the beginning of stderr is kept for error messages
+STDERR_KEEP_BYTES = 64 * 1024
+# Grace period for the agent after an early stop before it is killed
+TERMINATE_GRACE = 5
+
+# Exit reasons in the status file after which a retry makes sense
+RETRYABLE_REASONS = ('first_byte_timeout', 'idle_timeout', 'rate_limit', 'network', 'crash')
+# Exit reasons of a successful run
+SUCCESS_REASONS = ('completed', 'complete_document')
+
+# Stderr patterns of failed runs, checked in this order
+FAILURE_PATTERNS = [
+    ('rate_limit', re.compile(r'\b429\b|rate[ _-]?limit|too many requests|quota|overloaded|resource[ _]exhausted',
+                              re.IGNORECASE)),
+    ('auth', re.compile(r'\b40[13]\b|unauthori[sz]ed|forbidden|invalid api key|authenticat|not logged in|'
+                        r'log ?in required', re.IGNORECASE)),
+    ('network', re.compile(r'\b50[234]\b|bad gateway|service unavailable|gateway timeout|ECONNRESET|ECONNREFUSED|'
+                           r'ETIMEDOUT|EAI_AGAIN|ENOTFOUND|socket hang up|network error|connection (?:reset|refused)',
+                           re.IGNORECASE)),
+]
+# Server hint for rate limits, e.g. "Retry-After: 30" or "retry after 30s"
+RETRY_AFTER = re.compile(r'retry[ _-]?after\W{0,3}(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+# Backoff between attempts (seconds): base * 2^(attempt-1), capped, with jitter
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF_BASE = 15.0
+DEFAULT_BACKOFF_MAX = 120.0
+# A retry is only started if at least this much of the --timeout budget is left
+MIN_RETRY_BUDGET = 60
+
+# Instruction passed via argv when the prompt itself is delivered as a file
+FILE_PROMPT_INSTRUCTION = (
+    "Your complete task is in the file {path} (UTF-8 Markdown). "
+    "Read the whole file first and follow its instructions exactly, "
+    "including the required output format."
+)
+
+
+class PromptTooLargeError(Exception):
+    """Raised by a transport when the prompt exceeds its limit."""
+
+
+def max_arg_bytes():
+    """Largest prompt that can safely be passed as a single argv element.
+
+    Linux caps every single argument at MAX_ARG_STRLEN (32 pages, usually 128 KB)
+    in addition to the total ARG_MAX budget shared with the environment. Windows
+    limits the whole command line to 32767 characters.
+    """
+    if sys.platform == "win32":
+        return 32 * 1024 - 1024
+    try:
+        arg_max = os.sysconf('SC_ARG_MAX')
+        page_size = os.sysconf('SC_PAGE_SIZE')
+    except (ValueError, OSError, AttributeError):
+        return 128 * 1024
+    env_bytes = sum(len(k) + len(v) + 2 for k, v in os.environ.items())
+    limit = arg_max - env_bytes - 4096
+    if sys.platform.startswith('linux'):
+        limit = min(limit, 32 * page_size - 1)
+    return limit
+
+
+class PromptTransport:
+    """How the prompt is delivered to cursor-agent.
+
+    A transport owns the size checks and turns a prompt into one or more
+    invocations ({'args': [...], 'stdin': str or None, 'capture': bool}). Only
+    the output of invocations with capture=True is the analysis result.
+    """
+
+    name = None
+
+    def __init__(self, max_prompt_tokens=DEFAULT_MAX_PROMPT_TOKENS):
+        self.max_prompt_tokens = max_prompt_tokens
+
+    def max_prompt_bytes(self):
+        return self.max_prompt_tokens * CHARS_PER_TOKEN
+
+    def check(self, prompt_bytes):
+        limit = self.max_prompt_bytes()
+        if prompt_bytes > limit:
+            raise PromptTooLargeError(
+                f"Prompt too large for transport '{self.name}' "
+                f"({prompt_bytes:,} bytes, limit {limit:,} bytes)"
+            )
+
+    def invocations(self, agent, model, prompt):
+        raise NotImplementedError
+
+    def cleanup(self):
+        pass
+
+
+class ArgvTransport(PromptTransport):
+    """Prompt as `-p <prompt>` argument (original behaviour, limited by the OS)."""
+
+    name = 'argv'
+
+    def max_prompt_bytes(self):
+        return min(super().max_prompt_bytes(), max_arg_bytes())
+
+    def invocations(self, agent, model, prompt):
+        return [{'args': [agent, '--model', model, '-p', prompt], 'stdin': None, 'capture': True}]
+
+
+class StdinTransport(PromptTransport):
+    """Prompt on stdin of `cursor-agent -p` (for agent versions that read stdin)."""
+
+    name = 'stdin'
+
+    def invocations(self, agent, model, prompt):
+        return [{'args': [agent, '--model', model, '-p'], 'stdin': prompt, 'capture': True}]
+
+
+class FileTransport(PromptTransport):
+    """Prompt in a temp file inside the workspace; argv only carries a short instruction."""
+
+    name = 'file'
+
+    def __init__(self, max_prompt_tokens=DEFAULT_MAX_PROMPT_TOKENS, directory=None):
+        super().__init__(max_prompt_tokens)
+        self.directory = directory or os.getcwd()
+        self.path = None
+
+    def invocations(self, agent, model, prompt):
+        fd, self.path = tempfile.mkstemp(prefix='.ai-review-prompt-', suffix='.md', dir=self.directory)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(prompt)
+        instruction = FILE_PROMPT_INSTRUCTION.format(path=self.path)
+        return [{'args': [agent, '--model', model, '-p', instruction], 'stdin': None, 'capture': True}]
+
+    def cleanup(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+        self.path = None
+
+
+class ChunkedTransport(PromptTransport):
+    """Prompt split over several turns of one chat (`create-chat` + `--resume`).
+
+    Every chunk fits into a single argv element; only the answer to the last
+    chunk is captured.
+    """
+
+    name = 'chunked'
+
+    # Room for the part header around each chunk
+    CHUNK_OVERHEAD = 512
+
+    def chunk_bytes(self):
+        return max_arg_bytes() - self.CHUNK_OVERHEAD
+
+    def split(self, prompt):
+        """Splits the prompt on line boundaries into UTF-8 chunks of at most chunk_bytes()."""
+        limit = self.chunk_bytes()
+        chunks, current, size = [], [], 0
+        for line in prompt.splitlines(keepends=True):
+            encoded = len(line.encode('utf-8'))
+            while encoded > limit:
+                # Single overlong line: cut it hard (on character boundaries)
+                head = line.encode('utf-8')[:limit].decode('utf-8', errors='ignore')
+                if current:
+                    chunks.append(''.join(current))
+                    current, size = [], 0
+                chunks.append(head)
+                line = line[len(head):]
+                encoded = len(line.encode('utf-8'))
+            if size + encoded > limit and current:
+                chunks.append(''.join(current))
+                current, size = [], 0
+            current.append(line)
+            size += encoded
+        if current:
+            chunks.append(''.join(current))
+        return chunks
+
+    def invocations(self, agent, model, prompt):
+        result = subprocess.run([agent, 'create-chat'], capture_output=True, text=True, timeout=60)
+        chat_id = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ''
+        if result.returncode != 0 or not chat_id:
+            raise RuntimeError(f"cursor-agent create-chat failed: {result.stderr.strip()[:300]}")
+
+        chunks = self.split(prompt)
+        total = len(chunks)
+        print(f"📦 Sending prompt in {total} parts (chat {chat_id})")
+        invocations = []
+        for index, chunk in enumerate(chunks, start=1):
+            if index < total:
+                header = (f"Part {index}/{total} of a long task. Do not start working yet "
+                          f"and reply only with OK.\n\n---\n")
+            else:
+                header = (f"Part {total}/{total}. The task is now complete: follow the "
+                          f"instructions from all parts.\n\n---\n")
+            invocations.append({
+                'args': [agent, '--model', model, '--resume', chat_id, '-p', header + chunk],
+                'stdin': None,
+                'capture': index == total,
+            })
+        return invocations
+
+
+TRANSPORTS = {
+    'argv': ArgvTransport,
+    'stdin': StdinTransport,
+    'file': FileTransport,
+    'chunked': ChunkedTransport,
+}
+
+
+def select_transport(name, prompt_bytes, max_prompt_tokens=DEFAULT_MAX_PROMPT_TOKENS):
+    """Returns the transport for `name`; 'auto' uses argv while the prompt fits, else a temp file."""
+    if name == 'auto':
+        argv = ArgvTransport(max_prompt_tokens)
+        if prompt_bytes <= argv.max_prompt_bytes():
+            return argv
+        return FileTransport(max_prompt_tokens)
+    return TRANSPORTS[name](max_prompt_tokens)
+
+
+# Top-level TOON header: key:, key{fields}:, key[N]{fields}:
+TOON_HEADER = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)(?:\[(\d+)\])?(?:\{([^}]*)\})?:$')
+TOON_FIELD = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)(?:\[\d*\])?:(.*)$')
+TOON_TOTAL_ISSUES = re.compile(r'^total_issues:\s*(\d+)\s*$')
+
+
+class DocumentDetector:
+    """Recognises the end of a complete analysis document in the streamed output.
+
+    JSON is complete when its outermost object closes and the buffered text parses
+    as an object with "issues"; balanced chatter such as `[1/3] analysing...` is
+    skipped. TOON is complete when `summary.total_issues` has been read and the
+    last declared field has been seen for that many `issues` items, written either
+    as one `issues[N]{fields}:` header or as per-item headers `issues[i]{fields}:`.
+    A last field opening a nested block (`references[2]:` plus list lines) counts
+    once the block ends. Without a positive total_issues the agent is never stopped
+    early. Leading chatter and Markdown fences before the document are ignored.
+    """
+
+    # Upper bound for an unfinished line kept between chunks
+    MAX_PENDING = 64 * 1024
+
+    def __init__(self):
+        self.mode = None
+        self.pending = ''
+        self.complete = False
+        # JSON state
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.buffer = []
+        # TOON state
+        self.section = None
+        self.total = None
+        self.last_field = None
+        self.field_indent = None
+        self.open_block = None
+        self.items = 0
+
+    def feed(self, text):
+        """Consumes the next piece of output; returns True once the document is complete."""
+        if self.complete:
+            return True
+        self.pending += text
+        while not self.complete:
+            if self.mode == 'json':
+                self.pending = self._feed_json(self.pending)
+                if self.mode == 'json' or not self.pending:
+                    break
+                continue
+            newline = self.pending.find('\n')
+            if newline < 0:
+                break
+            line, self.pending = self.pending[:newline], self.pending[newline + 1:]
+            self._feed_line(line.rstrip('\r'))
+        if self.mode != 'json' and len(self.pending) > self.MAX_PENDING:
+            self.pending = ''
+        return self.complete
+
+    def _feed_line(self, line):
+        if self.mode is None:
+            stripped = line.strip()
+            if stripped.startswith(('{', '[')):
+                # Candidate JSON document, replayed through _feed_json by feed()
+                self.mode = 'json'
+                self.pending = line + '\n' + self.pending
+                return
+            if line != stripped or not TOON_HEADER.match(stripped):
+                return
+            self.mode = 'toon'
+        self._feed_toon(line)
+
+    def _feed_toon(self, line):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            return
+        indent = len(line) - len(line.lstrip())
+        if self.open_block is not None:
+            if indent > self.open_block:
+                return
+            self.open_block = None
+            self._item_done()
+            if self.complete:
+                return
+        if indent == 0:
+            header = TOON_HEADER.match(stripped)
+            if header:
+                key, _, fields = header.groups()
+                self.section = key
+                if key == 'issues':
+                    # Per-item headers (issues[i]{...}:) repeat the fields of the array
+                    self.last_field = fields.split(',')[-1].strip() if fields else None
+                    self.field_indent = None
+            return
+        if self.section == 'summary':
+            total = TOON_TOTAL_ISSUES.match(stripped)
+            if total and self.total is None:
+                self.total = int(total.group(1))
+        elif self.section == 'issues' and self.last_field:
+            if self.field_indent is None:
+                self.field_indent = indent
+            field = TOON_FIELD.match(stripped) if indent == self.field_indent else None
+            if field and field.group(1) == self.last_field:
+                if field.group(2).strip():
+                    self._item_done()
+                else:
+                    self.open_block = indent
+
+    def _item_done(self):
+        self.items += 1
+        if self.total and self.items >= self.total:
+            self.complete = True
+
+    def _feed_json(self, text):
+        """Scans `text`; returns the text after a rejected candidate (else '')."""
+        for index, char in enumerate(text):
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in '{[':
+                self.depth += 1
+            elif char in '}]':
+                self.depth -= 1
+                if self.depth <= 0:
+                    candidate = ''.join(self.buffer) + text[:index + 1]
+                    self.buffer = []
+                    self.depth = 0
+                    try:
+                        document = json.loads(candidate)
+                    except ValueError:
+                        document = None
+                    if isinstance(document, dict) and 'issues' in document:
+                        self.complete = True
+                        return ''
+                    self.mode = None
+                    return text[index + 1:]
+        self.buffer.append(text)
+        return ''
+
+
+class StallWatchdog:
+    """Kills the agent when its output stalls instead of waiting for the flat timeout.
+
+    Three limits in seconds (0 = off): `first_byte` until the first output of the
+    invocation, `idle` since the last output, and the total `deadline` shared by
+    all invocations (time.monotonic() value). Progress (bytes per interval, age of
+    the last complete line) is logged every PROGRESS_INTERVAL seconds.
+    """
+
+    POLL_INTERVAL = 1.0
+    PROGRESS_INTERVAL = 60.0
+
+    def __init__(self, deadline, first_byte=0, idle=0):
+        self.deadline = deadline
+        self.first_byte = first_byte
+        self.idle = idle
+        self.started = time.monotonic()
+        self.first_output = None
+        self.last_output = None
+        self.last_line = None
+        self.interval_bytes = 0
+        self.reason = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def activity(self, data):
+        """Records output of the agent (stdout or stderr)."""
+        now = time.monotonic()
+        if self.first_output is None:
+            self.first_output = now
+        self.last_output = now
+        self.interval_bytes += len(data)
+        if b'\n' in data:
+            self.last_line = now
+
+    def check(self, now):
+        """Returns the exit reason if a limit is exceeded, else None."""
+        if now >= self.deadline:
+            return 'timeout'
+        if self.first_output is None:
+            if self.first_byte and now - self.started >= self.first_byte:
+                return 'first_byte_timeout'
+        elif self.idle and now - self.last_output >= self.idle:
+            return 'idle_timeout'
+        return None
+
+    def start(self, proc):
+        def watch():
+            last_report = time.monotonic()
+            while not self._stop.wait(self.POLL_INTERVAL):
+                now = time.monotonic()
+                reason = self.check(now)
+                if reason:
+                    self.reason = reason
+                    proc.kill()
+                    return
+                if now - last_report >= self.PROGRESS_INTERVAL:
+                    line_age = f"{now - self.last_line:.0f}s ago" if self.last_line else "none yet"
+                    print(f"⏳ {now - self.started:.0f}s: {self.interval_bytes:,} bytes in the last "
+                          f"{now - last_report:.0f}s, last line {line_age}", flush=True)
+                    self.interval_bytes = 0
+                    last_report = now
+
+        self._thread = threading.Thread(target=watch, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self):
+        """Timing figures for the status file (seconds, None if not applicable)."""
+        now = time.monotonic()
+        return {
+            'first_byte_seconds': round(self.first_output - self.started, 3) if self.first_output else None,
+            'last_output_age': round(now - self.last_output, 3) if self.last_output else None,
+            'last_line_age': round(now - self.last_line, 3) if self.last_line else None,
+        }
+
+
+def stream_invocation(invocation, output_path, watchdog, detector=None):
+    """Runs one cursor-agent invocation and streams its stdout into output_path.
+
+    Output is written as it arrives and flushed every FLUSH_INTERVAL seconds, so
+    memory use stays flat and partial results survive a timeout. The watchdog
+    kills a stalled agent; with a detector the agent is stopped as soon as a
+    complete document has been received.
+
+    Returns:
+        dict: {'exit_code', 'stderr', 'output_bytes', 'timeout_reason', 'stopped_early'}
+    """
+    proc = subprocess.Popen(
+        invocation['args'],
+        stdin=subprocess.PIPE if invocation['stdin'] is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    result = {'exit_code': None, 'stderr': '', 'output_bytes': 0,
+              'timeout_reason': None, 'stopped_early': False}
+    stderr_chunks = []
+
+    def drain_stderr():
+        kept = 0
+        for chunk in iter(lambda: proc.stderr.read1(READ_CHUNK_BYTES), b''):
+            watchdog.activity(chunk)
+            if kept < STDERR_KEEP_BYTES:
+                stderr_chunks.append(chunk)
+                kept += len(chunk)
+
+    def write_stdin():
+        try:
+            proc.stdin.write(invocation['stdin'].encode('utf-8'))
+            proc.stdin.close()
+        except OSError:
+            pass  # Agent exited before reading the whole prompt
+
+    helpers = [threading.Thread(target=drain_stderr, daemon=True)]
+    if invocation['stdin'] is not None:
+        helpers.append(threading.Thread(target=write_stdin, daemon=True))
+    for helper in helpers:
+        helper.start()
+    watchdog.start(proc)
+
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    try:
+        with open(output_path, 'w', encoding='utf-8', newline='') as output:
+            last_flush = time.monotonic()
+            for chunk in iter(lambda: proc.stdout.read1(READ_CHUNK_BYTES), b''):
+                watchdog.activity(chunk)
+                text = decoder.decode(chunk)
+                output.write(text)
+                result['output_bytes'] += len(chunk)
+                if time.monotonic() - last_flush >= FLUSH_INTERVAL:
+                    output.flush()
+                    last_flush = time.monotonic()
+                if detector is not None and detector.feed(text):
+                    result['stopped_early'] = True
+                    break
+            output.write(decoder.decode(b'', final=True))
+
+        if result['stopped_early']:
+            proc.terminate()
+            try:
+                proc.wait(timeout=TERMINATE_GRACE)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        exit_code = proc.wait()
+    finally:
+        watchdog.stop()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        for helper in helpers:
+            helper.join(timeout=TERMINATE_GRACE)
+
+    result['timeout_reason'] = watchdog.reason
+    if watchdog.reason:
+        exit_code = 124
+    elif result['stopped_early']:
+        exit_code = 0
+    result['exit_code'] = exit_code
+    result['stderr'] = b''.join(stderr_chunks).decode('utf-8', errors='replace')
+    return result
+
+
+def classify_failure(result):
+    """Exit reason of a finished invocation.
+
+    Watchdog timeouts keep their own reason. Non-zero exits are classified from
+    stderr (FAILURE_PATTERNS); an agent killed by a signal counts as 'crash',
+    anything else as 'agent_error'.
+    """
+    if result['timeout_reason']:
+        return result['timeout_reason']
+    exit_code = result['exit_code']
+    if exit_code == 0:
+        return 'complete_document' if result['stopped_early'] else 'completed'
+    for reason, pattern in FAILURE_PATTERNS:
+        if pattern.search(result['stderr']):
+            return reason
+    if exit_code < 0 or 128 < exit_code < 160:
+        return 'crash'
+    return 'agent_error'
+
+
+def retry_after_seconds(stderr):
+    """Retry-After hint of the server in stderr, or None."""
+    match = RETRY_AFTER.search(stderr or '')
+    return float(match.group(1)) if match else None
+
+
+def backoff_delay(attempt, base=DEFAULT_BACKOFF_BASE, cap=DEFAULT_BACKOFF_MAX, retry_after=None, rng=random):
+    """Seconds to wait after failed attempt `attempt` (1-based).
+
+    Exponential backoff with equal jitter (half fixed, half random), so parallel
+    runs (shards) do not retry in lockstep. A Retry-After hint is honoured up to cap.
+    """
+    ceiling = min(cap, base * 2 ** (attempt - 1))
+    delay = ceiling / 2 + rng.uniform(0, ceiling / 2)
+    if retry_after:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+def run_attempt(transport, agent, model, prompt, args, deadline):
+    """Runs all invocations of the transport once (one attempt).
+
+    Returns:
+        dict: {'reason', 'exit_code', 'result', 'watchdog', 'invocations', 'stderr'}
+    """
+    attempt = {'reason': 'error', 'exit_code': 1, 'result': None, 'watchdog': None,
+               'invocations': 0, 'stderr': ''}
+    try:
+        for invocation in transport.invocations(agent, model, prompt):
+            attempt['invocations'] += 1
+            # Every invocation streams into the output file; the captured (last) one remains
+            watchdog = StallWatchdog(deadline, args.first_byte_timeout, args.idle_timeout)
+            detector = DocumentDetector() if args.stop_on_complete and invocation['capture'] else None
+            result = stream_invocation(invocation, args.output_file, watchdog, detector)
+            attempt.update(result=result, watchdog=watchdog, exit_code=result['exit_code'],
+                           stderr=result['stderr'], reason=classify_failure(result))
+
+            if result['timeout_reason'] == 'timeout':
+                print(f"⏱️ Analysis timed out after {args.timeout} seconds", file=sys.stderr)
+            elif result['timeout_reason'] == 'first_byte_timeout':
+                print(f"⏱️ No output within {args.first_byte_timeout} seconds, agent killed", file=sys.stderr)
+            elif result['timeout_reason'] == 'idle_timeout':
+                print(f"⏱️ No output for {args.idle_timeout} seconds, agent killed", file=sys.stderr)
+            elif result['stopped_early']:
+                print("🏁 Complete analysis document received, agent stopped early")
+            # Print stderr if there were errors
+            stderr = result['stderr']
+            if stderr and (result['exit_code'] != 0 or 'error' in stderr.lower()):
+                print(f"⚠️ Stderr output: {stderr[:500]}", file=sys.stderr)
+            if result['exit_code'] != 0:
+                break
+    except OSError as e:
+        if e.errno == 7:  # Argument list too long
+            print(f"❌ Error: Prompt too large for system ({len(prompt.encode('utf-8')):,} bytes)", file=sys.stderr)
+            print("   Use --transport file or --transport stdin for large prompts.", file=sys.stderr)
+        else:
+            print(f"❌ OS Error during analysis: {e}", file=sys.stderr)
+        attempt.update(reason='error', exit_code=1)
+    except Exception as e:
+        print(f"❌ Error during analysis: {e}", file=sys.stderr)
+        attempt.update(reason='error', exit_code=1)
+    finally:
+        transport.cleanup()
+    return attempt
+
+
+def output_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def write_status(path, status):
+    """Writes the machine-readable run status (JSON) for the workflow."""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(status, f, indent=2)
+            f.write('\n')
+    except OSError as e:
+        print(f"⚠️ Could not write status file {path}: {e}", file=sys.stderr)
+
+
+def append_metrics(path, record):
+    """Appends one run record (a JSON line) to the telemetry ledger.
+
+    A single write per line in append mode, so parallel runners (shards) do not
+    interleave their records.
+    """
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, sort_keys=True) + '\n')
+    except OSError as e:
+        print(f"⚠️ Could not append metrics to {path}: {e}", file=sys.stderr)
+
+
+def exit_with_status(status_file, exit_code):
+    """Exits before the agent was started, still leaving a status file behind."""
+    if status_file:
+        write_status(status_file, {'reason': 'error', 'exit_code': exit_code, 'retryable': False})
+    sys.exit(exit_code)
+
 
 def main():
     parser = argparse.ArgumentParser(description='Run Cursor AI analysis')
     parser.add_argument('--prompt-file', required=True, help='Path to prompt file')
     parser.add_argument('--output-file', required=True, help='Path to output file')
     parser.add_argument('--model', default=None, help='AI model to use (default: from CURSOR_AI_MODEL env or sonnet-4.5)')
-    parser.add_argument('--timeout', type=int, default=1800, help='Timeout in seconds (default: 1800 = 30 minutes)')
+    parser.add_argument('--timeout', type=int, default=1800, help='Total runtime limit in seconds (default: 1800 = 30 minutes)')
+    parser.add_argument('--first-byte-timeout', type=int, default=0,
+                        help='Kill the agent if it produces no output within this many seconds (default: 0 = off)')
+    parser.add_argument('--idle-timeout', type=int, default=0,
+                        help='Kill the agent after this many seconds without new output (default: 0 = off)')
+    parser.add_argument('--status-file', default=None,
+                        help='Write the exit reason and timings as JSON to this file')
+    parser.add_argument('--transport', choices=['auto'] + sorted(TRANSPORTS), default='auto',
+                        help='How the prompt is passed to cursor-agent (default: auto = argv if it fits, else file)')
+    parser.add_argument('--max-prompt-tokens', type=int,
+                        default=int(os.environ.get('CURSOR_MAX_PROMPT_TOKENS', DEFAULT_MAX_PROMPT_TOKENS)),
+                        help=f'Model context budget for the prompt (default: {DEFAULT_MAX_PROMPT_TOKENS})')
+    parser.add_argument('--stop-on-complete', action='store_true',
+                        help='Stop the agent as soon as a complete TOON/JSON document has been received')
+    parser.add_argument('--metrics-file', default=os.environ.get('AI_REVIEW_METRICS_FILE'),
+                        help='Append a telemetry record (JSON line) per run to this file '
+                             '(default: AI_REVIEW_METRICS_FILE, unset = off)')
+    parser.add_argument('--shard-id', default=None, help='Shard of a sharded review (telemetry only)')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help=f'Retries after transient failures (timeout, rate limit, network, crash; '
+                             f'default: {DEFAULT_RETRIES})')
+    parser.add_argument('--backoff-base', type=float, default=DEFAULT_BACKOFF_BASE,
+                        help=f'Backoff before the first retry in seconds, doubled per retry '
+                             f'(default: {DEFAULT_BACKOFF_BASE:g})')
+    parser.add_argument('--backoff-max', type=float, default=DEFAULT_BACKOFF_MAX,
+                        help=f'Upper bound of the backoff in seconds (default: {DEFAULT_BACKOFF_MAX:g})')
 
     args = parser.parse_args()
 
@@ -26,7 +745,7 @@ def main():
     # Check if prompt file exists
     if not os.path.exists(args.prompt_file):
         print(f"❌ Error: Prompt file not found: {args.prompt_file}", file=sys.stderr)
-        sys.exit(1)
+        exit_with_status(args.status_file, 1)
 
     # Read prompt from file
     try:
@@ -37,15 +756,13 @@ def main():
         print(f"Prompt size: {prompt_size} bytes")
     except Exception as e:
         print(f"❌ Error reading prompt file: {e}", file=sys.stderr)
-        sys.exit(1)
+        exit_with_status(args.status_file, 1)
 
     # Check API key
     if not os.environ.get('CURSOR_API_KEY'):
         print("❌ Error: CURSOR_API_KEY environment variable not set", file=sys.stderr)
-        sys.exit(1)
+        exit_with_status(args.status_file, 1)
 
-    # Start cursor-agent with prompt as argument
-    # Python can handle long arguments directly without shell limits
     print("Starting Cursor AI analysis...")
 
     # Find cursor-agent in common installation paths
@@ -78,92 +795,115 @@ def main():
         print("Searched paths:", file=sys.stderr)
         for path in possible_paths:
             print(f"  - {path}", file=sys.stderr)
-        sys.exit(1)
+        exit_with_status(args.status_file, 1)
 
     print(f"Found cursor-agent at: {cursor_agent_path}")
 
-    # Python subprocess can pass large arguments directly without shell limits
-    # The OS limit (ARG_MAX) applies to shell commands, but Python subprocess.Popen
-    # passes arguments directly to execve(), bypassing shell limitations
-    # However, there's still a system limit (typically 2MB on Linux), so we check
     prompt_bytes = len(prompt.encode('utf-8'))
-    MAX_ARG_BYTES = 2 * 1024 * 1024  # 2MB - typical Linux ARG_MAX
+    print(f"📤 Prompt size: {prompt_bytes:,} bytes ({prompt_bytes / 1024 / 1024:.2f} MB, "
+          f"~{prompt_bytes // CHARS_PER_TOKEN:,} tokens)")
 
-    print(f"📤 Prompt size: {prompt_bytes:,} bytes ({prompt_bytes / 1024 / 1024:.2f} MB)")
+    transport = select_transport(args.transport, prompt_bytes, args.max_prompt_tokens)
+    try:
+        transport.check(prompt_bytes)
+    except PromptTooLargeError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        print("   Solution: Reduce number of files or lines per file, or use another --transport", file=sys.stderr)
+        exit_with_status(args.status_file, 1)
+    print(f"🚀 Prompt transport: {transport.name}")
 
-    if prompt_bytes > MAX_ARG_BYTES:
-        print(f"❌ Error: Prompt too large ({prompt_bytes:,} bytes) exceeds system limit ({MAX_ARG_BYTES:,} bytes)", file=sys.stderr)
-        print("   Solution: Reduce number of files or lines per file", file=sys.stderr)
-        sys.exit(1)
+    started = time.monotonic()
+    deadline = started + args.timeout
+    # Largest output of a failed attempt, kept for salvage while retrying
+    partial_path = args.output_file + '.partial'
+    partial_bytes = 0
+    attempts = []
+    invocations = 0
+    while True:
+        attempt_started = time.monotonic()
+        attempt = run_attempt(transport, cursor_agent_path, model, prompt, args, deadline)
+        reason, exit_code = attempt['reason'], attempt['exit_code']
+        invocations += attempt['invocations']
+        attempts.append({
+            'reason': reason,
+            'exit_code': exit_code,
+            'output_bytes': attempt['result']['output_bytes'] if attempt['result'] else 0,
+            'duration_seconds': round(time.monotonic() - attempt_started, 3),
+        })
+        if reason in SUCCESS_REASONS or reason not in RETRYABLE_REASONS or len(attempts) > args.retries:
+            break
 
-    # Use Python subprocess directly - this bypasses shell argument limits
-    # Python's subprocess.Popen passes arguments directly to the system call
-    # without going through shell parsing, so we can use larger prompts
-    print("🚀 Using direct subprocess call (bypasses shell limits)...")
+        delay = backoff_delay(len(attempts), args.backoff_base, args.backoff_max,
+                              retry_after_seconds(attempt['stderr']) if reason == 'rate_limit' else None)
+        remaining = deadline - time.monotonic()
+        if remaining - delay < MIN_RETRY_BUDGET:
+            print(f"⚠️ {reason}: not retrying, only {remaining:.0f}s of the time budget left", file=sys.stderr)
+            break
+        size = output_size(args.output_file)
+        if size > partial_bytes:
+            os.replace(args.output_file, partial_path)
+            partial_bytes = size
+        print(f"🔁 {reason}: retrying in {delay:.0f}s (attempt {len(attempts) + 1}/{args.retries + 1})",
+              file=sys.stderr)
+        time.sleep(delay)
 
-    try:
-        # Direct subprocess call - Python handles large arguments better than shell
-        proc = subprocess.Popen(
-            [cursor_agent_path, '--model', model, '-p', prompt],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
-        )
+    # Salvage: after a final failure keep the largest partial output of all attempts
+    salvaged = False
+    if reason not in SUCCESS_REASONS and partial_bytes > output_size(args.output_file):
+        os.replace(partial_path, args.output_file)
+        salvaged = True
+    elif os.path.exists(partial_path):
+        os.remove(partial_path)
 
-        try:
-            # Wait for completion with timeout
-            stdout, stderr = proc.communicate(timeout=args.timeout)
-            exit_code = proc.returncode
+    output_bytes = output_size(args.output_file) if attempt['result'] or salvaged else 0
+    if attempt['result'] is not None or salvaged:
+        print(f"✅ Output written to: {args.output_file} ({output_bytes:,} bytes)")
+    partial = reason not in SUCCESS_REASONS and output_bytes > 0
+    if partial:
+        source = "an earlier attempt" if salvaged else "the last attempt"
+        print(f"🩹 Run failed ({reason}); keeping {output_bytes:,} bytes of partial output from {source} "
+              f"for extraction", file=sys.stderr)
 
-            # Print stderr if there were errors
-            if stderr and (exit_code != 0 or 'error' in stderr.lower()):
-                print(f"⚠️ Stderr output: {stderr[:500]}", file=sys.stderr)
-            # Normal method: prompt as argument
-            proc = subprocess.Popen(
-                [cursor_agent_path, '--model', model, '-p', prompt],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
-            )
-            try:
-                # Wait for completion with timeout
-                stdout, _ = proc.communicate(timeout=args.timeout)
-                exit_code = proc.returncode
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            stdout, stderr = proc.communicate()
-            print(f"⏱️ Analysis timed out after {args.timeout} seconds", file=sys.stderr)
-            exit_code = 124
-        except OSError as e:
-            proc.kill()
-            if e.errno == 7:  # Argument list too long
-                print(f"❌ Error: Prompt too large for system ({prompt_bytes:,} bytes)", file=sys.stderr)
-                print("   System limit reached despite Python subprocess. Consider reducing prompt size.", file=sys.stderr)
-            else:
-                print(f"❌ OS Error during analysis: {e}", file=sys.stderr)
-            exit_code = 1
-        except Exception as e:
-            proc.kill()
-            print(f"❌ Error during analysis: {e}", file=sys.stderr)
-            exit_code = 1
+    watchdog = attempt['watchdog']
+    timings = watchdog.stats() if watchdog else {}
+    duration = round(time.monotonic() - started, 3)
+    if args.metrics_file:
+        append_metrics(args.metrics_file, {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'model': model,
+            'transport': transport.name,
+            'shard_id': args.shard_id,
+            'workflow': os.environ.get('GITHUB_WORKFLOW'),
+            'run_id': os.environ.get('GITHUB_RUN_ID'),
+            'prompt_bytes': prompt_bytes,
+            'prompt_tokens': prompt_bytes // CHARS_PER_TOKEN,
+            'first_byte_seconds': timings.get('first_byte_seconds'),
+            'duration_seconds': duration,
+            'output_bytes': output_bytes,
+            'output_tokens': output_bytes // CHARS_PER_TOKEN,
+            'reason': reason,
+            'exit_code': exit_code,
+            'attempts': len(attempts),
+            'partial': partial,
+        })
 
-        # Write output to file (only if we got output)
-        if 'stdout' in locals():
-            try:
-                with open(args.output_file, 'w', encoding='utf-8') as f:
-                    f.write(stdout)
-                print(f"✅ Output written to: {args.output_file}")
-            except Exception as e:
-                print(f"❌ Error writing output file: {e}", file=sys.stderr)
-                # Still exit with analysis exit code even if write fails
-
-        sys.exit(exit_code)
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}", file=sys.stderr)
-        sys.exit(1)
+    if args.status_file:
+        status = {
+            'reason': reason,
+            'exit_code': exit_code,
+            'retryable': reason in RETRYABLE_REASONS,
+            'model': model,
+            'transport': transport.name,
+            'invocations': invocations,
+            'attempts': attempts,
+            'partial': partial,
+            'duration_seconds': duration,
+            'output_bytes': output_bytes,
+        }
+        status.update(timings)
+        write_status(args.status_file, status)
+
+    sys.exit(exit_code)
 
 if __name__ == '__main__':
     main()
-
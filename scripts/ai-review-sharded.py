@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Sharded full-project review: runs several cursor-agent analyses in parallel.
+
+The file list (files_to_analyze.txt) is split into shards by the token-budget
+planner ai-review-plan-shards.py (per Clean Architecture layer, directories kept
+together); an existing plan can be passed with --plan. Every shard gets the base
+prompt plus its own file list and runs through ai-review-run-cursor.py; at most
+--jobs shards run at the same time. The per-shard TOON/JSON outputs are extracted with
+ai-review-extract-toon.py and merged into one analysis-output.json with
+duplicate findings removed and the summary recalculated.
+
+Findings of completed shards are cached per file content in --review-cache
+(keyed by path, git blob SHA, prompt version and model), provided the shard's
+summary.total_issues matches its issues; files without findings only count as
+clean when the agent reports all shard files as analyzed. Files whose cached
+findings are still valid are not sent to the agent again; only the remaining
+files are re-planned and analysed.
+
+Usage:
+    python scripts/ai-review-sharded.py --files files_to_analyze.txt \\
+        --prompt-file /tmp/analysis-prompt.md --output-file /tmp/analysis-output.json --jobs 4
+
+For local tests put a stub `cursor-agent` first in PATH.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+RUNNER = SCRIPT_DIR / 'ai-review-run-cursor.py'
+EXTRACTOR = SCRIPT_DIR / 'ai-review-extract-toon.py'
+PLANNER = SCRIPT_DIR / 'ai-review-plan-shards.py'
+# Plan format written by ai-review-plan-shards.py
+PLAN_VERSION = 1
+
+# Default model of ai-review-run-cursor.py (part of the review cache key)
+DEFAULT_MODEL = 'sonnet-4.5'
+
+# Review cache: bump SHARD_PROMPT_VERSION whenever SHARD_PROMPT_SECTION changes
+DEFAULT_REVIEW_CACHE = '.ai-review-cache/reviews.json'
+SHARD_PROMPT_VERSION = 1
+REVIEW_CACHE_MAX_AGE_DAYS = 30
+# Only complete runs are cached; salvaged partial output could miss findings. An early
+# stop (complete_document) requires all summary.total_issues items, like a full run.
+CACHEABLE_REASONS = ('completed', 'complete_document')
+
+# Keys of the summary section expected by ai-review-summary.py
+ISSUE_TYPES = ['solid_violation', 'result_pattern_violation', 'architecture_violation', 'code_smell', 'bug']
+SEVERITIES = ['critical', 'high', 'medium', 'low']
+
+SHARD_PROMPT_SECTION = """
+
+## Shard {index}/{total}: {group}
+
+Diese Analyse ist auf {total} parallele Läufe aufgeteilt. Analysiere in diesem Lauf
+AUSSCHLIESSLICH die folgenden {count} Dateien; die übrigen Dateien werden in anderen
+Läufen geprüft. Andere Dateien darfst du nur lesen, um Zusammenhänge zu verstehen.
+`files_analyzed` in der Summary bezieht sich nur auf diese Dateien.
+
+```
+{files}
+```
+"""
+
+
+def normalize_path(path):
+    """Repository-relative POSIX path of a finding ('./x', absolute paths below the checkout)."""
+    path = str(path or '').strip().replace('\\', '/')
+    if os.path.isabs(path):
+        try:
+            path = Path(path).relative_to(Path.cwd()).as_posix()
+        except ValueError:
+            pass
+    return path.removeprefix('./')
+
+
+def load_planner():
+    """ai-review-plan-shards.py as a module (shares git_blob_ids() with the planner)."""
+    spec = importlib.util.spec_from_file_location('ai_review_plan_shards', PLANNER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ReviewCache:
+    """Findings per file, keyed by (blob SHA, prompt template version, model).
+
+    Stored as one JSON file that the workflow keeps in its cache directory. Only
+    files whose content matches a git blob can be cached. Entries not used for
+    REVIEW_CACHE_MAX_AGE_DAYS are dropped when saving.
+    """
+
+    def __init__(self, path, prompt_version, model):
+        self.path = Path(path)
+        self.prompt_version = prompt_version
+        self.model = model
+        self.blobs = load_planner().git_blob_ids()
+        self.entries = {}
+        self.today = date.today().isoformat()
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding='utf-8')).get('entries', {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def key(self, path):
+        blob = self.blobs.get(path)
+        if blob is None:
+            return None
+        # The path is part of the key: identical files elsewhere have their own findings
+        identity = f"{path}:{blob}:{SHARD_PROMPT_VERSION}:{self.prompt_version}:{self.model}"
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    def lookup(self, path):
+        """Cached findings of the file (list, possibly empty) or None on a miss."""
+        entry = self.entries.get(self.key(path) or '')
+        if entry is None:
+            return None
+        entry['used'] = self.today
+        return entry['findings']
+
+    def store(self, path, findings):
+        key = self.key(path)
+        if key:
+            self.entries[key] = {'file': path, 'findings': findings, 'used': self.today}
+
+    def save(self):
+        cutoff = (date.today() - timedelta(days=REVIEW_CACHE_MAX_AGE_DAYS)).isoformat()
+        entries = {key: entry for key, entry in self.entries.items() if entry.get('used', '') >= cutoff}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': 1, 'entries': entries}, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+
+def read_file_list(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def create_plan(args, plan_path, files_path=None, token_budget=None, chars_per_token=None):
+    """Creates the shard plan with ai-review-plan-shards.py and returns it."""
+    command = [
+        sys.executable, str(PLANNER),
+        '--files', str(files_path or args.files),
+        '--output', str(plan_path),
+        '--token-budget', str(token_budget or args.token_budget),
+        '--chars-per-token', str(chars_per_token or args.chars_per_token),
+    ]
+    subprocess.run(command, check=True)
+    return json.loads(Path(plan_path).read_text(encoding='utf-8'))
+
+
+def store_findings(cache, shards, entries):
+    """Caches the findings per file of the successfully completed shards.
+
+    A shard is only cached when its summary.total_issues matches the parsed issues.
+    Files without findings are only cached as clean when the agent reports all shard
+    files as analyzed (summary.files_analyzed); otherwise only files with findings
+    are stored. Findings for files outside the shard are not cached (and logged).
+    """
+    stored = 0
+    for shard, entry in zip(shards, entries):
+        if not entry['success'] or entry['partial'] or entry['reason'] not in CACHEABLE_REASONS:
+            continue
+        issues = [issue for issue in entry['analysis'].get('issues') or [] if isinstance(issue, dict) and issue]
+        summary = entry['analysis'].get('summary')
+        summary = summary if isinstance(summary, dict) else {}
+        if summary.get('total_issues') != len(issues):
+            print(f"⚠️ Shard {shard['id']}: summary.total_issues={summary.get('total_issues')} but "
+                  f"{len(issues)} issues parsed, not cached", file=sys.stderr)
+            continue
+        files = set(shard['files'])
+        by_file, dropped = {}, []
+        for issue in issues:
+            path = normalize_path(issue.get('file'))
+            if path in files:
+                by_file.setdefault(path, []).append(dict(issue, file=path))
+            else:
+                dropped.append(str(issue.get('file')))
+        if dropped:
+            print(f"⚠️ Shard {shard['id']}: {len(dropped)} finding(s) for files outside the shard not cached: "
+                  f"{', '.join(sorted(set(dropped))[:5])}", file=sys.stderr)
+        covered = summary.get('files_analyzed')
+        if isinstance(covered, int) and covered >= len(files):
+            paths = shard['files']
+        else:
+            paths = [path for path in shard['files'] if path in by_file]
+            print(f"ℹ️ Shard {shard['id']}: {covered} of {len(files)} files reported as analyzed, "
+                  f"caching only the {len(paths)} file(s) with findings")
+        for path in paths:
+            cache.store(path, by_file.get(path, []))
+            stored += 1
+    return stored
+
+
+def runner_command(args, prompt_file, raw_file, status_file, shard_id):
+    command = [
+        sys.executable, str(RUNNER),
+        '--prompt-file', str(prompt_file),
+        '--output-file', str(raw_file),
+        '--status-file', str(status_file),
+        '--shard-id', shard_id,
+        '--timeout', str(args.timeout),
+        '--first-byte-timeout', str(args.first_byte_timeout),
+        '--idle-timeout', str(args.idle_timeout),
+    ]
+    if args.model:
+        command += ['--model', args.model]
+    if args.stop_on_complete:
+        command.append('--stop-on-complete')
+    if args.retries is not None:
+        command += ['--retries', str(args.retries)]
+    return command
+
+
+def run_shard(shard, total, base_prompt, args, work_dir):
+    """Runs the agent for one shard and extracts its result (runs in the worker pool).
+
+    Returns:
+        dict: Shard report entry; 'analysis' holds the parsed JSON or None
+    """
+    shard_dir = work_dir / shard['id']
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    prompt_file = shard_dir / 'prompt.md'
+    raw_file = shard_dir / 'output-raw.txt'
+    toon_file = shard_dir / 'output.toon'
+    json_file = shard_dir / 'output.json'
+    status_file = shard_dir / 'status.json'
+    log_file = shard_dir / 'run.log'
+
+    section = SHARD_PROMPT_SECTION.format(
+        index=int(shard['id'].split('-')[0]), total=total, group=shard['group'],
+        count=len(shard['files']), files='\n'.join(shard['files'])
+    )
+    prompt_file.write_text(base_prompt + section, encoding='utf-8')
+
+    entry = {
+        'id': shard['id'],
+        'group': shard['group'],
+        'files': len(shard['files']),
+        'tokens': shard['tokens'],
+        'success': False,
+        'partial': False,
+        'reason': None,
+        'exit_code': None,
+        'duration': 0.0,
+        'issues': 0,
+        'error': None,
+        'analysis': None,
+    }
+    started = time.perf_counter()
+    with open(log_file, 'w', encoding='utf-8') as log:
+        process = subprocess.run(
+            runner_command(args, prompt_file, raw_file, status_file, shard['id']),
+            stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, check=False
+        )
+    entry['exit_code'] = process.returncode
+    try:
+        entry['reason'] = json.loads(status_file.read_text(encoding='utf-8')).get('reason')
+    except (OSError, ValueError):
+        pass
+
+    # Like the single-run workflow: try to extract even after a failed/killed run
+    if raw_file.exists() and raw_file.stat().st_size > 0:
+        shutil.copyfile(raw_file, json_file)
+        with open(log_file, 'a', encoding='utf-8') as log:
+            extraction = subprocess.run(
+                [sys.executable, str(EXTRACTOR), '--raw-file', str(raw_file),
+                 '--toon-file', str(toon_file), '--output-file', str(json_file)],
+                stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, check=False
+            )
+        if extraction.returncode == 0:
+            try:
+                analysis = json.loads(json_file.read_text(encoding='utf-8'))
+                if isinstance(analysis, dict):
+                    entry['analysis'] = analysis
+            except (OSError, ValueError):
+                pass
+        if entry['analysis'] is None:
+            entry['error'] = f"No TOON/JSON result in output (see {log_file})"
+    else:
+        entry['error'] = f"No output (runner exit code {process.returncode}, see {log_file})"
+
+    entry['duration'] = round(time.perf_counter() - started, 3)
+    if entry['analysis'] is not None:
+        entry['success'] = True
+        entry['partial'] = bool(entry['analysis'].get('partial'))
+        entry['issues'] = len(entry['analysis'].get('issues') or [])
+    return entry
+
+
+def issue_key(issue):
+    """Identity of a finding across shards (same place, same kind of problem)."""
+    file = normalize_path(issue.get('file'))
+    kind = str(issue.get('type') or '').strip().lower()
+    line = issue.get('line')
+    if line not in (None, '', 0):
+        return (file, str(line), kind)
+    return (file, kind, ' '.join(str(issue.get('title') or '').lower().split()))
+
+
+def severity_rank(issue):
+    severity = str(issue.get('severity') or '').lower()
+    return SEVERITIES.index(severity) if severity in SEVERITIES else len(SEVERITIES)
+
+
+def merge_results(entries, cached_issues=(), cached_files=0):
+    """Merges the shard analyses and cached findings: deduplicated issues and a recalculated summary.
+
+    For duplicates the finding with the highest severity is kept.
+    """
+    merged, order = {}, []
+    files_analyzed = cached_files
+    analyses = []
+    for entry in entries:
+        analysis = entry['analysis']
+        if analysis is None:
+            continue
+        summary = analysis.get('summary') or {}
+        reported = summary.get('files_analyzed') if isinstance(summary, dict) else None
+        files_analyzed += reported if isinstance(reported, int) and reported > 0 else entry['files']
+        analyses.append(analysis.get('issues') or [])
+    analyses.append(cached_issues)
+
+    for issues in analyses:
+        for issue in issues:
+            if not isinstance(issue, dict) or not issue:
+                continue
+            key = issue_key(issue)
+            if key not in merged:
+                order.append(key)
+                merged[key] = issue
+            elif severity_rank(issue) < severity_rank(merged[key]):
+                merged[key] = issue
+
+    issues = [merged[key] for key in order]
+    by_type = dict.fromkeys(ISSUE_TYPES, 0)
+    by_severity = dict.fromkeys(SEVERITIES, 0)
+    for issue in issues:
+        kind = issue.get('type') or 'unknown'
+        by_type[kind] = by_type.get(kind, 0) + 1
+        severity = str(issue.get('severity') or 'unknown').lower()
+        by_severity[severity] = by_severity.get(severity, 0) + 1
+
+    result = {
+        'summary': {
+            'total_issues': len(issues),
+            'files_analyzed': files_analyzed,
+            'by_type': by_type,
+            'by_severity': by_severity,
+            'cached_files': cached_files,
+            'shards': {
+                'total': len(entries),
+                'succeeded': sum(1 for entry in entries if entry['success']),
+                'partial': [entry['id'] for entry in entries if entry['partial']],
+                'failed': [entry['id'] for entry in entries if not entry['success']],
+            },
+        },
+        'issues': issues,
+    }
+    if any(entry['partial'] for entry in entries):
+        result['partial'] = True
+    return result
+
+
+def write_combined_raw(entries, work_dir, raw_path):
+    """Concatenates the raw shard outputs (for artifacts/debugging)."""
+    with open(raw_path, 'w', encoding='utf-8') as out:
+        for entry in entries:
+            raw_file = work_dir / entry['id'] / 'output-raw.txt'
+            out.write(f"===== Shard {entry['id']} ({entry['reason']}) =====\n")
+            if raw_file.exists():
+                out.write(raw_file.read_text(encoding='utf-8', errors='replace'))
+            out.write('\n')
+
+
+def run_sharded(shards, base_prompt, args, work_dir):
+    """Runs all shards with at most args.jobs in parallel (entries in shard order)."""
+    print_lock = threading.Lock()
+
+    def run_and_report(shard):
+        entry = run_shard(shard, len(shards), base_prompt, args, work_dir)
+        status = '✅' if entry['success'] else '❌'
+        with print_lock:
+            print(f"  {status} Shard {entry['id']}: {entry['files']} files, {entry['issues']} issues, "
+                  f"{entry['duration']:.0f}s ({entry['reason']})", flush=True)
+        return entry
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        return list(pool.map(run_and_report, shards))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a sharded, parallel Cursor AI full-project review')
+    parser.add_argument('--files', default='files_to_analyze.txt', help='File list, one path per line')
+    parser.add_argument('--prompt-file', required=True, help='Base prompt shared by all shards')
+    parser.add_argument('--output-file', required=True, help='Merged analysis JSON')
+    parser.add_argument('--raw-output-file', default=None, help='Concatenated raw shard outputs (optional)')
+    parser.add_argument('--work-dir', default=None, help='Directory for shard prompts, outputs and report')
+    parser.add_argument('--jobs', type=int, default=4, help='Shards analysed in parallel (default: 4)')
+    parser.add_argument('--plan', default=None,
+                        help='Shard plan from ai-review-plan-shards.py (default: planned here into the work dir)')
+    parser.add_argument('--token-budget', type=int, default=60000,
+                        help='Estimated prompt tokens per shard when planning here (default: 60000)')
+    parser.add_argument('--chars-per-token', type=float, default=4.0,
+                        help='Tokenizer ratio when planning here (default: 4.0)')
+    parser.add_argument('--model', default=None, help='AI model (default: runner default)')
+    parser.add_argument('--timeout', type=int, default=1800, help='Total runtime limit per shard in seconds')
+    parser.add_argument('--first-byte-timeout', type=int, default=0, help='Passed to the runner')
+    parser.add_argument('--idle-timeout', type=int, default=0, help='Passed to the runner')
+    parser.add_argument('--stop-on-complete', action='store_true', help='Passed to the runner')
+    parser.add_argument('--retries', type=int, default=None,
+                        help='Retries after transient failures per shard (default: runner default)')
+    parser.add_argument('--review-cache', default=DEFAULT_REVIEW_CACHE,
+                        help=f'Per-file findings cache (default: {DEFAULT_REVIEW_CACHE})')
+    parser.add_argument('--no-review-cache', action='store_true', help='Analyse all files, do not use the cache')
+    parser.add_argument('--prompt-version', default=os.environ.get('AI_REVIEW_PROMPT_VERSION', '1'),
+                        help='Version of the base prompt template; part of the cache key '
+                             '(default: AI_REVIEW_PROMPT_VERSION or 1)')
+    args = parser.parse_args()
+
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix='ai-review-shards-'))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    model = args.model or os.environ.get('CURSOR_AI_MODEL', DEFAULT_MODEL)
+    cache = None if args.no_review_cache else ReviewCache(args.review_cache, args.prompt_version, model)
+
+    try:
+        base_prompt = Path(args.prompt_file).read_text(encoding='utf-8')
+        files = read_file_list(args.files)
+        plan = json.loads(Path(args.plan).read_text(encoding='utf-8')) if args.plan else None
+        if plan is not None and plan.get('version') != PLAN_VERSION:
+            raise ValueError(f"Unsupported shard plan version: {plan.get('version')}")
+
+        # Cache hits are merged in, only the misses go to the agent
+        cached_issues, cached_files, misses = [], 0, files
+        if cache is not None:
+            misses = []
+            for path in files:
+                findings = cache.lookup(path)
+                if findings is None:
+                    misses.append(path)
+                else:
+                    cached_issues.extend(findings)
+                    cached_files += 1
+            print(f"🗄️ Review cache: {cached_files} hits, {len(misses)} misses (model {model})")
+
+        if not misses:
+            plan = {'total_tokens': 0, 'shards': []}
+        elif plan is None or cached_files:
+            # Re-plan the misses (with the budget of a given plan) so shards stay full
+            misses_path = work_dir / 'files-to-review.txt'
+            misses_path.write_text('\n'.join(misses) + '\n', encoding='utf-8')
+            plan = create_plan(args, work_dir / 'plan.json', misses_path,
+                               (plan or {}).get('token_budget'), (plan or {}).get('chars_per_token'))
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    shards = plan['shards']
+    if not files:
+        print("❌ Error: No files to analyze", file=sys.stderr)
+        sys.exit(1)
+    file_count = sum(len(shard['files']) for shard in shards)
+    print(f"🧩 {file_count} files in {len(shards)} shards (~{plan['total_tokens']:,} tokens), "
+          f"{max(1, args.jobs)} in parallel")
+    started = time.perf_counter()
+    entries = run_sharded(shards, base_prompt, args, work_dir)
+
+    if cache is not None:
+        stored = store_findings(cache, shards, entries)
+        try:
+            cache.save()
+            print(f"🗄️ Review cache: {stored} files stored in {args.review_cache}")
+        except OSError as e:
+            print(f"⚠️ Could not save review cache: {e}", file=sys.stderr)
+
+    result = merge_results(entries, cached_issues, cached_files)
+    with open(args.output_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    if args.raw_output_file:
+        write_combined_raw(entries, work_dir, args.raw_output_file)
+
+    report = {
+        'duration': round(time.perf_counter() - started, 3),
+        'shards': [{k: v for k, v in entry.items() if k != 'analysis'} for entry in entries],
+    }
+    (work_dir / 'report.json').write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    succeeded = result['summary']['shards']['succeeded']
+    print(f"✅ {result['summary']['total_issues']} issues from {succeeded}/{len(entries)} shards "
+          f"and {cached_files} cached files written to {args.output_file} ({report['duration']:.0f}s)")
+    sys.exit(0 if succeeded or not entries else 1)
+
+
+if __name__ == '__main__':
+    main()
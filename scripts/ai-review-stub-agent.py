@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Deterministic stand-in for `cursor-agent` (and `gh`) to exercise the review
+pipeline offline.
+
+The stub understands the invocations of ai-review-run-cursor.py (prompt via
+argv, stdin or the file instruction, `create-chat` and `--resume` for the
+chunked transport) and answers with either a recorded output (STUB_AGENT_REPLAY) or a
+synthetic TOON/JSON analysis. Every choice is derived from STUB_AGENT_SEED, the
+prompt and the attempt number of that prompt, so the same configuration always
+produces the same outputs, failures included (a retry of the runner sees the
+next attempt).
+
+Configuration (environment, because the runner only passes agent arguments):
+
+    STUB_AGENT_REPLAY       recorded output file, or a directory of them (picked per prompt)
+    STUB_AGENT_FORMAT       toon (default) or json
+    STUB_AGENT_ISSUES       issues per synthetic output (default: 5)
+    STUB_AGENT_SIZE         target output size in bytes, padded via the descriptions (default: 0)
+    STUB_AGENT_MALFORMED    share of outputs that are malformed, 0..1 (default: 0)
+    STUB_AGENT_FAILURES     failure shares, e.g. "rate_limit=0.1,crash=0.05,hang=0.05"
+                            (rate_limit, auth, network, crash, hang, stall)
+    STUB_AGENT_LATENCY      seconds until the first byte (default: 0)
+    STUB_AGENT_THROUGHPUT   output bytes per second, 0 = unlimited (default: 0)
+    STUB_AGENT_HANG_SECONDS how long hang/stall block (default: 3600)
+    STUB_AGENT_SEED         seed (default: 0)
+    STUB_AGENT_STATE_DIR    attempt counters, gh state and manifest (default: temp dir)
+
+Every answer is appended to manifest.jsonl in the state dir (what was emitted:
+mode, issues, complete issues, malformation, failure), so a benchmark can check
+how much of it the extractors recovered.
+
+Usage:
+    python scripts/ai-review-stub-agent.py install /tmp/stub-bin
+    PATH=/tmp/stub-bin:$PATH python scripts/ai-review-run-cursor.py --prompt-file ... --output-file ...
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import signal
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+DEFAULT_ISSUES = 5
+ISSUE_TYPES = ['solid_violation', 'result_pattern_violation', 'architecture_violation', 'code_smell', 'bug']
+SEVERITIES = ['critical', 'high', 'medium', 'low']
+SOLID_PRINCIPLES = ['SRP', 'OCP', 'LSP', 'ISP', 'DIP']
+ISSUE_FIELDS = ['type', 'solid_principle', 'severity', 'file', 'line', 'column', 'title', 'description',
+                'current_code', 'recommendation', 'references']
+FAILURES = ['rate_limit', 'auth', 'network', 'crash', 'hang', 'stall']
+MALFORMATIONS = ['truncated', 'chatter', 'bad_header', 'unclosed_fence', 'progress']
+
+# Files named in the prompt (shard lists, diff overview); otherwise synthetic paths are used
+PROMPT_FILE = re.compile(r'(?<![\w/.-])((?:src|templates|scripts)/[\w./-]+\.(?:ts|js|svelte|hbs|py))\b')
+# Instruction of the file transport in ai-review-run-cursor.py
+FILE_INSTRUCTION = re.compile(r'Your complete task is in the file (.+?) \(UTF-8 Markdown\)')
+
+WRAPPER = '#!/bin/sh\nexec "{python}" "{script}" {role} "$@"\n'
+
+
+def env_float(name, default=0.0):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def state_dir():
+    path = Path(os.environ.get('STUB_AGENT_STATE_DIR') or Path(tempfile.gettempdir()) / 'ai-review-stub-agent')
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def parse_failures(spec):
+    """'rate_limit=0.1,crash=0.05' -> [('rate_limit', 0.1), ('crash', 0.05)]"""
+    failures = []
+    for part in (spec or '').split(','):
+        if '=' not in part:
+            continue
+        name, _, share = part.partition('=')
+        name = name.strip()
+        if name not in FAILURES:
+            raise ValueError(f"Unknown failure '{name}' (known: {', '.join(FAILURES)})")
+        failures.append((name, float(share)))
+    return failures
+
+
+def next_attempt(prompt_hash):
+    """Counts the invocations per prompt (0-based) so retries see a different outcome."""
+    counter = state_dir() / f"attempt-{prompt_hash[:16]}"
+    attempt = int(counter.read_text()) if counter.exists() else 0
+    counter.write_text(str(attempt + 1))
+    return attempt
+
+
+def record(entry):
+    with open(state_dir() / 'manifest.jsonl', 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry) + '\n')
+
+
+def prompt_files(prompt):
+    seen = []
+    for match in PROMPT_FILE.finditer(prompt):
+        if match.group(1) not in seen:
+            seen.append(match.group(1))
+    return seen
+
+
+def synthetic_issues(rng, files, count):
+    issues = []
+    for index in range(count):
+        issue_type = rng.choice(ISSUE_TYPES)
+        issues.append({
+            'type': issue_type,
+            'solid_principle': rng.choice(SOLID_PRINCIPLES) if issue_type == 'solid_violation' else '',
+            'severity': rng.choice(SEVERITIES),
+            'file': files[index % len(files)] if files else f"src/domain/example-{index:04d}.ts",
+            'line': rng.randint(1, 500),
+            'column': rng.randint(1, 80),
+            'title': f"Synthetic finding {index + 1}",
+            'description': f"Stub description {index + 1}",
+            'current_code': 'const value = service.get();',
+            'recommendation': 'Result-Pattern verwenden',
+            'references': [f"ADR-{rng.randint(1, 20):04d}"],
+        })
+    return issues
+
+
+def pad_descriptions(issues, size, render):
+    """Grows the descriptions until the rendered output reaches about `size` bytes."""
+    missing = size - len(render(issues).encode('utf-8'))
+    if missing <= 0 or not issues:
+        return
+    per_issue = missing // len(issues) + 1
+    for issue in issues:
+        issue['description'] += ' ' + ('lorem ipsum ' * (per_issue // 12 + 1))[:per_issue - 1]
+
+
+def summary_of(issues, files_analyzed):
+    by_type = {key: 0 for key in ISSUE_TYPES}
+    by_severity = {key: 0 for key in SEVERITIES}
+    for issue in issues:
+        by_type[issue['type']] += 1
+        by_severity[issue['severity']] += 1
+    return {'total_issues': len(issues), 'files_analyzed': files_analyzed,
+            'by_type': by_type, 'by_severity': by_severity}
+
+
+def toon_scalar(value):
+    text = str(value).replace('\n', ' ')
+    return f'"{text}"' if not text or text != text.strip() else text
+
+
+def render_toon(summary, issues):
+    lines = ['summary{total_issues,files_analyzed,by_type,by_severity}:',
+             f"  total_issues: {summary['total_issues']}",
+             f"  files_analyzed: {summary['files_analyzed']}"]
+    for key in ('by_type', 'by_severity'):
+        lines.append(f"  {key}{{{','.join(summary[key])}}}:")
+        lines.extend(f"    {name}: {count}" for name, count in summary[key].items())
+    for index, issue in enumerate(issues):
+        lines.append(f"issues[{index}]{{{','.join(ISSUE_FIELDS)}}}:")
+        for field in ISSUE_FIELDS[:-1]:
+            lines.append(f"  {field}: {toon_scalar(issue[field])}")
+        lines.append(f"  references[{len(issue['references'])}]: {','.join(issue['references'])}")
+    return '\n'.join(lines) + '\n'
+
+
+def render_json(summary, issues):
+    return json.dumps({'summary': summary, 'issues': issues}, indent=2, ensure_ascii=False) + '\n'
+
+
+def malform(rng, text, kind):
+    """Damages a rendered output the way real agent answers go wrong."""
+    if kind == 'truncated':
+        return text[:int(len(text) * rng.uniform(0.3, 0.9))]
+    if kind == 'chatter':
+        return "Ich habe die Dateien analysiert, aber die Ergebnisse sind zu umfangreich.\n"
+    if kind == 'bad_header':
+        # TOON headers with blanks, JSON with an unquoted key
+        text = text.replace('"summary":', 'summary:', 1)
+        return re.sub(r'^(summary|issues)(\[\d+\])?\{', r'\1 \2 {', text, flags=re.MULTILINE)
+    if kind == 'progress':
+        # Progress lines before the document that look like JSON arrays/objects
+        return "[1/3] Lese Dateien...\n[2/3] Analysiere {Architektur}...\n[3/3] Schreibe Ergebnis\n" + text
+    # unclosed_fence: Markdown fence without its closing counterpart
+    return "```toon\n" + text
+
+
+def complete_issues(text, fmt):
+    """Number of issues fully present in a damaged output (same rules as the extractors)."""
+    if fmt == 'json':
+        return len(re.findall(r'"references": \[[^\]]*\]\s*\n\s*\}', text))
+    return len(re.findall(r'^  references\[\d+\]:', text, re.MULTILINE))
+
+
+def emit(text, latency, throughput):
+    """Writes the answer with the configured latency and throughput."""
+    if latency:
+        time.sleep(latency)
+    data = text.encode('utf-8')
+    if not throughput:
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+        return
+    chunk = max(1, int(throughput / 10))
+    for start in range(0, len(data), chunk):
+        sys.stdout.buffer.write(data[start:start + chunk])
+        sys.stdout.flush()
+        time.sleep(0.1)
+
+
+def read_prompt(args):
+    """Prompt of an agent call: `-p <prompt>`, `-p` with stdin, or the file instruction."""
+    if '-p' not in args:
+        return ''
+    index = args.index('-p')
+    prompt = args[index + 1] if index + 1 < len(args) else sys.stdin.read()
+    match = FILE_INSTRUCTION.search(prompt)
+    if match:
+        prompt = Path(match.group(1)).read_text(encoding='utf-8')
+    return prompt
+
+
+def run_agent(args):
+    if args[:1] == ['create-chat']:
+        print(f"stub-chat-{os.getpid()}")
+        return 0
+
+    prompt = read_prompt(args)
+    if '--resume' in args and not re.match(r'Part (\d+)/\1\.', prompt):
+        print("OK")
+        return 0
+
+    seed = os.environ.get('STUB_AGENT_SEED', '0')
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    attempt = next_attempt(prompt_hash)
+    rng = random.Random(f"{seed}:{prompt_hash}:{attempt}")
+    latency = env_float('STUB_AGENT_LATENCY')
+    throughput = env_float('STUB_AGENT_THROUGHPUT')
+    hang_seconds = env_float('STUB_AGENT_HANG_SECONDS', 3600)
+    entry = {'prompt': prompt_hash[:16], 'attempt': attempt, 'prompt_bytes': len(prompt.encode('utf-8'))}
+
+    roll = rng.random()
+    for failure, share in parse_failures(os.environ.get('STUB_AGENT_FAILURES')):
+        if roll < share:
+            record(dict(entry, failure=failure, issues=0, complete_issues=0))
+            if failure == 'rate_limit':
+                print("Error: 429 Too Many Requests - rate limit exceeded, retry after 1", file=sys.stderr)
+                return 1
+            if failure == 'auth':
+                print("Error: 401 Unauthorized - invalid API key", file=sys.stderr)
+                return 1
+            if failure == 'network':
+                print("Error: request failed: ECONNRESET", file=sys.stderr)
+                return 1
+            if failure == 'crash':
+                sys.stdout.flush()
+                os.kill(os.getpid(), signal.SIGSEGV)
+            if failure == 'stall':
+                emit("summary{total_issues}:\n", latency, 0)
+            time.sleep(hang_seconds)
+            return 0
+        roll -= share
+
+    replay = os.environ.get('STUB_AGENT_REPLAY')
+    if replay:
+        path = Path(replay)
+        if path.is_dir():
+            recordings = sorted(p for p in path.iterdir() if p.is_file())
+            path = recordings[int(prompt_hash, 16) % len(recordings)]
+        text = path.read_text(encoding='utf-8', errors='replace')
+        record(dict(entry, mode='replay', source=str(path), output_bytes=len(text.encode('utf-8'))))
+        emit(text, latency, throughput)
+        return 0
+
+    fmt = os.environ.get('STUB_AGENT_FORMAT', 'toon')
+    render = render_json if fmt == 'json' else render_toon
+    files = prompt_files(prompt)
+    issues = synthetic_issues(rng, files, int(env_float('STUB_AGENT_ISSUES', DEFAULT_ISSUES)))
+    summary = summary_of(issues, len(files))
+    pad_descriptions(issues, int(env_float('STUB_AGENT_SIZE')), lambda items: render(summary, items))
+    text = render(summary, issues)
+
+    malformation = None
+    if rng.random() < env_float('STUB_AGENT_MALFORMED'):
+        malformation = rng.choice(MALFORMATIONS)
+        text = malform(rng, text, malformation)
+    # Issues that are still fully present in the output (what an extractor could recover)
+    complete = complete_issues(text, fmt) if malformation in ('truncated', 'chatter') else len(issues)
+    record(dict(entry, mode='synthetic', format=fmt, issues=len(issues), complete_issues=complete,
+                malformation=malformation, output_bytes=len(text.encode('utf-8'))))
+    emit(text, latency, throughput)
+    return 0
+
+
+def run_gh(args):
+    """Minimal `gh` for ai-review-create-label.py / ai-review-create-issues.py."""
+    time.sleep(env_float('STUB_GH_LATENCY'))
+    labels_file = state_dir() / 'gh-labels.json'
+    issues_file = state_dir() / 'gh-issues.json'
+    labels = json.loads(labels_file.read_text()) if labels_file.exists() else []
+    issues = json.loads(issues_file.read_text()) if issues_file.exists() else []
+
+    if args[:2] == ['label', 'create']:
+        if args[2] in labels:
+            print(f"label with name \"{args[2]}\" already exists", file=sys.stderr)
+            return 1
+        labels.append(args[2])
+        labels_file.write_text(json.dumps(labels))
+        return 0
+    if args[:2] == ['label', 'list']:
+        print(json.dumps([{'name': name} for name in labels]))
+        return 0
+    if args[:2] == ['issue', 'list']:
+        print(json.dumps(issues))
+        return 0
+    if args[:2] == ['issue', 'create']:
+        number = len(issues) + 1
+        issues.append({'number': number, 'title': args[args.index('--title') + 1]})
+        issues_file.write_text(json.dumps(issues))
+        print(f"https://github.com/stub/stub/issues/{number}")
+        return 0
+    print(f"stub gh: unsupported command: {' '.join(args[:2])}", file=sys.stderr)
+    return 1
+
+
+def install(directory):
+    """Writes `cursor-agent` and `gh` wrappers for this script into `directory`."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for role in ('cursor-agent', 'gh'):
+        path = directory / role
+        path.write_text(WRAPPER.format(python=sys.executable, script=Path(__file__).resolve(), role=role))
+        path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    print(f"✅ Stub cursor-agent and gh installed in {directory} (put it first in PATH)")
+    return 0
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('install', 'cursor-agent', 'gh'):
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+    role, args = sys.argv[1], sys.argv[2:]
+    if role == 'install':
+        return install(args[0] if args else '.')
+    try:
+        return run_gh(args) if role == 'gh' else run_agent(args)
+    except (OSError, ValueError) as e:
+        print(f"❌ Stub error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -50,6 +50,11 @@ try:
     
     print(f"**Gefundene Probleme:** {total_issues}")
     print("")
+
+    if data.get('partial'):
+        print("⚠️ **Unvollständiges Ergebnis:** Die Analyse wurde abgebrochen - nur die bis dahin vollständig "
+              "gemeldeten Probleme sind enthalten.")
+        print("")
     
     if total_issues == 0:
         print("✅ Keine Probleme gefunden - Code entspricht den Qualitätsstandards!")
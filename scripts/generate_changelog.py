@@ -1,42 +1,39 @@
 #!/usr/bin/env python3
 """
-Generiert CHANGELOG.md aus den Release Notes in docs/development/foundry/releases.
+Generiert CHANGELOG.md aus den Release Notes in docs/releases.
+
+Kann auch importiert werden: Die Release-Pipeline hält CHANGELOG.md und die Release
+Notes als ChangelogModel im Speicher und ruft generate_changelog() direkt auf.
 """
 
 import re
 from pathlib import Path
 
+UNRELEASED_BLOCK = "## [Unreleased]\n\n### Hinzugefügt\n\n### Geändert\n\n### Fehlerbehebungen\n\n### Bekannte Probleme\n\n### Upgrade-Hinweise\n\n"
+
 def parse_version(version_str):
     """Parse version string to tuple of ints for semantic comparison."""
     parts = version_str.lstrip('v').split('.')
     return tuple(int(p) for p in parts)
 
-def main():
-    root = Path(__file__).parent.parent
-    changelog_path = root / "CHANGELOG.md"
-    release_dir = root / "docs/releases"
-
-    # Lese Header bis Unreleased
-    text = changelog_path.read_text(encoding='utf-8')
-    if "## [Unreleased]" in text:
-        header, _ = text.split("## [Unreleased]", 1)
-    else:
-        header = text
-    header = header.rstrip() + "\n\n"
+class ReleaseNotes:
+    """Geparste Release Notes einer Version (docs/releases/v{version}.md)."""
 
-    # Neuer Unreleased-Block
-    unreleased_block = "## [Unreleased]\n\n### Hinzugefügt\n\n### Geändert\n\n### Fehlerbehebungen\n\n### Bekannte Probleme\n\n### Upgrade-Hinweise\n\n"
+    def __init__(self, version, date, body):
+        self.version = version
+        self.date = date
+        self.body = body
 
-    # Sammle Releases (absteigend nach Semantic Version)
-    sections = []
-    release_files = list(release_dir.glob('v*.md'))
-    # Sort by semantic version (not alphabetically!)
-    sorted_files = sorted(release_files, key=lambda f: parse_version(f.stem), reverse=True)
-    
-    for file in sorted_files:
-        content = file.read_text(encoding='utf-8').splitlines()
+    @classmethod
+    def parse(cls, stem, text):
+        """
+        Args:
+            stem (str): Dateiname ohne Endung (z.B. 'v0.60.0')
+            text (str): Inhalt der Release Notes
+        """
+        content = text.splitlines()
         # Version aus Dateiname
-        version = file.stem.lstrip('v')
+        version = stem.lstrip('v')
         # Datum aus Zeile mit Veröffentlichung
         date_line = next((l for l in content if l.startswith('**Veröffentlichungsdatum:**')), None)
         date = date_line.replace('**Veröffentlichungsdatum:**', '').strip() if date_line else ''
@@ -50,12 +47,73 @@ def main():
                 body.append('### ' + line[3:])
             else:
                 body.append(line)
-        section = f"## [{version}] - {date}\n" + "\n".join(body).rstrip() + "\n\n"
-        sections.append(section)
+        return cls(version, date, "\n".join(body))
+
+    def render_section(self):
+        """Gibt die Sektion für CHANGELOG.md zurück."""
+        return f"## [{self.version}] - {self.date}\n" + self.body.rstrip() + "\n\n"
+
+class ChangelogModel:
+    """CHANGELOG.md plus alle Release Notes im Speicher.
+
+    `text` ist der aktuelle Inhalt von CHANGELOG.md, `releases` bildet Versionen auf
+    ReleaseNotes ab.
+    """
+
+    def __init__(self, text, releases=None):
+        self.text = text
+        self.releases = releases or {}
+
+    @classmethod
+    def parse(cls, changelog_text, release_notes):
+        """
+        Args:
+            changelog_text (str): Inhalt von CHANGELOG.md
+            release_notes (dict): {Dateiname ohne Endung (z.B. 'v0.60.0'): Inhalt der Release Notes}
+        """
+        model = cls(changelog_text)
+        for stem, text in release_notes.items():
+            model.set_release_notes(stem, text)
+        return model
+
+    @property
+    def header(self):
+        """Text vor der Unreleased-Sektion (bleibt beim Generieren erhalten)."""
+        if "## [Unreleased]" in self.text:
+            header, _ = self.text.split("## [Unreleased]", 1)
+        else:
+            header = self.text
+        return header.rstrip() + "\n\n"
+
+    def set_release_notes(self, stem, text):
+        notes = ReleaseNotes.parse(stem, text)
+        self.releases[notes.version] = notes
+
+def generate_changelog(model):
+    """Erzeugt den neuen Inhalt von CHANGELOG.md aus einem ChangelogModel.
+
+    Header bleibt erhalten, die Unreleased-Sektion wird geleert und alle Releases
+    werden absteigend nach Semantic Version angehängt.
+    """
+    # Sort by semantic version (not alphabetically!)
+    versions = sorted(model.releases, key=parse_version, reverse=True)
+    sections = [model.releases[version].render_section() for version in versions]
+    return model.header + UNRELEASED_BLOCK + ''.join(sections)
+
+def build_changelog(changelog_text, release_notes):
+    """Wie generate_changelog(), aber aus Rohtexten (siehe ChangelogModel.parse)."""
+    return generate_changelog(ChangelogModel.parse(changelog_text, release_notes))
+
+def main():
+    root = Path(__file__).parent.parent
+    changelog_path = root / "CHANGELOG.md"
+    release_dir = root / "docs/releases"
+
+    release_notes = {f.stem: f.read_text(encoding='utf-8') for f in release_dir.glob('v*.md')}
+    new_text = build_changelog(changelog_path.read_text(encoding='utf-8'), release_notes)
 
     # Schreibe neues CHANGELOG.md
-    new_text = header + unreleased_block + ''.join(sections)
     changelog_path.write_text(new_text, encoding='utf-8')
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Baut module.zip (Download-Paket laut module.json) reproduzierbar.
+
+Inhalt sind module.json selbst, alle in module.json referenzierten Dateien
+(esmodules, scripts, styles, languages[].path, packs[].path) sowie templates/.
+Die Mitglieder werden parallel komprimiert und mit festen Zeitstempeln in
+sortierter Reihenfolge geschrieben, sodass gleiche Eingaben ein byte-identisches
+Archiv ergeben. Daneben entsteht ein SHA-256-Manifest; Mitglieder, deren Hash
+sich gegenüber dem letzten Lauf nicht geändert hat, werden roh aus dem vorherigen
+Archiv übernommen statt neu komprimiert.
+
+Mit --verify werden stattdessen die in module.json referenzierten Dateien geprüft
+(siehe verify_module_assets()).
+
+Kann auch importiert werden (Release-Schritte "module.zip packen" und "Assets prüfen").
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Ausgabeverzeichnis (nicht versioniert, siehe .gitignore)
+PACKAGE_DIR = "release-artifacts"
+PACKAGE_NAME = "module.zip"
+
+# Immer mitgepackte Verzeichnisse (Handlebars-Templates werden zur Laufzeit geladen)
+PACKAGE_EXTRA_DIRS = ["templates"]
+
+# Feste Metadaten für reproduzierbare Archive: 1980-01-01 00:00, rw-r--r--
+_DOS_TIME = 0
+_DOS_DATE = (0 << 9) | (1 << 5) | 1
+_EXTERNAL_ATTR = (0o100644 << 16)
+_VERSION_MADE_BY = (3 << 8) | 20  # Unix, ZIP 2.0
+_UTF8_FLAG = 0x800
+_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+_CENTRAL_HEADER = struct.Struct('<4s4B4HL2L5H2L')
+_END_RECORD = struct.Struct('<4s4H2LH')
+
+# Dateien, die als UTF-8 ohne BOM vorliegen müssen
+TEXT_EXTENSIONS = {'.js', '.mjs', '.cjs', '.json', '.css', '.hbs', '.html', '.md', '.txt'}
+_BOM = b'\xef\xbb\xbf'
+
+
+def manifest_paths(module_manifest):
+    """Gibt alle in module.json referenzierten Pfade zurück (Dateien oder Verzeichnisse)."""
+    paths = []
+    for key in ('esmodules', 'scripts', 'styles'):
+        for entry in module_manifest.get(key, []):
+            # styles kann in neueren Foundry-Versionen auch Objekte mit 'src' enthalten
+            paths.append(entry['src'] if isinstance(entry, dict) else entry)
+    for key in ('languages', 'packs'):
+        for entry in module_manifest.get(key, []):
+            if entry.get('path'):
+                paths.append(entry['path'])
+    return paths
+
+
+def collect_package_members(root=None):
+    """Ermittelt die Mitglieder von module.zip (sortiert, POSIX-Pfade relativ zu root).
+
+    Raises:
+        FileNotFoundError: Wenn ein in module.json referenzierter Pfad fehlt
+    """
+    root = Path(root or Path.cwd())
+    module_manifest = json.loads((root / "module.json").read_text(encoding='utf-8'))
+
+    members = {"module.json"}
+    missing = []
+    for rel in manifest_paths(module_manifest) + PACKAGE_EXTRA_DIRS:
+        path = root / rel
+        if path.is_file():
+            members.add(Path(rel).as_posix())
+        elif path.is_dir():
+            members.update(f.relative_to(root).as_posix() for f in path.rglob('*') if f.is_file())
+        elif rel not in PACKAGE_EXTRA_DIRS:
+            missing.append(rel)
+    if missing:
+        raise FileNotFoundError(f"In module.json referenziert, aber nicht vorhanden: {', '.join(missing)}")
+    return sorted(members)
+
+
+def _compress(data):
+    """Deflate ohne zlib-Header (wie im ZIP-Format); zlib gibt dabei den GIL frei."""
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _read_previous(archive_path, manifest_path):
+    """Liest Mitglieder-Hashes und Rohdaten-Positionen des vorherigen Archivs.
+
+    Returns:
+        dict: {Name: (sha256, crc, Größe, komprimierte Größe, Offset der Rohdaten)}
+    """
+    if not archive_path.is_file() or not manifest_path.is_file():
+        return {}
+    try:
+        hashes = json.loads(manifest_path.read_text(encoding='utf-8')).get('members', {})
+        previous = {}
+        with zipfile.ZipFile(archive_path) as archive, open(archive_path, 'rb') as raw:
+            for info in archive.infolist():
+                if info.filename not in hashes or info.compress_type != zipfile.ZIP_DEFLATED:
+                    continue
+                raw.seek(info.header_offset)
+                header = _LOCAL_HEADER.unpack(raw.read(_LOCAL_HEADER.size))
+                data_offset = info.header_offset + _LOCAL_HEADER.size + header[10] + header[11]
+                previous[info.filename] = (hashes[info.filename], info.CRC, info.file_size,
+                                           info.compress_size, data_offset)
+        return previous
+    except (OSError, ValueError, zipfile.BadZipFile):
+        return {}
+
+
+def build_module_zip(root=None, output=None, members=None, workers=None):
+    """Baut module.zip und das SHA-256-Manifest (<Archiv>.sha256.json).
+
+    Args:
+        root (Path, optional): Projekt-Root (Standard: aktuelles Verzeichnis)
+        output (Path, optional): Zielarchiv (Standard: release-artifacts/module.zip)
+        members (list, optional): Mitglieder (Standard: collect_package_members())
+        workers (int, optional): Threads für die Kompression
+
+    Returns:
+        dict: {'path', 'manifest', 'sha256', 'size', 'members': {Name: sha256},
+               'compressed': int, 'reused': int}
+    """
+    root = Path(root or Path.cwd())
+    output = Path(output or root / PACKAGE_DIR / PACKAGE_NAME)
+    manifest_path = output.with_name(output.name + ".sha256.json")
+    members = sorted(members if members is not None else collect_package_members(root))
+
+    contents = {name: (root / name).read_bytes() for name in members}
+    hashes = {name: hashlib.sha256(data).hexdigest() for name, data in contents.items()}
+    previous = _read_previous(output, manifest_path)
+    reuse = {name for name in members if name in previous and previous[name][0] == hashes[name]}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        compressed = dict(zip(
+            [name for name in members if name not in reuse],
+            pool.map(_compress, [contents[name] for name in members if name not in reuse])
+        ))
+
+    if reuse:
+        with open(output, 'rb') as raw:
+            for name in reuse:
+                _, _, _, compress_size, data_offset = previous[name]
+                raw.seek(data_offset)
+                compressed[name] = raw.read(compress_size)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(output.name + ".tmp")
+    central = []
+    offset = 0
+    with open(tmp_path, 'wb') as f:
+        for name in members:
+            data = compressed[name]
+            crc = zlib.crc32(contents[name])
+            encoded = name.encode('utf-8')
+            if max(len(data), len(contents[name]), offset) > 0xFFFFFFFF:
+                raise ValueError(f"{name}: Archiv zu groß (ZIP64 wird nicht unterstützt)")
+            f.write(_LOCAL_HEADER.pack(b'PK\x03\x04', 20, 0, _UTF8_FLAG, zipfile.ZIP_DEFLATED,
+                                       _DOS_TIME, _DOS_DATE, crc, len(data), len(contents[name]),
+                                       len(encoded), 0))
+            f.write(encoded)
+            f.write(data)
+            central.append(_CENTRAL_HEADER.pack(
+                b'PK\x01\x02', _VERSION_MADE_BY & 0xFF, _VERSION_MADE_BY >> 8, 20, 0,
+                _UTF8_FLAG, zipfile.ZIP_DEFLATED, _DOS_TIME, _DOS_DATE, crc, len(data),
+                len(contents[name]), len(encoded), 0, 0, 0, 0, _EXTERNAL_ATTR, offset
+            ) + encoded)
+            offset += _LOCAL_HEADER.size + len(encoded) + len(data)
+        directory = b''.join(central)
+        f.write(directory)
+        f.write(_END_RECORD.pack(b'PK\x05\x06', 0, 0, len(members), len(members),
+                                 len(directory), offset, 0))
+    os.replace(tmp_path, output)
+
+    archive_hash = hashlib.sha256(output.read_bytes()).hexdigest()
+    manifest = {'archive': output.name, 'sha256': archive_hash, 'members': hashes}
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding='utf-8')
+    return {
+        'path': str(output),
+        'manifest': str(manifest_path),
+        'sha256': archive_hash,
+        'size': output.stat().st_size,
+        'members': hashes,
+        'compressed': len(members) - len(reuse),
+        'reused': len(reuse),
+    }
+
+
+def _inspect_asset(path, data=None):
+    """Liest eine Datei einmal: Größe, SHA-256 und Encoding-Befund."""
+    if data is None:
+        data = path.read_bytes()
+    problem = None
+    if path.suffix in TEXT_EXTENSIONS:
+        if data.startswith(_BOM):
+            problem = "enthält ein BOM"
+        else:
+            try:
+                data.decode('utf-8')
+            except UnicodeDecodeError as e:
+                problem = f"ist kein gültiges UTF-8 (Byte {e.start})"
+    return len(data), hashlib.sha256(data).hexdigest(), problem
+
+
+def verify_module_assets(root=None, build_current=None, bom_report=None, workers=None,
+                         overrides=None, check_package=True, build_stamp=None, package=None):
+    """Prüft alle in module.json referenzierten Dateien.
+
+    module.json wird einmal gelesen; alle Dateien werden parallel gelesen und gehasht.
+    Geprüft wird: Existenz, UTF-8 ohne BOM (Textdateien), Build-Stand der esmodules
+    (`build_current`, siehe release_utils.is_build_current()), ob die esmodules und
+    weitere Build-Dateien noch die im Build-Stempel (`build_stamp`) erfassten Hashes
+    haben, und - falls vorhanden - ob module.zip noch zu den Dateien passt.
+
+    Args:
+        root (Path, optional): Projekt-Root (Standard: aktuelles Verzeichnis)
+        build_current (bool, optional): Ergebnis des Build-Stempel-Abgleichs (None = kein Stempel)
+        bom_report (list, optional): Von der BOM-Entfernung geänderte Dateien
+        workers (int, optional): Threads zum Lesen/Hashen
+        overrides (dict, optional): {Pfad: Inhalt (bytes)} statt der Platte (Testlauf-Overlay)
+        check_package (bool): module.zip gegen die Dateien prüfen
+        build_stamp (dict, optional): Build-Stempel mit den Hashes der erzeugten Dateien
+                                      (siehe release_utils.read_build_stamp())
+        package (Path, optional): Zu prüfendes Archiv (Standard: release-artifacts/module.zip)
+
+    Returns:
+        dict: {'success': bool, 'checked': int, 'issues': list, 'warnings': list,
+               'hashes': {Pfad: sha256}, 'duration': float}
+    """
+    started = time.perf_counter()
+    root = Path(root or Path.cwd())
+    issues = []
+    warnings = []
+    overrides = overrides or {}
+    if "module.json" in overrides:
+        module_manifest = json.loads(overrides["module.json"].decode('utf-8'))
+    else:
+        module_manifest = json.loads((root / "module.json").read_text(encoding='utf-8'))
+    referenced = manifest_paths(module_manifest)
+
+    files = ["module.json"]
+    for rel in referenced:
+        path = root / rel
+        if path.is_file() or Path(rel).as_posix() in overrides:
+            files.append(Path(rel).as_posix())
+        elif path.is_dir():
+            files.extend(sorted(f.relative_to(root).as_posix() for f in path.rglob('*') if f.is_file()))
+        else:
+            issues.append(f"{rel}: in module.json referenziert, aber nicht vorhanden")
+    files = sorted(set(files))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = dict(zip(files, pool.map(lambda rel: _inspect_asset(root / rel, overrides.get(rel)), files)))
+
+    hashes = {}
+    for rel, (size, digest, problem) in results.items():
+        hashes[rel] = digest
+        if problem:
+            issues.append(f"{rel} {problem}")
+        elif size == 0:
+            warnings.append(f"{rel} ist leer")
+
+    # Build-Stand: esmodules müssen zum Stempel des letzten Builds passen
+    esmodules = [Path(p).as_posix() for p in module_manifest.get('esmodules', [])]
+    if build_current is False:
+        issues.append(f"Build veraltet: {', '.join(esmodules) or 'dist/'} passt nicht zu den Quellen "
+                      f"(npm run build bzw. Schritt 'Build prüfen' ausführen)")
+    elif build_current is None and esmodules:
+        warnings.append("Kein Build-Stempel vorhanden, Build-Stand der esmodules nicht prüfbar")
+
+    # Inhalt: esmodules und weitere referenzierte Build-Dateien wie vom Build erzeugt
+    if build_stamp is not None:
+        built = build_stamp.get('files')
+        if built is None:
+            warnings.append("Build-Stempel ohne Datei-Hashes, Inhalt der esmodules nicht prüfbar")
+        else:
+            for rel in sorted(set(esmodules) | (set(files) & set(built))):
+                if rel not in built:
+                    issues.append(f"{rel}: nicht vom letzten Build erzeugt (fehlt im Build-Stempel)")
+                elif hashes.get(rel) is not None and hashes[rel] != built[rel]:
+                    issues.append(f"{rel}: weicht vom letzten Build ({build_stamp.get('mode') or 'unbekannt'}) ab "
+                                  f"- nachträglich überschrieben, z.B. durch npm run build:dev?")
+
+    # BOM-Report: dort bereinigte Assets müssen jetzt sauber sein (oben geprüft)
+    cleaned = sorted(set(Path(p).as_posix() for p in (bom_report or [])) & set(files))
+    if cleaned:
+        warnings.append(f"BOM wurde in diesem Lauf entfernt aus: {', '.join(cleaned)}")
+
+    # Vorhandenes Paket muss die aktuellen Dateien enthalten
+    package = Path(package or root / PACKAGE_DIR / PACKAGE_NAME)
+    package_manifest = package.with_name(package.name + ".sha256.json")
+    if check_package and package_manifest.is_file():
+        packed = json.loads(package_manifest.read_text(encoding='utf-8')).get('members', {})
+        stale = [rel for rel in files if rel in packed and packed[rel] != hashes[rel]]
+        missing = [rel for rel in files if rel not in packed]
+        if stale or missing:
+            issues.append(f"{PACKAGE_NAME} ist veraltet ({len(stale)} geändert, {len(missing)} fehlend)")
+
+    return {
+        'success': not issues,
+        'checked': len(files),
+        'issues': issues,
+        'warnings': warnings,
+        'hashes': hashes,
+        'duration': time.perf_counter() - started,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="module.zip reproduzierbar aus module.json bauen")
+    parser.add_argument("--root", default=str(Path(__file__).parent.parent), help="Projekt-Root")
+    parser.add_argument("--output", help=f"Zielarchiv (Standard: {PACKAGE_DIR}/{PACKAGE_NAME})")
+    parser.add_argument("--jobs", type=int, help="Threads für die Kompression")
+    parser.add_argument("--verify", action="store_true",
+                        help="Nur die in module.json referenzierten Dateien prüfen")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        from release_utils import set_project_root, read_build_stamp, is_build_current
+        set_project_root(args.root)
+        build_stamp = read_build_stamp()
+        build_current = is_build_current() if build_stamp else None
+        report = verify_module_assets(args.root, build_current=build_current, workers=args.jobs,
+                                      build_stamp=build_stamp)
+        for warning in report['warnings']:
+            print(f"Warnung: {warning}")
+        for issue in report['issues']:
+            print(f"Fehler: {issue}", file=sys.stderr)
+        print(f"{report['checked']} Dateien geprüft in {report['duration']:.3f}s")
+        return 0 if report['success'] else 1
+
+    try:
+        result = build_module_zip(args.root, args.output, workers=args.jobs)
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"{result['path']}: {len(result['members'])} Dateien, {result['size']} Bytes "
+          f"({result['compressed']} komprimiert, {result['reused']} übernommen)")
+    print(f"SHA-256: {result['sha256']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Batch-Release mehrerer Foundry-Module mit gleichem scripts/-Layout.
+
+Jedes Repository wird mit der headless Pipeline (release_cli.py) in einem eigenen
+Prozess released; es laufen höchstens --jobs Releases gleichzeitig. Die Pushes
+werden entkoppelt: Die Releases laufen ohne Schritt 10, und sobald ein Repository
+fertig ist, wird sein Branch samt Tag in einer eigenen Push-Warteschlange
+(`git push --atomic`) hochgeladen, während die übrigen Releases weiterlaufen.
+
+Manifest (JSON), relative Pfade beziehen sich auf das Verzeichnis des Manifests:
+
+    {
+      "defaults": {"changelog_file": null, "remark": "", "skip": [], "worktree": false},
+      "modules": [
+        {"path": "../modul-a", "version": "1.4.0"},
+        {"path": "../modul-b", "version": "0.9.2", "changelog_file": "notes-b.md"}
+      ]
+    }
+
+Beispiele:
+    python scripts/release_batch.py releases.json --jobs 3
+    python scripts/release_batch.py releases.json --dry-run --report batch.json
+
+Exit-Codes: 0 = alle Module erfolgreich, 1 = mindestens ein Modul fehlgeschlagen
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+CLI_SCRIPT = Path(__file__).parent / "release_cli.py"
+
+# Standardwerte für Manifest-Einträge
+MODULE_DEFAULTS = {
+    'changelog_file': None,
+    'remark': "",
+    'date': None,
+    'skip': [],
+    'worktree': False,
+}
+
+
+def load_manifest(manifest_path):
+    """Liest das Manifest und gibt die vollständigen Modul-Einträge zurück.
+
+    Returns:
+        list: [{'name', 'path', 'version', 'changelog_file', 'remark', 'date', 'skip', 'worktree'}]
+    """
+    manifest_path = Path(manifest_path).resolve()
+    data = json.loads(manifest_path.read_text(encoding='utf-8'))
+    if isinstance(data, list):
+        data = {'modules': data}
+    defaults = dict(MODULE_DEFAULTS, **data.get('defaults', {}))
+
+    modules = []
+    for entry in data.get('modules', []):
+        module = dict(defaults, **entry)
+        if not module.get('path') or not module.get('version'):
+            raise ValueError(f"Manifest-Eintrag ohne 'path' oder 'version': {entry}")
+        module['path'] = str((manifest_path.parent / module['path']).resolve())
+        if module['changelog_file']:
+            module['changelog_file'] = str((manifest_path.parent / module['changelog_file']).resolve())
+        module.setdefault('name', Path(module['path']).name)
+        # Namen bestimmen die Log- und Berichtsdateien und müssen eindeutig sein
+        names = {m['name'] for m in modules}
+        if module['name'] in names:
+            module['name'] = f"{module['name']}-{len(modules)}"
+        modules.append(module)
+    return modules
+
+
+def build_cli_command(module, report_path, dry_run=False):
+    """Baut den release_cli.py-Aufruf für ein Modul (immer ohne Push, siehe push_module())."""
+    command = [
+        sys.executable, str(CLI_SCRIPT),
+        '--project-root', module['path'],
+        '--version', module['version'],
+        '--json-report', str(report_path),
+        '--yes',
+        '--skip', 'git_push',
+    ]
+    if module['changelog_file']:
+        command += ['--changelog-file', module['changelog_file']]
+    if module['remark']:
+        command += ['--remark', module['remark']]
+    if module['date']:
+        command += ['--date', module['date']]
+    for option in module['skip']:
+        if option != 'git_push':
+            command += ['--skip', option]
+    if module['worktree']:
+        command.append('--worktree')
+    if dry_run:
+        command.append('--dry-run')
+    return command
+
+
+def release_module(module, work_dir, dry_run=False):
+    """Führt den Release eines Moduls aus (läuft im Release-Pool).
+
+    Returns:
+        dict: Eintrag für den Gesamtbericht
+    """
+    name = module['name']
+    report_path = work_dir / f"{name}.json"
+    log_path = work_dir / f"{name}.log"
+    entry = {
+        'name': name,
+        'path': module['path'],
+        'version': module['version'],
+        'success': False,
+        'exit_code': None,
+        'duration': 0.0,
+        'error': None,
+        'log_path': str(log_path),
+        'push': None,
+    }
+
+    started = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log_file:
+        process = subprocess.run(
+            build_cli_command(module, report_path, dry_run),
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            check=False
+        )
+    entry['duration'] = time.perf_counter() - started
+    entry['exit_code'] = process.returncode
+    entry['success'] = process.returncode == 0
+
+    if report_path.exists():
+        report = json.loads(report_path.read_text(encoding='utf-8'))
+        entry['error'] = report.get('error')
+        entry['completed'] = report.get('completed', [])
+        entry['timings'] = report.get('timings', {})
+    elif not entry['success']:
+        entry['error'] = f"release_cli.py beendet mit Exit-Code {process.returncode} (siehe {log_path})"
+    return entry
+
+
+def push_module(module, entry):
+    """Pusht Branch und Release-Tag eines Moduls in einem Roundtrip (läuft in der Push-Warteschlange)."""
+    cwd = module['path']
+    refs = []
+    branch = subprocess.run(
+        ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
+        capture_output=True, text=True, cwd=cwd, check=False
+    ).stdout.strip()
+    if 'git_commit' not in module['skip'] and branch and branch != 'HEAD':
+        refs.append(branch)
+    if 'git_tag' not in module['skip']:
+        refs.append(f"refs/tags/v{module['version']}")
+
+    push = {'refs': refs, 'success': True, 'duration': 0.0, 'error': None}
+    if refs:
+        started = time.perf_counter()
+        result = subprocess.run(
+            ['git', 'push', '--atomic', 'origin'] + refs,
+            capture_output=True, text=True, cwd=cwd, check=False
+        )
+        push['duration'] = time.perf_counter() - started
+        if result.returncode != 0:
+            push['success'] = False
+            push['error'] = result.stderr.strip()
+    entry['push'] = push
+    entry['success'] = entry['success'] and push['success']
+    if not push['success']:
+        entry['error'] = f"Push fehlgeschlagen: {push['error']}"
+    return entry
+
+
+def run_batch(modules, jobs=4, push_jobs=1, dry_run=False, work_dir=None):
+    """Released alle Module mit begrenztem Pool und überlappenden Pushes.
+
+    Args:
+        modules (list): Siehe load_manifest()
+        jobs (int): Höchstzahl gleichzeitiger Releases
+        push_jobs (int): Höchstzahl gleichzeitiger Pushes
+        dry_run (bool): Nur simulieren (kein Push)
+        work_dir (Path, optional): Verzeichnis für Logs und Einzelberichte
+
+    Returns:
+        dict: {'success', 'duration', 'work_dir', 'modules': [Eintrag je Modul in Manifest-Reihenfolge]}
+    """
+    work_dir = Path(work_dir or tempfile.mkdtemp(prefix="release-batch-"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    print_lock = threading.Lock()
+
+    def report(entry, phase):
+        status = "OK" if entry['success'] else "FEHLER"
+        with print_lock:
+            print(f"  [{status}] {entry['name']} v{entry['version']} ({phase})", flush=True)
+
+    with ThreadPoolExecutor(max_workers=push_jobs) as push_pool:
+        push_futures = {}
+
+        def release_then_queue_push(module):
+            entry = release_module(module, work_dir, dry_run)
+            report(entry, f"Release {entry['duration']:.1f}s")
+            push_wanted = 'git_push' not in module['skip'] and not dry_run
+            if entry['success'] and push_wanted:
+                future = push_pool.submit(push_module, module, entry)
+                future.add_done_callback(lambda _, e=entry: report(e, f"Push {e['push']['duration']:.1f}s"))
+                push_futures[module['name']] = future
+            return entry
+
+        with ThreadPoolExecutor(max_workers=jobs) as release_pool:
+            release_futures = [release_pool.submit(release_then_queue_push, module) for module in modules]
+            entries = [future.result() for future in release_futures]
+
+        for entry in entries:
+            future = push_futures.get(entry['name'])
+            if future is not None:
+                future.result()
+
+    return {
+        'success': all(entry['success'] for entry in entries),
+        'duration': time.perf_counter() - started,
+        'work_dir': str(work_dir),
+        'modules': entries,
+    }
+
+
+def print_report(result):
+    """Gibt den Gesamtbericht als Tabelle aus."""
+    print("\nBatch-Release:")
+    for entry in result['modules']:
+        status = "OK" if entry['success'] else "FEHLER"
+        push = entry['push']
+        push_info = f"push {push['duration']:.1f}s" if push else "kein push"
+        print(f"  {status:<7} {entry['name']:<30} v{entry['version']:<12} "
+              f"{entry['duration']:6.1f}s  {push_info}")
+        if entry['error']:
+            print("\n".join(f"          {line}" for line in entry['error'].splitlines() if line.strip()))
+            print(f"          Log: {entry['log_path']}")
+    succeeded = sum(1 for entry in result['modules'] if entry['success'])
+    print(f"\n  {succeeded}/{len(result['modules'])} erfolgreich, Gesamt {result['duration']:.1f}s")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Mehrere Module nacheinander bzw. parallel releasen")
+    parser.add_argument("manifest", help="Manifest (JSON) mit Repository-Pfaden und Versionen")
+    parser.add_argument("--jobs", type=int, default=4, help="Gleichzeitige Releases (Standard: 4)")
+    parser.add_argument("--push-jobs", type=int, default=1, help="Gleichzeitige Pushes (Standard: 1)")
+    parser.add_argument("--dry-run", action="store_true", help="Test-Modus: nur simulieren")
+    parser.add_argument("--work-dir", help="Verzeichnis für Logs und Einzelberichte (Standard: temporär)")
+    parser.add_argument("--report", help="Gesamtbericht zusätzlich als JSON in diese Datei schreiben")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        modules = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Manifest konnte nicht gelesen werden: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Starte Batch-Release für {len(modules)} Modul(e) (jobs={args.jobs})")
+    result = run_batch(modules, jobs=max(1, args.jobs), push_jobs=max(1, args.push_jobs),
+                       dry_run=args.dry_run, work_dir=args.work_dir)
+    print_report(result)
+    if args.report:
+        Path(args.report).write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8')
+    return 0 if result['success'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Kommandozeilen-Einstieg für die Release-Pipeline (ohne GUI).
+
+Beispiele:
+    python scripts/release_cli.py --version 0.60.0 --changelog-file notes.md --yes
+    python scripts/release_cli.py --version 0.60.0 --dry-run
+    python scripts/release_cli.py --version 0.60.0 --worktree --yes
+    python scripts/release_cli.py --resume --yes
+    python scripts/release_cli.py --docs-commit "README ergänzt" --yes
+
+Exit-Codes: 0 = Erfolg, 1 = Fehler, 2 = abgebrochen
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Damit das Skript aus jedem Verzeichnis aufrufbar ist
+sys.path.insert(0, str(Path(__file__).parent))
+
+from release_utils import (
+    set_project_root, read_module_version, read_unreleased_changes,
+    parse_changelog_sections, get_changed_files_info, PROJECT_ROOT
+)
+from release_engine import (
+    ReleaseEngine, ReleaseCallbacks, build_release_params, RELEASE_OPTIONS
+)
+
+
+class CliCallbacks(ReleaseCallbacks):
+    """Beantwortet Rückfragen per --yes oder interaktiv auf dem Terminal."""
+
+    def __init__(self, assume_yes=False, rollback=True):
+        self.assume_yes = assume_yes
+        self.rollback = rollback
+
+    def confirm(self, title, message):
+        if self.assume_yes:
+            return True
+        if not sys.stdin.isatty():
+            print(f"\n{title}: {message}\n-> Keine interaktive Eingabe möglich, abgebrochen (--yes verwenden)")
+            return False
+        answer = input(f"\n{title}\n{message}\n[j/N] ")
+        return answer.strip().lower() in ('j', 'ja', 'y', 'yes')
+
+    def confirm_rollback(self, title, message):
+        if not self.rollback:
+            return False
+        return self.confirm(title, message)
+
+    def notify(self, level, title, message):
+        stream = sys.stderr if level == 'error' else sys.stdout
+        print(f"\n[{level.upper()}] {title}\n{message}", file=stream)
+
+
+def load_changes(changelog_file):
+    """Liest die Changelog-Texte aus einer Datei oder der Unreleased-Sektion von CHANGELOG.md.
+
+    Die Datei darf eine komplette CHANGELOG.md (es zählt die Unreleased-Sektion) oder nur
+    die ###-Sektionen (Hinzugefügt, Geändert, Fehlerbehebungen, ...) enthalten.
+    """
+    if changelog_file is None:
+        return read_unreleased_changes("CHANGELOG.md")
+    path = Path(changelog_file)
+    if "## [Unreleased]" in path.read_text(encoding='utf-8'):
+        return read_unreleased_changes(path)
+    return parse_changelog_sections(path.read_text(encoding='utf-8'))
+
+
+def parse_version(version):
+    return [int(x) for x in version.split('.')]
+
+
+def print_summary(result, engine):
+    """Gibt Dauer und Laufzeit je Schritt aus."""
+    labels = {step.step_id: step.label for step in engine.steps()}
+    print("\nLaufzeiten:")
+    for step_id, seconds in sorted(result.get('timings', {}).items()):
+        print(f"  {labels.get(step_id, step_id):<40} {seconds:8.3f}s")
+    if result.get('skipped'):
+        print(f"  Übersprungen: {', '.join(str(s) for s in result['skipped'])}")
+    print(f"  {'Gesamt':<40} {result.get('duration', 0.0):8.3f}s")
+
+
+def exit_code(result):
+    if result.get('success'):
+        return 0
+    return 2 if result.get('cancelled') else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Release ohne GUI ausführen")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--version", help="Neue Version (z.B. 0.60.0)")
+    action.add_argument("--resume", action="store_true",
+                        help="Abgebrochenen Release anhand des Journals fortsetzen")
+    action.add_argument("--docs-commit", metavar="MESSAGE",
+                        help="Nur Dokumentations-Commit (keine Version, kein Tag)")
+    parser.add_argument("--changelog-file",
+                        help="Datei mit Changelog-Texten (Standard: Unreleased-Sektion aus CHANGELOG.md)")
+    parser.add_argument("--remark", default="", help="Commit-Bemerkung")
+    parser.add_argument("--date", help="Release-Datum YYYY-MM-DD (Standard: heute)")
+    parser.add_argument("--skip", action="append", default=[], choices=RELEASE_OPTIONS,
+                        help="Schritt-Option deaktivieren (mehrfach möglich)")
+    parser.add_argument("--dry-run", action="store_true", help="Test-Modus: nur simulieren")
+    parser.add_argument("--worktree", action="store_true",
+                        help="Isoliert in temporärem git worktree releasen (Checkout bleibt unverändert)")
+    parser.add_argument("--yes", action="store_true", help="Alle Rückfragen bejahen")
+    parser.add_argument("--no-rollback", action="store_true",
+                        help="Bei Fehlern keinen Rollback durchführen (Release bleibt fortsetzbar)")
+    parser.add_argument("--project-root", default=str(PROJECT_ROOT),
+                        help="Repository, in dem der Release ausgeführt wird (z.B. ein Fixture-Repo)")
+    parser.add_argument("--json-report", help="Ergebnis zusätzlich als JSON in diese Datei schreiben")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    changelog_file = Path(args.changelog_file).resolve() if args.changelog_file else None
+    json_report = Path(args.json_report).resolve() if args.json_report else None
+    set_project_root(args.project_root)
+
+    engine = ReleaseEngine(CliCallbacks(assume_yes=args.yes, rollback=not args.no_rollback))
+
+    if args.docs_commit:
+        docs = get_changed_files_info()['docs']
+        result = engine.documentation_commit(args.docs_commit, docs, test_mode=args.dry_run)
+    elif args.resume:
+        plan = engine.plan_resume()
+        if plan is None:
+            print("Kein abgebrochener Release gefunden.")
+            return 1
+        if plan['params'] is None:
+            print(f"Journal enthält keine Release-Eingaben: {plan['checkpoint'].journal.path}", file=sys.stderr)
+            return 1
+        if plan['pending'] and not engine.callbacks.confirm("Release fortsetzen", engine.describe_resume(plan)):
+            return 2
+        result = engine.resume(plan)
+    else:
+        current_version = read_module_version("scripts/constants.cjs")
+        try:
+            if current_version and parse_version(args.version) <= parse_version(current_version):
+                print(f"Neue Version {args.version} muss größer als aktuelle Version {current_version} sein!",
+                      file=sys.stderr)
+                return 1
+        except ValueError:
+            print(f"Ungültige Version: {args.version}", file=sys.stderr)
+            return 1
+
+        changes = load_changes(changelog_file)
+        options = {option: option not in args.skip for option in RELEASE_OPTIONS}
+        params = build_release_params(args.version, changes, args.remark, options, args.date)
+        result = engine.run(params, test_mode=args.dry_run, isolated=args.worktree)
+
+    if 'timings' in result:
+        print_summary(result, engine)
+    if json_report:
+        json_report.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8')
+    return exit_code(result)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
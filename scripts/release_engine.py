@@ -0,0 +1,1065 @@
+#!/usr/bin/env python3
+"""
+UI-unabhängige Release-Pipeline.
+
+Die ReleaseEngine enthält die zehn Release-Schritte sowie den Dokumentations-Commit.
+Rückfragen, Fortschritt und Meldungen laufen über ein ReleaseCallbacks-Objekt, sodass
+dieselbe Pipeline von der GUI (release_gui.py), der CLI (release_cli.py) und aus
+Benchmarks gegen ein Fixture-Repository genutzt werden kann.
+"""
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from pathlib import Path
+
+from release_utils import (
+    update_version_in_file, run_command, update_metadata, remove_bom_in_paths,
+    verify_metadata_update, build_unreleased_section, replace_unreleased_section,
+    render_release_documentation,
+    create_release_checkpoint, check_git_repository_status, push_tags_smartly,
+    validate_release_prerequisites, find_resumable_checkpoint,
+    verify_release_journal, hash_files, git_rev_parse, stream_command,
+    BUILD_INPUTS, BUILD_MODE, BUILD_STAMP, build_stamp_mismatch, compute_build_hash, is_build_current,
+    read_build_stamp, refresh_build_stamp, write_build_stamp,
+    GitCommitBuilder, ReleaseWorktree, get_worktree_changes, set_project_root,
+    OverlayFS, set_overlay, read_project_file, write_project_file, glob_project_files, to_project_path,
+    log, log_buffer
+)
+from generate_changelog import ChangelogModel, generate_changelog
+from package_module import (
+    PACKAGE_DIR, PACKAGE_NAME, build_module_zip, collect_package_members, verify_module_assets
+)
+
+# Reihenfolge entspricht den Checkboxen der GUI
+RELEASE_OPTIONS = [
+    'build',
+    'update_constants',
+    'update_metadata',
+    'remove_bom',
+    'update_docs',
+    'package',
+    'verify_assets',
+    'git_add',
+    'git_commit',
+    'git_tag',
+    'git_push',
+]
+
+
+# Nicht versionierte Ausgaben der Schritte, die ein isolierter Release aus dem
+# temporären Worktree in den Checkout übernimmt
+ISOLATED_OUTPUTS = [PACKAGE_DIR]
+
+# Von der BOM-Entfernung (Schritt 3) durchsuchte Pfade
+BOM_PATHS = ["src/", "dist/", "templates/", "styles/", "lang/", "module.json", "package.json"]
+
+
+class ReleaseCancelled(Exception):
+    """Wird ausgelöst, wenn der Release zwischen zwei Schritten abgebrochen wird."""
+
+
+class ReleaseCallbacks:
+    """Schnittstelle zwischen ReleaseEngine und Oberfläche.
+
+    Die Standard-Implementierung bejaht alle Rückfragen und loggt Meldungen nur;
+    GUI und CLI überschreiben die Methoden.
+    """
+
+    def confirm(self, title, message):
+        """Stellt eine Ja/Nein-Frage. Returns: bool"""
+        return True
+
+    def confirm_rollback(self, title, message):
+        """Fragt nach einem Rollback nach Fehler oder Abbruch. Returns: bool"""
+        return self.confirm(title, message)
+
+    def notify(self, level, title, message):
+        """Zeigt eine Meldung an (level: 'info', 'warning' oder 'error')."""
+        log(f"\n[{level.upper()}] {title}: {message}")
+
+    def status(self, text):
+        """Meldet den aktuell laufenden Schritt."""
+
+    def progress(self, done, total):
+        """Meldet den Fortschritt (abgeschlossene von insgesamt auszuführenden Schritten)."""
+
+    def version_changed(self, version):
+        """Wird aufgerufen, nachdem scripts/constants.cjs aktualisiert wurde."""
+
+
+class ReleaseStep:
+    """Ein Schritt der Release-Pipeline.
+
+    `reads` und `writes` beschreiben die Ressourcen des Schritts für den Scheduler:
+    Dateipfade, Verzeichnisse mit abschließendem '/', Git-Ressourcen ('git:index',
+    'git:HEAD', ...), In-Memory-Zustand ('mem:changelog') oder '*' für "alles im
+    Arbeitsverzeichnis".
+    """
+
+    def __init__(self, step_id, option, title, done_msg, label, paths, handler, reads=(), writes=None):
+        """
+        Args:
+            step_id (int): Nummer des Schritts (0-12; 0 = Build, 11/12 = Paket und Asset-Prüfung)
+            option (str): Schlüssel in params['options'], der den Schritt aktiviert
+            title (str): Überschrift im Log
+            done_msg (str): Erfolgsmeldung im Log
+            label (str): Anzeigename im Journal
+            paths (list or callable): Dateien, die der Schritt schreibt (oder Funktion der Parameter)
+            handler (callable): Erhält die Release-Parameter und gibt optional
+                                {'files': [...], 'git': {...}} zurück
+            reads (iterable): Gelesene Ressourcen
+            writes (iterable, optional): Geschriebene Ressourcen (Standard: paths, falls Liste)
+        """
+        self.step_id = step_id
+        self.option = option
+        self.title = title
+        self.done_msg = done_msg
+        self.label = label
+        self.paths = paths
+        self.handler = handler
+        self.reads = set(reads)
+        self.writes = set(writes if writes is not None else ([] if callable(paths) else paths))
+
+    def get_paths(self, params):
+        return self.paths(params) if callable(self.paths) else list(self.paths)
+
+
+def _resources_overlap(a, b):
+    """Prüft, ob zwei Ressourcen (Datei, Verzeichnis/, '*' oder 'art:name') sich überschneiden."""
+    if a == b:
+        return True
+    if ':' in a or ':' in b:
+        return False
+    if a == '*' or b == '*':
+        return True
+    return (a.endswith('/') and b.startswith(a)) or (b.endswith('/') and a.startswith(b))
+
+
+def _steps_conflict(earlier, later):
+    """Zwei Schritte kollidieren, wenn einer schreibt, was der andere liest oder schreibt."""
+    for written in earlier.writes:
+        if any(_resources_overlap(written, r) for r in later.reads | later.writes):
+            return True
+    for read in earlier.reads:
+        if any(_resources_overlap(read, w) for w in later.writes):
+            return True
+    return False
+
+
+def build_step_graph(steps):
+    """Leitet aus den Lese-/Schreibmengen den Abhängigkeitsgraphen (DAG) der Schritte ab.
+
+    Kollidierende Schritte behalten ihre deklarierte Reihenfolge; alle anderen dürfen
+    parallel laufen.
+
+    Returns:
+        dict: {step_id: set(step_ids, die vorher abgeschlossen sein müssen)}
+    """
+    graph = {}
+    for index, step in enumerate(steps):
+        graph[step.step_id] = {
+            earlier.step_id for earlier in steps[:index] if _steps_conflict(earlier, step)
+        }
+    return graph
+
+
+def default_release_options():
+    """Gibt die Standard-Optionen zurück (alle Schritte aktiv)."""
+    return {option: True for option in RELEASE_OPTIONS}
+
+
+def build_release_params(version, changes, remark="", options=None, date=None):
+    """Erstellt das Parameter-Dict eines Release-Laufs.
+
+    Args:
+        version (str): Neue Versionsnummer
+        changes (dict): Changelog-Texte (added, changed, fixed, known, upgrade)
+        remark (str): Optionale Commit-Bemerkung
+        options (dict, optional): Aktivierte Schritte (Standard: alle)
+        date (str, optional): Release-Datum YYYY-MM-DD (Standard: heute)
+    """
+    params = {key: changes.get(key, "") for key in ("added", "changed", "fixed", "known", "upgrade")}
+    params['remark'] = remark or ""
+    params['version'] = version
+    params['date'] = date or datetime.now().strftime("%Y-%m-%d")
+    params['options'] = dict(default_release_options(), **(options or {}))
+    return params
+
+
+class ReleaseEngine:
+    """Führt Releases und Dokumentations-Commits ohne Abhängigkeit zu einer Oberfläche aus."""
+
+    # Höchstzahl gleichzeitig laufender Release-Schritte
+    MAX_PARALLEL_STEPS = 4
+
+    def __init__(self, callbacks=None, max_workers=None):
+        self.callbacks = callbacks or ReleaseCallbacks()
+        self.max_workers = max_workers or self.MAX_PARALLEL_STEPS
+        self._cancel_event = threading.Event()
+        # Gemeinsamer Stand von CHANGELOG.md und Release Notes (Schritte 4-6)
+        self._changelog = None
+        # Von den Schritten geschriebene Dateien und Git-Zwischenstände (Schritte 7-9)
+        self._checkpoint = None
+        self._release_files = set()
+        self._staged = None
+        self._release_commit = None
+        # Ergebnisse von Build (Schritt 0) und BOM-Entfernung (Schritt 3) für die Asset-Prüfung
+        self._build_pending = False
+        self._bom_report = []
+        # Nur während eines isolierten Releases gesetzt (siehe run(isolated=True))
+        self._worktree = None
+        # Nur während eines Testlaufs gesetzt: Datei-Overlay und aufgezeichnete Git-Befehle
+        self._overlay = None
+        self._recorded_commands = None
+
+    def cancel(self):
+        """Fordert den Abbruch nach dem aktuell laufenden Schritt an."""
+        self._cancel_event.set()
+
+    def _new_result(self, params):
+        return {
+            'success': False,
+            'version': params.get('version'),
+            'completed': [],
+            'skipped': [],
+            'timings': {},
+            'duration': 0.0,
+            'cancelled': False,
+            'rolled_back': False,
+            'error': None,
+            'log_path': None
+        }
+
+    # ========== Schritte ==========
+
+    def steps(self):
+        """Gibt die Release-Schritte in Ausführungsreihenfolge zurück."""
+        return [
+            # Vorab-Schritt: dist/ nur neu bauen, wenn sich die Build-Eingaben geändert haben
+            ReleaseStep(0, 'build', "Prüfe Build-Stand (dist/)...",
+                        "Build-Stand aktuell", "0. Build geprüft",
+                        [BUILD_STAMP], self._step_build,
+                        reads=BUILD_INPUTS, writes=["dist/"]),
+            ReleaseStep(1, 'update_constants', "Aktualisiere Version in scripts/constants.cjs...",
+                        "constants.cjs erfolgreich aktualisiert", "1. Konstantendatei aktualisiert",
+                        ["scripts/constants.cjs"], self._step_update_constants,
+                        reads=["scripts/constants.cjs"]),
+            ReleaseStep(2, 'update_metadata', "Aktualisiere Metadaten...",
+                        "Metadaten erfolgreich aktualisiert", "2. Metadaten aktualisiert",
+                        ["module.json", "package.json", "package-lock.json"], self._step_update_metadata,
+                        reads=["module.json", "package.json", "package-lock.json"]),
+            ReleaseStep(3, 'remove_bom', "Entferne BOM aus Projektdateien...",
+                        "BOM-Entfernung abgeschlossen", "3. BOM entfernt",
+                        [], self._step_remove_bom,
+                        reads=BOM_PATHS, writes=BOM_PATHS),
+            # Schritte 4-6 arbeiten auf einem gemeinsamen ChangelogModel im Speicher;
+            # CHANGELOG.md wird nur von Schritt 6 geschrieben.
+            ReleaseStep(4, 'update_docs', "Übernehme Changelog-Eingaben in die Unreleased-Sektion...",
+                        "Unreleased-Sektion aktualisiert", "4. Unreleased-Sektion geschrieben",
+                        [], self._step_write_unreleased,
+                        reads=["CHANGELOG.md"], writes=["mem:changelog"]),
+            ReleaseStep(5, 'update_docs', "Aktualisiere Dokumentation...",
+                        "Dokumentation erfolgreich aktualisiert", "5. Dokumentation aktualisiert",
+                        lambda params: [f"docs/releases/v{params['version']}.md"],
+                        self._step_update_documentation,
+                        reads=["mem:changelog"], writes=["mem:changelog", "docs/releases/"]),
+            ReleaseStep(6, 'update_docs', "Generiere CHANGELOG.md aus Release-Notes...",
+                        "CHANGELOG.md erfolgreich regeneriert", "6. CHANGELOG regeneriert",
+                        ["CHANGELOG.md"], self._step_generate_changelog,
+                        reads=["mem:changelog"], writes=["CHANGELOG.md"]),
+            ReleaseStep(11, 'package', "Packe module.zip...",
+                        "module.zip erstellt", "11. module.zip gepackt",
+                        [], self._step_package,
+                        reads=["module.json", "dist/", "lang/", "styles/", "templates/"],
+                        writes=[PACKAGE_DIR + "/"]),
+            # Vor dem Push: alle in module.json referenzierten Dateien prüfen
+            ReleaseStep(12, 'verify_assets', "Prüfe Assets aus module.json...",
+                        "Assets geprüft", "12. Assets geprüft",
+                        [], self._step_verify_assets,
+                        reads=["module.json", "dist/", "lang/", "styles/", "templates/", PACKAGE_DIR + "/"],
+                        writes=["mem:assets"]),
+            ReleaseStep(7, 'git_add', "Git-Änderungen stagen...",
+                        "Git add erfolgreich", "7. Git add",
+                        [], self._step_git_add,
+                        reads=["*"], writes=["git:index"]),
+            ReleaseStep(8, 'git_commit', "Git-Änderungen committen...",
+                        "Git commit erfolgreich", "8. Git commit",
+                        [], self._step_git_commit,
+                        reads=["git:index"], writes=["git:HEAD"]),
+            ReleaseStep(9, 'git_tag', "Git-Tag erstellen...",
+                        "Git tag erfolgreich", "9. Git tag",
+                        [], self._step_git_tag,
+                        reads=["git:HEAD"], writes=["git:tags"]),
+            ReleaseStep(10, 'git_push', "Änderungen hochladen...",
+                        "Git push erfolgreich", "10. Git push",
+                        [], self._step_git_push,
+                        reads=["git:HEAD", "git:tags", "mem:assets"], writes=["git:remote"]),
+        ]
+
+    def _step_build(self, params):
+        build_hash = compute_build_hash()
+        mismatch = build_stamp_mismatch(build_hash)
+        if mismatch is None:
+            log(f"  dist/ ist aktuell (Build-Hash {build_hash[:12]}, {BUILD_MODE}), Build übersprungen")
+            return {}
+        log(f"  {mismatch} (Build-Hash {build_hash[:12]}), baue neu...")
+        if self._recorded_commands is not None:
+            self._recorded_commands.append("npm run build")
+            log("    $ npm run build")
+            self._build_pending = True
+            return {}
+        # Vorher versionierte Build-Dateien mitnehmen, damit umbenannte Assets entfernt werden
+        previous = subprocess.run(
+            ['git', 'ls-files', '-z', '--', 'dist/'],
+            capture_output=True, text=True, cwd=Path.cwd(), check=False
+        ).stdout.split('\0')
+        if not run_command("npm run build"):
+            raise Exception("npm run build fehlgeschlagen")
+        write_build_stamp(build_hash)
+        built = [path.as_posix() for path in Path("dist").rglob('*') if path.is_file()]
+        return {'files': sorted(set(filter(None, previous)) | set(built))}
+
+    def _step_update_constants(self, params):
+        update_version_in_file("scripts/constants.cjs", params['version'])
+        if self._overlay is None:
+            self.callbacks.version_changed(params['version'])
+
+    def _step_update_metadata(self, params):
+        update_metadata(params['version'])
+        if not verify_metadata_update(params['version']):
+            raise Exception("Fehler beim Aktualisieren der Metadaten!")
+
+    def _step_remove_bom(self, params):
+        """Entfernt BOMs aus BOM_PATHS (inklusive dist/).
+
+        Läuft nach dem Build (Schritt 0): Wurden dabei Dateien in dist/ geändert, werden
+        ihre Hashes im Build-Stempel nachgezogen, damit die Asset-Prüfung (Schritt 12)
+        den Build nicht als veraltet meldet. Im Testlauf bleibt dist/ auf der Platte
+        unverändert und der Stempel damit gültig.
+        """
+        modified = remove_bom_in_paths([path.rstrip('/') for path in BOM_PATHS])
+        self._bom_report = modified
+        files = list(modified)
+        built = [path for path in modified if to_project_path(path).startswith('dist/')]
+        if built and self._overlay is None and refresh_build_stamp(built):
+            log(f"  Build-Stempel für {len(built)} Datei(en) in dist/ nachgezogen")
+            files.append(BUILD_STAMP)
+        return {'files': files}
+
+    def _changelog_model(self, params):
+        """Gibt das gemeinsame ChangelogModel der Schritte 4-6 zurück.
+
+        Beim ersten Zugriff werden CHANGELOG.md und die Release Notes einmal gelesen und
+        die Changelog-Eingaben übernommen (idempotent, damit auch ein Resume ab Schritt 5
+        oder 6 denselben Stand sieht).
+        """
+        if self._changelog is None:
+            release_notes = {
+                Path(path).stem: read_project_file(path)
+                for path in glob_project_files("docs/releases", "v*.md")
+            }
+            model = ChangelogModel.parse(read_project_file("CHANGELOG.md"), release_notes)
+            section = build_unreleased_section(params['added'], params['changed'], params['fixed'],
+                                               params['known'], params['upgrade'])
+            model.text = replace_unreleased_section(model.text, section)
+            self._changelog = model
+        return self._changelog
+
+    def _step_write_unreleased(self, params):
+        self._changelog = None
+        self._changelog_model(params)
+
+    def _step_update_documentation(self, params):
+        model = self._changelog_model(params)
+        model.text, release_notes = render_release_documentation(model.text, params['version'], params['date'])
+        write_project_file(Path("docs/releases") / f"v{params['version']}.md", release_notes)
+        model.set_release_notes(f"v{params['version']}", release_notes)
+
+    def _step_generate_changelog(self, params):
+        write_project_file("CHANGELOG.md", generate_changelog(self._changelog_model(params)))
+
+    def _run_git(self, command):
+        """Führt einen (verändernden) Git-Befehl aus; im Testlauf wird er nur aufgezeichnet."""
+        if self._recorded_commands is not None:
+            self._recorded_commands.append(command)
+            log(f"    $ {command}")
+            return True
+        return run_command(command)
+
+    def _commit_builder(self):
+        return GitCommitBuilder(record=self._recorded_commands)
+
+    def _release_paths(self, params):
+        """Dateien für den Release-Commit: Änderungen bei Release-Start plus alle von Schritten geschriebenen."""
+        return sorted(set(params.get('worktree_files', [])) | self._release_files)
+
+    def _journal_git(self, step_id):
+        """Git-Ergebnisse eines bereits journalisierten Schritts (Resume)."""
+        if self._checkpoint is None:
+            return {}
+        record = self._checkpoint.journal.completed_steps().get(step_id, {})
+        return record.get('outputs', {}).get('git', {})
+
+    def _package_path(self):
+        """module.zip im Checkout des Entwicklers (isoliert: außerhalb des temporären Worktrees)."""
+        root = self._worktree.root if self._worktree else Path.cwd()
+        return root / PACKAGE_DIR / PACKAGE_NAME
+
+    def _step_package(self, params):
+        if self._overlay is not None:
+            members = collect_package_members()
+            log(f"  module.zip würde {len(members)} Datei(en) enthalten (wird im Test-Modus nicht gebaut)")
+            return {}
+        package = build_module_zip(output=self._package_path(), workers=self.max_workers)
+        log(f"  {package['path']}: {len(package['members'])} Dateien, {package['size']} Bytes "
+            f"({package['compressed']} komprimiert, {package['reused']} übernommen)")
+        log(f"  SHA-256: {package['sha256']}")
+        return {}
+
+    def _step_verify_assets(self, params):
+        if self._build_pending:
+            build_stamp = build_current = None  # Testlauf: der Build würde erst noch laufen
+        else:
+            build_stamp = read_build_stamp()
+            build_current = is_build_current() if build_stamp else None
+        overrides = None
+        if self._overlay is not None:
+            # Testlauf: geänderte Dateien aus dem Overlay prüfen, module.zip wurde nicht gebaut
+            overrides = {path: read_project_file(path).encode('utf-8') for path in self._overlay.changed_files()}
+        report = verify_module_assets(build_current=build_current, bom_report=self._bom_report,
+                                      workers=self.max_workers, overrides=overrides,
+                                      check_package=self._overlay is None, build_stamp=build_stamp,
+                                      package=self._package_path())
+        for warning in report['warnings']:
+            log(f"  ⚠️  {warning}")
+        log(f"  {report['checked']} Dateien geprüft in {report['duration']:.3f}s")
+        if not report['success']:
+            raise Exception("Asset-Prüfung fehlgeschlagen:\n" +
+                            "\n".join(f"  • {issue}" for issue in report['issues']))
+        return {}
+
+    def _step_git_add(self, params):
+        paths = self._release_paths(params)
+        log(f"  Stage {len(paths)} Datei(en) in temporärem Index...")
+        base = git_rev_parse('HEAD')
+        tree = self._commit_builder().stage(paths, base)
+        self._staged = {'tree': tree, 'base': base}
+        return {'git': dict(self._staged)}
+
+    def _step_git_commit(self, params):
+        new_version = params['version']
+        remark = params['remark']
+        added, changed, fixed = params['added'], params['changed'], params['fixed']
+        commit_message = f"release: v{new_version}"
+        if remark:
+            commit_message += f" - {remark}"
+        commit_message += "\n\n"
+        if added and added.strip():
+            commit_message += "### Hinzugefügt\n" + added + "\n\n"
+        if changed and changed.strip():
+            commit_message += "### Geändert\n" + changed + "\n\n"
+        if fixed and fixed.strip():
+            commit_message += "### Fehlerbehebungen\n" + fixed + "\n\n"
+
+        builder = self._commit_builder()
+        staged = self._staged or self._journal_git(7)
+        if not staged.get('tree'):
+            # Schritt 7 deaktiviert: direkt aus den Release-Dateien stagen
+            base = git_rev_parse('HEAD')
+            staged = {'tree': builder.stage(self._release_paths(params), base), 'base': base}
+
+        # Commit-Objekt bauen und HEAD nur umsetzen, wenn er noch auf der Basis steht
+        commit = builder.commit(staged['tree'], commit_message, staged['base'])
+        try:
+            builder.update_ref('HEAD', commit, staged['base'], reason=f"release: v{new_version}")
+        except RuntimeError as e:
+            raise Exception(f"Git commit fehlgeschlagen: HEAD wurde seit dem Stagen verändert ({e})")
+        builder.sync_index(self._release_paths(params))
+        self._release_commit = commit
+        log(f"  Commit {commit}")
+        if self._worktree:
+            try:
+                self._worktree.fast_forward(commit)
+            except RuntimeError as e:
+                raise Exception(f"Fast-Forward von {self._worktree.branch} auf Release-Commit "
+                                f"{commit} fehlgeschlagen ({e})")
+        return {'git': {'commit': commit}}
+
+    def _step_git_tag(self, params):
+        new_version = params['version']
+        tag_message = f"Release v{new_version}"
+        if params['remark']:
+            tag_message += f" - {params['remark']}"
+        # Vorherigen Tag merken, damit ein Rollback ihn wiederherstellen kann (überschreibt wie tag -f)
+        previous_object = git_rev_parse(f"refs/tags/v{new_version}")
+        target = self._release_commit or git_rev_parse('HEAD')
+        tag_object = self._commit_builder().tag(f"v{new_version}", target, tag_message)
+        return {'git': {
+            'tag': f"v{new_version}",
+            'object': tag_object,
+            'previous_object': previous_object
+        }}
+
+    def _step_git_push(self, params):
+        # Pushe zuerst den Branch (im isolierten Worktree ist HEAD detached)
+        if self._worktree:
+            current_branch = self._worktree.branch
+        else:
+            branch_result = subprocess.run(
+                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
+                capture_output=True,
+                text=True,
+                cwd=Path.cwd(),
+                check=True
+            )
+            current_branch = branch_result.stdout.strip()
+
+        log(f"  Pushe Branch {current_branch}...")
+        if not self._run_git(f"git push origin {current_branch}"):
+            raise Exception("Git push (Branch) fehlgeschlagen")
+
+        # Pushe Tags intelligent (nur neue Tags)
+        tag_name = f"v{params['version']}"
+        log(f"  Pushe Tag {tag_name}...")
+        if self._recorded_commands is not None:
+            self._run_git(f"git push origin {tag_name}")
+            return {}
+        tag_push_result = push_tags_smartly(tag_name)
+
+        if not tag_push_result['success']:
+            # Wenn kritische Fehler aufgetreten sind
+            if tag_push_result['failed']:
+                error_msg = "Fehler beim Pushen von Tags:\n"
+                error_msg += "\n".join(tag_push_result['errors'])
+                raise Exception(error_msg)
+
+        # Zeige Zusammenfassung
+        if tag_push_result['pushed']:
+            log(f"  ✅ {len(tag_push_result['pushed'])} Tag(s) erfolgreich gepusht")
+        if tag_push_result['skipped']:
+            log(f"  ⏭️  {len(tag_push_result['skipped'])} Tag(s) übersprungen (bereits im Remote)")
+        if tag_push_result['failed']:
+            log(f"  ❌ {len(tag_push_result['failed'])} Tag(s) fehlgeschlagen")
+        return {'git': {'branch': current_branch}}
+
+    # ========== Release ==========
+
+    def run(self, params, test_mode=False, isolated=False):
+        """Führt Pre-Release-Prüfungen, Checkpoint und alle aktivierten Schritte aus.
+
+        Args:
+            params (dict): Siehe build_release_params()
+            test_mode (bool): Nur simulieren
+            isolated (bool): In einem temporären Worktree releasen (siehe _run_isolated())
+
+        Returns:
+            dict: Ergebnis (success, completed, timings, duration, cancelled, rolled_back, error, ...)
+        """
+        new_version = params['version']
+        result = self._new_result(params)
+        log(f"\nStarte {'Test-' if test_mode else ''}Release-Prozess für Version {new_version}")
+
+        # Pre-Release-Prüfungen (nur im echten Modus)
+        if not test_mode:
+            log("\n🔍 Führe Pre-Release-Prüfungen durch...")
+            validation = validate_release_prerequisites(new_version, use_cache=True)
+
+            # Zeige Warnungen
+            if validation['warnings']:
+                warning_msg = "⚠️ Warnungen vor dem Release:\n\n"
+                warning_msg += "\n".join(f"• {w}" for w in validation['warnings'])
+                warning_msg += "\n\nMöchten Sie trotzdem fortfahren?"
+
+                if not self.callbacks.confirm("Warnungen", warning_msg):
+                    result['cancelled'] = True
+                    return result
+
+            # Zeige kritische Probleme
+            if validation['issues']:
+                error_msg = "❌ Kritische Probleme gefunden:\n\n"
+                error_msg += "\n".join(f"• {issue}" for issue in validation['issues'])
+                error_msg += "\n\nBitte beheben Sie diese Probleme vor dem Release."
+
+                self.callbacks.notify('error', "Release blockiert", error_msg)
+                result['error'] = "; ".join(validation['issues'])
+                return result
+
+            log("  ✅ Alle Pre-Release-Prüfungen bestanden")
+
+        # Bestätigung
+        confirmation = f"Release für Version {new_version} erstellen?\n\n"
+        if test_mode:
+            confirmation = "TEST-MODUS: Keine Dateien werden geändert!\n\n" + confirmation
+
+        if not self.callbacks.confirm("Bestätigung", confirmation):
+            result['cancelled'] = True
+            return result
+
+        if isolated and not test_mode:
+            return self._run_isolated(params, result)
+
+        # Bereits vorhandene Änderungen (z.B. Code) gehören mit in den Release-Commit;
+        # über das Journal bleiben sie auch beim Resume bekannt
+        params['worktree_files'] = get_worktree_changes()
+
+        # Erstelle Checkpoint für Rollback
+        checkpoint = None
+        if not test_mode:
+            checkpoint = create_release_checkpoint(new_version)
+            checkpoint.record_release_start(params)
+            log_buffer.attach_file(checkpoint.log_path)
+
+        return self.run_steps(params, checkpoint, test_mode=test_mode)
+
+    def _run_isolated(self, params, result):
+        """Führt die Schritte in einem temporären Worktree auf HEAD aus.
+
+        Der Checkout des Entwicklers bleibt während des Releases unverändert; erst
+        nach dem Commit (Schritt 8) wird sein Branch per Fast-Forward nachgezogen.
+        Es gibt weder Checkpoint noch Rollback: bei Fehlern wird der Worktree
+        einfach verworfen. Nicht committete Änderungen sind nicht Teil des Releases.
+        Ausgaben außerhalb von Git (ISOLATED_OUTPUTS, z.B. release-artifacts/ mit
+        module.zip) werden vor dem Entfernen in den Checkout kopiert - auch nach
+        Fehlern, wie sie ein nicht isolierter Lauf ebenfalls zurücklässt.
+        """
+        if not params['options'].get('git_commit'):
+            result['error'] = "Isolierter Release benötigt den Schritt 'Git commit'"
+            self.callbacks.notify('error', "Fehler", result['error'])
+            return result
+
+        uncommitted = get_worktree_changes()
+        if uncommitted:
+            log(f"  Hinweis: {len(uncommitted)} nicht committete Datei(en) bleiben im Checkout "
+                f"und sind nicht Teil des Releases")
+        params['worktree_files'] = []
+
+        try:
+            self._worktree = ReleaseWorktree.create(params['version'])
+        except RuntimeError as e:
+            result['error'] = str(e)
+            self.callbacks.notify('error', "Fehler", f"Worktree konnte nicht angelegt werden: {e}")
+            return result
+
+        worktree = self._worktree
+        package = self._package_path()
+        set_project_root(worktree.path)
+        try:
+            result = self.run_steps(params, None)
+        finally:
+            set_project_root(worktree.root)
+            try:
+                for rel in worktree.copy_back(ISOLATED_OUTPUTS):
+                    log(f"  {rel} aus dem Worktree in den Checkout übernommen")
+            except OSError as e:
+                log(f"  ⚠️  Ausgaben konnten nicht aus dem Worktree kopiert werden ({e})")
+            worktree.remove()
+            self._worktree = None
+
+        # Das Paket muss den Worktree überdauern (der Tag ist bereits gepusht)
+        if result['success'] and params['options'].get('package') and not package.is_file():
+            result['success'] = False
+            result['error'] = f"{package} fehlt nach dem isolierten Release"
+            self.callbacks.notify('error', "Fehler", result['error'])
+        return result
+
+    def plan_resume(self):
+        """Ermittelt, ob und ab welchem Schritt ein abgebrochener Release fortgesetzt werden kann.
+
+        Returns:
+            dict or None: {
+                'checkpoint': ReleaseCheckpoint,
+                'params': dict,  # Eingaben des ursprünglichen Laufs (None wenn nicht im Journal)
+                'verification': dict,  # Siehe verify_release_journal()
+                'skip_steps': set,
+                'pending': list  # Noch auszuführende ReleaseSteps
+            }
+        """
+        checkpoint = find_resumable_checkpoint()
+        if checkpoint is None:
+            return None
+
+        params = checkpoint.get_release_params()
+        plan = {
+            'checkpoint': checkpoint,
+            'params': params,
+            'verification': None,
+            'skip_steps': set(),
+            'pending': []
+        }
+        if params is None:
+            return plan
+
+        plan['verification'] = verify_release_journal(checkpoint.journal)
+        plan['skip_steps'] = set(plan['verification']['verified'])
+        plan['pending'] = [
+            step for step in self.steps()
+            if params['options'].get(step.option) and step.step_id not in plan['skip_steps']
+        ]
+        return plan
+
+    def describe_resume(self, plan):
+        """Formuliert die Rückfrage für einen Resume-Plan."""
+        params = plan['params']
+        message = f"Abgebrochenen Release für Version {params['version']} fortsetzen?\n\n"
+        message += f"Übersprungene Schritte: {', '.join(str(s) for s in sorted(plan['skip_steps'])) or 'keine'}\n"
+        message += f"Fortsetzen ab: {plan['pending'][0].label}\n"
+        if plan['verification']['diverged']:
+            message += "\n⚠️ Seit dem Abbruch geändert (Schritte werden wiederholt):\n"
+            message += "\n".join(f"  • {d}" for d in plan['verification']['diverged'][:10])
+        return message
+
+    def resume(self, plan):
+        """Setzt einen Release gemäß plan_resume() fort.
+
+        Returns:
+            dict: Ergebnis wie bei run()
+        """
+        checkpoint = plan['checkpoint']
+        params = plan['params']
+        if not plan['pending']:
+            log(f"\nAlle Schritte für Version {params['version']} sind bereits abgeschlossen.")
+            checkpoint.mark_release_completed()
+            result = self._new_result(params)
+            result['success'] = True
+            result['skipped'] = sorted(plan['skip_steps'])
+            return result
+
+        log_buffer.attach_file(checkpoint.log_path)
+        log(f"\nSetze Release-Prozess für Version {params['version']} fort "
+            f"(Journal: {checkpoint.journal.path})")
+        return self.run_steps(params, checkpoint, skip_steps=plan['skip_steps'])
+
+    def run_steps(self, params, checkpoint, test_mode=False, skip_steps=()):
+        """Führt die Release-Schritte aus und protokolliert sie im Journal.
+
+        Unabhängige Schritte laufen parallel (siehe build_step_graph()); ein Abbruch-Wunsch
+        (cancel()) wird geprüft, bevor weitere Schritte gestartet werden.
+
+        Im Test-Modus laufen die echten Schritte gegen ein OverlayFS im Speicher; verändernde
+        Git-Befehle werden nur aufgezeichnet. Das Ergebnis enthält dann 'diff',
+        'changed_files' und 'git_commands'.
+
+        Args:
+            params (dict): Release-Parameter (Version, Datum, Changelog-Texte, Optionen)
+            checkpoint (ReleaseCheckpoint): Checkpoint für Journal und Rollback (None im Test-Modus)
+            test_mode (bool): Nur simulieren
+            skip_steps (iterable): Bereits verifizierte Schritte (Resume)
+
+        Returns:
+            dict: Ergebnis wie bei run()
+        """
+        new_version = params['version']
+        result = self._new_result(params)
+        result['log_path'] = str(checkpoint.log_path) if checkpoint else None
+        steps = [step for step in self.steps() if params['options'].get(step.option)]
+        started = time.perf_counter()
+        self._checkpoint = checkpoint
+        self._release_files = set()
+        self._staged = None
+        self._release_commit = None
+        self._build_pending = False
+        self._bom_report = []
+        if checkpoint:
+            # Beim Resume zählen die Dateien bereits abgeschlossener Schritte mit
+            for step_id, record in checkpoint.journal.completed_steps().items():
+                if step_id in skip_steps:
+                    self._release_files.update(record.get('outputs', {}).get('files', {}))
+        if test_mode:
+            self._overlay = OverlayFS()
+            self._recorded_commands = []
+            set_overlay(self._overlay)
+        try:
+            self._schedule_steps(steps, params, checkpoint, test_mode, skip_steps, result)
+            if test_mode:
+                self._report_dry_run(result)
+
+            # Erfolgreich abgeschlossen - Cleanup
+            if checkpoint:
+                checkpoint.mark_release_completed()
+                checkpoint.cleanup()
+
+            result['success'] = True
+            result['duration'] = time.perf_counter() - started
+            log("\nRelease-Prozess erfolgreich abgeschlossen!" + (" (TEST-MODUS)" if test_mode else ""))
+            if test_mode:
+                self.callbacks.notify('info', "Erfolg",
+                                      f"Test-Simulation erfolgreich!\n\n"
+                                      f"{len(result['changed_files'])} Datei(en) würden geändert, "
+                                      f"{len(result['git_commands'])} Git-Befehl(e) ausgeführt.\n"
+                                      f"Diffs und Befehle stehen im Protokoll.")
+            else:
+                self.callbacks.notify('info', "Erfolg", f"Release für Version {new_version} erfolgreich!")
+        except Exception as e:
+            result['duration'] = time.perf_counter() - started
+            cancelled = isinstance(e, ReleaseCancelled)
+            result['cancelled'] = cancelled
+            result['error'] = str(e)
+            if cancelled:
+                log(f"\n{e}")
+            else:
+                log(f"\nFehler beim Release-Prozess: {str(e)}")
+            self._offer_rollback(checkpoint, e, cancelled, test_mode, result)
+        finally:
+            if test_mode:
+                set_overlay(None)
+                self._overlay = None
+                self._recorded_commands = None
+            if log_buffer.log_path:
+                log(f"\nVollständiges Log: {log_buffer.log_path}")
+            log_buffer.detach_file()
+        return result
+
+    def _report_dry_run(self, result):
+        """Loggt die Diffs und Git-Befehle eines Testlaufs und legt sie im Ergebnis ab."""
+        result['changed_files'] = self._overlay.changed_files()
+        result['diff'] = self._overlay.diff()
+        result['git_commands'] = list(self._recorded_commands)
+
+        log(f"\n===== Geänderte Dateien ({len(result['changed_files'])}) =====")
+        for path in result['changed_files']:
+            log(f"  {path}")
+        if result['diff']:
+            log("")
+            log(result['diff'].rstrip("\n"))
+        log(f"\n===== Git-Befehle ({len(result['git_commands'])}) =====")
+        for command in result['git_commands']:
+            log(f"  $ {command}")
+
+    def _schedule_steps(self, steps, params, checkpoint, test_mode, skip_steps, result):
+        """Startet jeden Schritt, sobald alle kollidierenden Vorgänger abgeschlossen sind.
+
+        Schlägt ein Schritt fehl oder wird abgebrochen, werden keine neuen Schritte mehr
+        gestartet; bereits laufende Schritte werden noch zu Ende geführt (und journalisiert),
+        damit Journal und Arbeitsverzeichnis zueinander passen.
+        """
+        graph = build_step_graph(steps)
+        done = set()
+        running = {}
+        error = None
+
+        for step in steps:
+            if step.step_id in skip_steps:
+                log(f"\n{step.step_id}. {step.title} übersprungen (bereits abgeschlossen)")
+                result['skipped'].append(step.step_id)
+                done.add(step.step_id)
+        pending = [step for step in steps if step.step_id not in done]
+        self.callbacks.progress(len(done), len(steps))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="release-step") as pool:
+            while pending or running:
+                if error is None and self._cancel_event.is_set():
+                    error = ReleaseCancelled(f"Release vor Schritt {pending[0].step_id} abgebrochen"
+                                             if pending else "Release abgebrochen")
+                if error is None:
+                    for step in [s for s in pending if graph[s.step_id] <= done]:
+                        pending.remove(step)
+                        log(f"\n{step.step_id}. {step.title}")
+                        self.callbacks.status(f"{step.step_id}. {step.title}")
+                        running[pool.submit(self._execute_step, step, params, checkpoint, test_mode)] = step
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    try:
+                        result['timings'][step.step_id] = future.result()
+                    except Exception as e:
+                        log(f"  X Schritt {step.step_id} fehlgeschlagen: {e}")
+                        if error is None or isinstance(error, ReleaseCancelled):
+                            error = e
+                        continue
+                    done.add(step.step_id)
+                    result['completed'].append(step.step_id)
+                    log(f"  OK ({step.step_id}) {step.done_msg}" + (" (simuliert)" if test_mode else ""))
+                    self.callbacks.progress(len(done), len(steps))
+
+        if error is not None:
+            raise error
+
+    def _execute_step(self, step, params, checkpoint, test_mode):
+        """Führt einen Schritt aus und schreibt ihn ins Journal (läuft im Thread-Pool).
+
+        Returns:
+            float: Laufzeit in Sekunden
+        """
+        step_started = time.perf_counter()
+        step_paths = step.get_paths(params)
+        if test_mode:
+            step_result = step.handler(params) or {}
+        else:
+            inputs = {'version': params['version'], 'files': hash_files(step_paths)}
+            step_result = step.handler(params) or {}
+            if checkpoint:
+                outputs = {'files': hash_files(step_paths + step_result.get('files', []))}
+                if step_result.get('git'):
+                    outputs['git'] = step_result['git']
+                checkpoint.mark_step_completed(step.label, step.step_id, inputs, outputs)
+        # Nur diese Dateien landen im Release-Commit (siehe _step_git_add)
+        self._release_files.update(step_paths + step_result.get('files', []))
+        return time.perf_counter() - step_started
+
+    def _offer_rollback(self, checkpoint, error, cancelled, test_mode, result):
+        """Bietet nach Fehler oder Abbruch einen Rollback an."""
+        if not checkpoint or test_mode:
+            if cancelled:
+                self.callbacks.notify('info', "Abgebrochen", str(error))
+            else:
+                self.callbacks.notify('error', "Fehler", f"Release fehlgeschlagen: {str(error)}")
+            return
+
+        if cancelled:
+            error_msg = f"{error}.\n\n"
+        else:
+            error_msg = f"Release fehlgeschlagen: {str(error)}\n\n"
+        error_msg += "Möchten Sie einen Rollback durchführen?\n"
+        error_msg += "Dies stellt nur die vom Release veränderten Dateien wieder her\n"
+        error_msg += "und entfernt nur die vom Release erstellten Commits und Tags.\n\n"
+        error_msg += "Ohne Rollback kann der Release später über\n"
+        error_msg += "'Release fortsetzen' ab dem fehlgeschlagenen Schritt fortgesetzt werden."
+
+        title = "Abgebrochen - Rollback?" if cancelled else "Fehler - Rollback?"
+        if self.callbacks.confirm_rollback(title, error_msg):
+            rollback_result = checkpoint.rollback_all()
+            result['rolled_back'] = rollback_result['success']
+            if rollback_result['success']:
+                self.callbacks.notify('info', "Rollback",
+                                      f"Rollback erfolgreich!\n\n"
+                                      f"Git: {'Wiederhergestellt' if rollback_result['git'] else 'Nicht wiederhergestellt'}\n"
+                                      f"Dateien: {rollback_result['files']} wiederhergestellt")
+            else:
+                self.callbacks.notify('warning', "Rollback",
+                                      "Rollback konnte nicht vollständig durchgeführt werden.\n"
+                                      f"Backup-Verzeichnis: {checkpoint.backup_dir}")
+        else:
+            self.callbacks.notify('info', "Kein Rollback",
+                                  f"Kein Rollback durchgeführt.\n"
+                                  f"Backup-Verzeichnis: {checkpoint.backup_dir}\n\n"
+                                  f"Sie können später manuell rollbacken oder den Release\n"
+                                  f"über 'Release fortsetzen' fortsetzen.")
+
+    # ========== Dokumentations-Commit ==========
+
+    def documentation_commit(self, commit_msg, doc_files, test_mode=False):
+        """Nur Commit + Push, keine Version, kein Tag.
+
+        Args:
+            commit_msg (str): Commit-Message (Prefix 'docs:' wird ergänzt)
+            doc_files (list): Geänderte Doku-Dateien (nur für die Bestätigung)
+            test_mode (bool): Nur simulieren
+
+        Returns:
+            dict: {'success': bool, 'cancelled': bool, 'error': str or None}
+        """
+        result = {'success': False, 'cancelled': False, 'error': None}
+
+        # Pre-Commit-Prüfungen (nur im echten Modus)
+        if not test_mode:
+            log("\n🔍 Führe Pre-Commit-Prüfungen durch...")
+            git_status = check_git_repository_status(use_cache=True)
+
+            # Zeige Warnungen
+            if git_status['warnings']:
+                warning_msg = "⚠️ Warnungen vor dem Commit:\n\n"
+                warning_msg += "\n".join(f"• {w}" for w in git_status['warnings'])
+                warning_msg += "\n\nMöchten Sie trotzdem fortfahren?"
+
+                if not self.callbacks.confirm("Warnungen", warning_msg):
+                    result['cancelled'] = True
+                    return result
+
+            # Zeige kritische Probleme
+            if git_status['issues']:
+                error_msg = "❌ Kritische Probleme gefunden:\n\n"
+                error_msg += "\n".join(f"• {issue}" for issue in git_status['issues'])
+                error_msg += "\n\nMöchten Sie versuchen, diese automatisch zu beheben?"
+
+                if not self.callbacks.confirm("Probleme gefunden", error_msg):
+                    result['cancelled'] = True
+                    return result
+
+                # Versuche automatische Behebung
+                if git_status['is_behind'] or git_status['is_diverged']:
+                    if self.callbacks.confirm("Git Pull", "Soll 'git pull' ausgeführt werden?"):
+                        if run_command("git pull"):
+                            log("  ✅ Git pull erfolgreich")
+                            # Prüfe erneut
+                            git_status = check_git_repository_status()
+                            if git_status['issues']:
+                                self.callbacks.notify('error', "Probleme bestehen",
+                                                      "Nach dem Pull bestehen noch Probleme:\n\n" +
+                                                      "\n".join(git_status['issues']))
+                                result['error'] = "; ".join(git_status['issues'])
+                                return result
+                        else:
+                            self.callbacks.notify('error', "Fehler", "Git pull fehlgeschlagen")
+                            result['error'] = "Git pull fehlgeschlagen"
+                            return result
+
+            log("  ✅ Alle Pre-Commit-Prüfungen bestanden")
+
+        # Conventional Commit Format
+        if not commit_msg.startswith("docs:"):
+            commit_msg = f"docs: {commit_msg}"
+
+        # Bestätigung
+        confirmation = f"Dokumentations-Commit erstellen:\n\n" + \
+                      f"Commit-Message: {commit_msg}\n\n" + \
+                      f"Änderungen:\n"
+
+        for f in doc_files[:10]:
+            confirmation += f"  • {f}\n"
+        if len(doc_files) > 10:
+            confirmation += f"  ... und {len(doc_files) - 10} weitere\n"
+
+        confirmation += "\n❌ KEINE neue Version\n"
+        confirmation += "❌ KEIN Git-Tag\n"
+        confirmation += "✅ CHANGELOG Unreleased-Sektion bleibt erhalten"
+
+        if test_mode:
+            confirmation = "TEST-MODUS: Keine Änderungen werden vorgenommen!\n\n" + confirmation
+
+        if not self.callbacks.confirm("Bestätigung", confirmation):
+            result['cancelled'] = True
+            return result
+
+        try:
+            log(f"\n{'TEST: ' if test_mode else ''}Dokumentations-Commit wird erstellt...")
+            log(f"  Commit-Message: {commit_msg}")
+
+            # Git Operations (im Test-Modus nur anzeigen)
+            for label, command in (
+                ("Git add...", ['git', 'add', '.']),
+                ("Git commit...", ['git', 'commit', '-m', commit_msg]),
+                ("Git push...", ['git', 'push', 'origin', 'main']),
+            ):
+                if test_mode:
+                    log(f"    $ {subprocess.list2cmdline(command)}")
+                else:
+                    log(f"  {label}")
+                    self.callbacks.status(label)
+                    returncode, _ = stream_command(command)
+                    if returncode != 0:
+                        raise subprocess.CalledProcessError(returncode, command)
+
+            log("\n✅ Dokumentations-Commit erfolgreich!" + (" (simuliert)" if test_mode else ""))
+            result['success'] = True
+
+            self.callbacks.notify(
+                'info',
+                "✅ Erfolg",
+                f"Dokumentations-Commit {'simuliert' if test_mode else 'erstellt'}!\n\n"
+                f"Commit: {commit_msg}\n\n"
+                f"📝 CHANGELOG.md Unreleased-Sektion bleibt erhalten.\n"
+                f"📦 Keine neue Version erstellt.\n"
+                f"🏷️ Kein Git-Tag erstellt."
+            )
+        except subprocess.CalledProcessError as e:
+            result['error'] = str(e)
+            self.callbacks.notify('error', "❌ Fehler", f"Git-Operation fehlgeschlagen:\n{str(e)}")
+        except Exception as e:
+            result['error'] = str(e)
+            self.callbacks.notify('error', "❌ Fehler", f"Fehler beim Commit:\n{str(e)}")
+        return result
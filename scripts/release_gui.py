@@ -2,30 +2,60 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from tkinter.scrolledtext import ScrolledText
-import re
-import json
-from pathlib import Path
-import subprocess
 import sys
-from datetime import datetime
+import queue
+import threading
 from release_utils import (
-    update_version_in_file, run_command, update_documentation, update_metadata, 
-    remove_bom_in_paths, write_unreleased_changes, read_unreleased_changes, 
-    verify_metadata_update, detect_change_type, get_changed_files_info,
-    create_release_checkpoint, ReleaseCheckpoint,
-    check_git_repository_status, check_tag_exists, push_tags_smartly,
-    validate_release_prerequisites
+    read_unreleased_changes, read_module_version, get_changed_files_info,
+    find_resumable_checkpoint, prefetch_remote_state, log, log_buffer
 )
+from release_engine import ReleaseEngine, ReleaseCallbacks, build_release_params
+
+
+class GuiReleaseCallbacks(ReleaseCallbacks):
+    """Leitet Rückfragen und Fortschritt der ReleaseEngine an die GUI weiter."""
+    
+    DIALOGS = {'info': 'showinfo', 'warning': 'showwarning', 'error': 'showerror'}
+    
+    def __init__(self, gui):
+        self.gui = gui
+    
+    def confirm(self, title, message):
+        return self.gui._dialog('askyesno', title, message)
+    
+    def notify(self, level, title, message):
+        self.gui._dialog(self.DIALOGS.get(level, 'showinfo'), title, message)
+    
+    def status(self, text):
+        self.gui._ui_queue.put(('log', text))
+    
+    def progress(self, done, total):
+        self.gui._ui_queue.put(('progress', (done, total)))
+    
+    def version_changed(self, version):
+        self.gui._call_in_ui(self.gui.refresh_version_display)
+
 
 class ReleaseGUI:
+    # Intervall (ms), in dem der Tk-Thread die Worker-Queue abfragt
+    UI_POLL_INTERVAL_MS = 50
+    # Log-Pane: höchstens 10 Aktualisierungen pro Sekunde, begrenzte Zeilenzahl im Widget
+    LOG_REFRESH_MS = 100
+    LOG_MAX_LINES = 2000
+    
     def __init__(self, root, test_mode=False):
         self.root = root
         self.root.title("Release Manager")
-        self.root.geometry("750x900")  # Höher für neuen Modus-Bereich
+        self.root.geometry("750x1050")  # Höher für Modus-Bereich und Protokoll
         
         # Test-Modus Flag setzen
         self._test_mode = test_mode
         
+        # Kommunikation Worker-Thread -> Tk-Thread
+        self._ui_queue = queue.Queue()
+        self._release_running = False
+        self.engine = ReleaseEngine(GuiReleaseCallbacks(self))
+        
         # Style konfigurieren
         self.setup_styles()
         
@@ -41,8 +71,12 @@ class ReleaseGUI:
         ttk.Label(header_frame, text="Release Manager", style="Header.TLabel").pack(pady=10)
         
         # ========== NEU: Automatische Erkennung & Modus-Auswahl ==========
-        self.detected_type = detect_change_type()
-        self.changes_info = get_changed_files_info()
+        # Die Repository-Analyse läuft im Hintergrund (siehe _analyze_repository);
+        # bis dahin zeigt das Banner einen Platzhalter.
+        self.detected_type = None
+        self.changes_info = {'code': [], 'docs': [], 'type': None}
+        self._analysis_done = False
+        self._mode_chosen_by_user = False
         
         # Info-Banner mit Erkennungsergebnis
         self.info_frame = ttk.Frame(main_frame, style="Info.TFrame")
@@ -60,14 +94,14 @@ class ReleaseGUI:
                                     padding="15", style="Card.TLabelframe")
         mode_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         
-        self.mode_var = tk.StringVar(value='code' if self.detected_type == 'code' else 'docs')
+        self.mode_var = tk.StringVar(value='code')
         
         release_radio = ttk.Radiobutton(
             mode_frame, 
             text="🚀 Release erstellen (Version hochsetzen, Build, Tag, GitHub Release)",
             variable=self.mode_var,
             value='code',
-            command=self.update_ui_for_mode,
+            command=self.on_mode_selected,
             style="Custom.TRadiobutton"
         )
         release_radio.pack(anchor=tk.W, pady=5)
@@ -77,7 +111,7 @@ class ReleaseGUI:
             text="📝 Nur Commit (Dokumentation, keine neue Version)",
             variable=self.mode_var,
             value='docs',
-            command=self.update_ui_for_mode,
+            command=self.on_mode_selected,
             style="Custom.TRadiobutton"
         )
         docs_radio.pack(anchor=tk.W, pady=5)
@@ -169,6 +203,7 @@ class ReleaseGUI:
         self.options_frame.columnconfigure(1, weight=1)
         
         # Checkbox-Variablen
+        self.build_var = tk.BooleanVar(value=True)
         self.update_constants_var = tk.BooleanVar(value=True)
         self.run_build_var = tk.BooleanVar(value=True)
         self.git_add_var = tk.BooleanVar(value=True)
@@ -177,13 +212,20 @@ class ReleaseGUI:
         self.git_push_var = tk.BooleanVar(value=True)
         self.update_docs_var = tk.BooleanVar(value=True)
         self.remove_bom_var = tk.BooleanVar(value=True)
+        self.package_var = tk.BooleanVar(value=True)
+        self.verify_assets_var = tk.BooleanVar(value=True)
+        self.isolated_var = tk.BooleanVar(value=False)
         
-        # Checkboxen in 2x4 Grid
+        # Checkboxen in zwei Spalten
         options = [
+            ("Build prüfen (nur bei Änderungen bauen)", self.build_var),
             ("Konstanten-Datei aktualisieren", self.update_constants_var),
             ("Metadaten aktualisieren", self.run_build_var),
             ("BOM entfernen", self.remove_bom_var),
-            ("Dokumentation aktualisieren", self.update_docs_var)
+            ("Dokumentation aktualisieren", self.update_docs_var),
+            ("module.zip packen", self.package_var),
+            ("Assets aus module.json prüfen", self.verify_assets_var),
+            ("Isoliert im temporären Worktree", self.isolated_var)
         ]
         
         git_options = [
@@ -235,16 +277,46 @@ class ReleaseGUI:
         )
         self.test_button.pack(side=tk.LEFT, padx=5)
         
+        # Resume Button (nur aktiv, wenn ein abgebrochener Release existiert)
+        self.resume_button = ttk.Button(
+            button_frame,
+            text="Release fortsetzen",
+            command=self.resume_release,
+            style="Action.TButton"
+        )
+        self.resume_button.pack(side=tk.LEFT, padx=5)
+        
         # Status Label
         status_frame = ttk.Frame(main_frame, style="Main.TFrame")
         status_frame.grid(row=6, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         self.status_label = ttk.Label(status_frame, text="", style="Status.TLabel", wraplength=700)
         self.status_label.pack(fill=tk.X, padx=10)
         
-        # Spacer
-        spacer = ttk.Frame(main_frame, style="Main.TFrame")
-        spacer.grid(row=7, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        spacer.rowconfigure(0, weight=1)
+        # Fortschritt (nur während eines laufenden Releases sichtbar)
+        self.progress_frame = ttk.Frame(status_frame, style="Main.TFrame")
+        self.progress_label = ttk.Label(self.progress_frame, text="", style="Progress.TLabel")
+        self.progress_label.pack(fill=tk.X, padx=10, pady=(10, 5))
+        progress_row = ttk.Frame(self.progress_frame, style="Main.TFrame")
+        progress_row.pack(fill=tk.X, padx=10)
+        self.progress_bar = ttk.Progressbar(progress_row, mode='determinate')
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.cancel_button = ttk.Button(
+            progress_row,
+            text="Abbrechen",
+            command=self.cancel_release,
+            style="Reset.TButton"
+        )
+        self.cancel_button.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Protokoll (Live-Ausgabe der Schritte und der ausgeführten Befehle)
+        log_frame = ttk.LabelFrame(main_frame, text="Protokoll",
+                                   padding="10", style="Card.TLabelframe")
+        log_frame.grid(row=7, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.rowconfigure(7, weight=1)
+        self.log_text = ScrolledText(log_frame, height=12, wrap=tk.NONE,
+                                     font=("Consolas", 9), state=tk.DISABLED)
+        self.log_text.pack(fill=tk.BOTH, expand=True)
+        self._log_dropped_seen = 0
         
         # Bottom Frame
         bottom_frame = ttk.Frame(main_frame, style="Main.TFrame")
@@ -266,10 +338,157 @@ class ReleaseGUI:
         # Initiale UI-Anpassung basierend auf Modus
         self.update_ui_for_mode()
         self.validate_input()
+        self.update_resume_button()
         
         # Configure grid weights
         root.columnconfigure(0, weight=1)
         root.rowconfigure(0, weight=1)
+        
+        self.root.after(self.UI_POLL_INTERVAL_MS, self._poll_ui_queue)
+        self.root.after(self.LOG_REFRESH_MS, self._flush_log)
+        
+        # Repository-Analyse und Remote-Prefetch erst nach dem Rendern starten
+        threading.Thread(target=self._analyze_repository, name="repo-analysis", daemon=True).start()
+    
+    def _analyze_repository(self):
+        """Analysiert geänderte Dateien und holt den Remote-Zustand vorab (Hintergrund-Thread)."""
+        try:
+            changes_info = get_changed_files_info()
+        except Exception as e:
+            log(f"Fehler bei der Repository-Analyse: {e}")
+            changes_info = {'code': [], 'docs': [], 'type': 'code'}
+        self._call_in_ui(lambda: self._on_analysis_done(changes_info))
+        
+        # Netzwerkzugriff (ls-remote + fetch) vorziehen, damit die Pre-Release-Prüfungen schnell sind
+        prefetch_remote_state()
+    
+    def _on_analysis_done(self, changes_info):
+        """Übernimmt das Analyse-Ergebnis in Banner und Modus-Vorauswahl (Tk-Thread)."""
+        self.changes_info = changes_info
+        self.detected_type = changes_info['type']
+        self._analysis_done = True
+        self.update_info_banner()
+        if not self._mode_chosen_by_user:
+            self.mode_var.set('code' if self.detected_type == 'code' else 'docs')
+        self.update_ui_for_mode()
+    
+    def on_mode_selected(self):
+        """Merkt sich die manuelle Modus-Wahl (wird von der Analyse nicht mehr überschrieben)."""
+        self._mode_chosen_by_user = True
+        self.update_ui_for_mode()
+    
+    # ========== Worker-Thread-Anbindung ==========
+    
+    def _poll_ui_queue(self):
+        """Verarbeitet Nachrichten des Worker-Threads im Tk-Thread."""
+        try:
+            while True:
+                kind, payload = self._ui_queue.get_nowait()
+                if kind == 'log':
+                    self.progress_label.config(text=payload)
+                elif kind == 'progress':
+                    done, total = payload
+                    self.progress_bar.config(maximum=max(total, 1), value=done)
+                elif kind == 'prompt':
+                    dialog, title, message, reply = payload
+                    reply['value'] = getattr(messagebox, dialog)(title, message, parent=self.root)
+                    reply['event'].set()
+                elif kind == 'call':
+                    payload()
+                elif kind == 'done':
+                    self._set_release_running(False)
+        except queue.Empty:
+            pass
+        self.root.after(self.UI_POLL_INTERVAL_MS, self._poll_ui_queue)
+    
+    def _flush_log(self):
+        """Überträgt neue Zeilen aus dem Log-Ringpuffer gebündelt in das Protokoll-Pane."""
+        lines = log_buffer.drain()
+        dropped = log_buffer.dropped - self._log_dropped_seen
+        if dropped:
+            self._log_dropped_seen = log_buffer.dropped
+            lines.insert(0, f"... {dropped} Zeilen ausgelassen (vollständig in der Log-Datei) ...")
+        if lines:
+            at_end = self.log_text.yview()[1] >= 0.999
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > self.LOG_MAX_LINES:
+                self.log_text.delete("1.0", f"{line_count - self.LOG_MAX_LINES + 1}.0")
+            self.log_text.config(state=tk.DISABLED)
+            if at_end:
+                self.log_text.see(tk.END)
+        self.root.after(self.LOG_REFRESH_MS, self._flush_log)
+    
+    def _in_ui_thread(self):
+        return threading.current_thread() is threading.main_thread()
+    
+    def _log(self, message):
+        """Gibt eine Log-Zeile aus und zeigt sie als aktuellen Fortschritt in der GUI an."""
+        log(message)
+        text = message.strip()
+        if text:
+            self._ui_queue.put(('log', text))
+    
+    def _dialog(self, dialog, title, message):
+        """Zeigt einen messagebox-Dialog an - aus dem Worker über die Queue im Tk-Thread.
+        
+        Args:
+            dialog (str): Name der messagebox-Funktion ('askyesno', 'showinfo', ...)
+        """
+        if self._in_ui_thread():
+            return getattr(messagebox, dialog)(title, message, parent=self.root)
+        reply = {'event': threading.Event(), 'value': None}
+        self._ui_queue.put(('prompt', (dialog, title, message, reply)))
+        reply['event'].wait()
+        return reply['value']
+    
+    def _call_in_ui(self, func):
+        """Führt eine Funktion, die Tk-Widgets anfasst, im Tk-Thread aus."""
+        if self._in_ui_thread():
+            func()
+        else:
+            self._ui_queue.put(('call', func))
+    
+    def _set_release_running(self, running):
+        """Sperrt bzw. entsperrt die Bedienelemente während eines Releases."""
+        self._release_running = running
+        if running:
+            self.execute_button.state(['disabled'])
+            self.test_button.state(['disabled'])
+            self.resume_button.state(['disabled'])
+            self.cancel_button.state(['!disabled'])
+            self.progress_bar.config(value=0)
+            self.progress_label.config(text="")
+            self.progress_frame.pack(fill=tk.X)
+        else:
+            self.cancel_button.state(['disabled'])
+            self.validate_input()
+            self.update_resume_button()
+    
+    def _start_worker(self, target, *args):
+        """Startet target(*args) in einem Hintergrund-Thread (mit frischer ReleaseEngine)."""
+        self.engine = ReleaseEngine(GuiReleaseCallbacks(self))
+        target = getattr(self.engine, target) if isinstance(target, str) else target
+        self._set_release_running(True)
+        
+        def run():
+            try:
+                target(*args)
+            except Exception as e:
+                self._log(f"\nUnerwarteter Fehler: {e}")
+                self._dialog('showerror', "Fehler", f"Unerwarteter Fehler:\n{e}")
+            finally:
+                self._ui_queue.put(('done', None))
+        
+        threading.Thread(target=run, name="release-worker", daemon=True).start()
+    
+    def cancel_release(self):
+        """Fordert den Abbruch des laufenden Releases nach dem aktuellen Schritt an."""
+        if self._release_running:
+            self.engine.cancel()
+            self.cancel_button.state(['disabled'])
+            self.progress_label.config(text="Abbruch angefordert - warte auf Ende des aktuellen Schritts...")
     
     def update_info_banner(self):
         """Aktualisiert das Info-Banner mit Erkennungsergebnis."""
@@ -279,7 +498,13 @@ class ReleaseGUI:
         # Alle geänderten Dateien (zur Info)
         all_files = self.changes_info['code'] + self.changes_info['docs']
         
-        if self.detected_type == 'docs':
+        if not self._analysis_done:
+            # Platzhalter, bis die Hintergrund-Analyse fertig ist
+            bg_color = "#e2e3e5"
+            fg_color = "#383d41"
+            title = "⏳ Analysiere Repository...\n"
+            files_text = "Geänderte Dateien werden ermittelt. Ausführen und Testlauf werden danach freigegeben."
+        elif self.detected_type == 'docs':
             # Nur Dokumentation
             bg_color = "#fff3cd"
             fg_color = "#856404"
@@ -378,6 +603,9 @@ class ReleaseGUI:
                        font=("Segoe UI", 10),
                        foreground="red",
                        background=BG_COLOR)
+        style.configure("Progress.TLabel",
+                       font=("Segoe UI", 9),
+                       background=BG_COLOR)
         
         # Frames
         style.configure("Card.TLabelframe", 
@@ -420,28 +648,28 @@ class ReleaseGUI:
         
     def get_current_version(self):
         """Liest die aktuelle Version aus scripts/constants.cjs."""
-        constants_cjs = Path("scripts/constants.cjs")
-        if not constants_cjs.exists():
-            if not self._test_mode:
-                messagebox.showerror("Fehler", "scripts/constants.cjs nicht gefunden!")
-                sys.exit(1)
-            return "0.0.1"
-        with open(constants_cjs, 'r', encoding='utf-8') as f:
-            content = f.read()
-        match = re.search(r'MODULE_VERSION:\s*[\'"]([^\'"]+)[\'"]', content)
-        if not match:
+        version = read_module_version("scripts/constants.cjs")
+        if version is None:
             if not self._test_mode:
-                messagebox.showerror("Fehler", "Version in constants.cjs nicht gefunden!")
+                messagebox.showerror("Fehler", "Version in scripts/constants.cjs nicht gefunden!")
                 sys.exit(1)
             return "0.0.1"
-        return match.group(1)
+        return version
     
     def get_new_version(self):
         """Gibt die neue Version als String zurück."""
         return f"{self.major_var.get()}.{self.minor_var.get()}.{self.patch_var.get()}"
     
     def validate_input(self, *args):
-        """Validiert die Eingaben und aktiviert/deaktiviert den Ausführen-Button."""
+        """Validiert die Eingaben und aktiviert/deaktiviert Ausführen- und Testlauf-Button."""
+        # Während der Analyse und eines laufenden Releases bleiben beide Buttons gesperrt
+        # (ohne Analyse wären changes_info und damit die Dateilisten noch leer)
+        if self._release_running or not self._analysis_done:
+            self.execute_button.state(['disabled'])
+            self.test_button.state(['disabled'])
+            return
+        self.test_button.state(['!disabled'])
+        
         # Im Dokumentations-Modus keine Versions-Validierung
         if self.mode_var.get() == 'docs':
             self.execute_button.state(['!disabled'])
@@ -514,54 +742,16 @@ class ReleaseGUI:
 
     def execute_action(self, test_mode=False):
         """Hauptfunktion: Führt je nach Modus Release oder Docs-Commit aus."""
+        # Buttons sind bis dahin gesperrt; Schutz gegen Aufrufe per Tastatur o.ä.
+        if not self._analysis_done or self._release_running:
+            return
         if self.mode_var.get() == 'docs':
             self.documentation_commit(test_mode)
         else:
             self.execute_release(test_mode)
     
     def documentation_commit(self, test_mode=False):
-        """Nur Commit + Push, keine Version, kein Tag."""
-        # Pre-Commit-Prüfungen (nur im echten Modus)
-        if not test_mode:
-            print("\n🔍 Führe Pre-Commit-Prüfungen durch...")
-            git_status = check_git_repository_status()
-            
-            # Zeige Warnungen
-            if git_status['warnings']:
-                warning_msg = "⚠️ Warnungen vor dem Commit:\n\n"
-                warning_msg += "\n".join(f"• {w}" for w in git_status['warnings'])
-                warning_msg += "\n\nMöchten Sie trotzdem fortfahren?"
-                
-                if not messagebox.askyesno("Warnungen", warning_msg):
-                    return
-            
-            # Zeige kritische Probleme
-            if git_status['issues']:
-                error_msg = "❌ Kritische Probleme gefunden:\n\n"
-                error_msg += "\n".join(f"• {issue}" for issue in git_status['issues'])
-                error_msg += "\n\nMöchten Sie versuchen, diese automatisch zu beheben?"
-                
-                if messagebox.askyesno("Probleme gefunden", error_msg):
-                    # Versuche automatische Behebung
-                    if git_status['is_behind'] or git_status['is_diverged']:
-                        if messagebox.askyesno("Git Pull", "Soll 'git pull' ausgeführt werden?"):
-                            if run_command("git pull"):
-                                print("  ✅ Git pull erfolgreich")
-                                # Prüfe erneut
-                                git_status = check_git_repository_status()
-                                if git_status['issues']:
-                                    messagebox.showerror("Probleme bestehen", 
-                                        "Nach dem Pull bestehen noch Probleme:\n\n" +
-                                        "\n".join(git_status['issues']))
-                                    return
-                            else:
-                                messagebox.showerror("Fehler", "Git pull fehlgeschlagen")
-                                return
-                else:
-                    return
-            
-            print("  ✅ Alle Pre-Commit-Prüfungen bestanden")
-        
+        """Nur Commit + Push, keine Version, kein Tag (Prüfungen und Git im Hintergrund-Thread)."""
         # Commit-Message abfragen
         commit_msg = simpledialog.askstring(
             "Commit-Message",
@@ -572,60 +762,7 @@ class ReleaseGUI:
         if not commit_msg:
             return
         
-        # Conventional Commit Format
-        if not commit_msg.startswith("docs:"):
-            commit_msg = f"docs: {commit_msg}"
-        
-        # Bestätigung
-        confirmation = f"Dokumentations-Commit erstellen:\n\n" + \
-                      f"Commit-Message: {commit_msg}\n\n" + \
-                      f"Änderungen:\n"
-        
-        for f in self.changes_info['docs'][:10]:
-            confirmation += f"  • {f}\n"
-        if len(self.changes_info['docs']) > 10:
-            confirmation += f"  ... und {len(self.changes_info['docs']) - 10} weitere\n"
-        
-        confirmation += "\n❌ KEINE neue Version\n"
-        confirmation += "❌ KEIN Git-Tag\n"
-        confirmation += "✅ CHANGELOG Unreleased-Sektion bleibt erhalten"
-        
-        if test_mode:
-            confirmation = "TEST-MODUS: Keine Änderungen werden vorgenommen!\n\n" + confirmation
-        
-        if not messagebox.askyesno("Bestätigung", confirmation):
-            return
-        
-        try:
-            print(f"\n{'TEST: ' if test_mode else ''}Dokumentations-Commit wird erstellt...")
-            print(f"  Commit-Message: {commit_msg}")
-            
-            # Git Operations
-            if not test_mode:
-                print("  Git add...")
-                subprocess.run(['git', 'add', '.'], check=True)
-                
-                print("  Git commit...")
-                subprocess.run(['git', 'commit', '-m', commit_msg], check=True)
-                
-                print("  Git push...")
-                subprocess.run(['git', 'push', 'origin', 'main'], check=True)
-            
-            print("\n✅ Dokumentations-Commit erfolgreich!" + (" (simuliert)" if test_mode else ""))
-            
-            messagebox.showinfo(
-                "✅ Erfolg",
-                f"Dokumentations-Commit {'simuliert' if test_mode else 'erstellt'}!\n\n"
-                f"Commit: {commit_msg}\n\n"
-                f"📝 CHANGELOG.md Unreleased-Sektion bleibt erhalten.\n"
-                f"📦 Keine neue Version erstellt.\n"
-                f"🏷️ Kein Git-Tag erstellt."
-            )
-            
-        except subprocess.CalledProcessError as e:
-            messagebox.showerror("❌ Fehler", f"Git-Operation fehlgeschlagen:\n{str(e)}")
-        except Exception as e:
-            messagebox.showerror("❌ Fehler", f"Fehler beim Commit:\n{str(e)}")
+        self._start_worker('documentation_commit', commit_msg, list(self.changes_info['docs']), test_mode)
 
     def prompt_for_changelog_inputs(self, test_mode=False):
         """Zeigt ein Modal zur Eingabe von Changelog-Texten und Commit-Bemerkung."""
@@ -695,245 +832,65 @@ class ReleaseGUI:
         self.root.wait_window(dialog)
         return self._changelog_inputs
 
+    def get_release_options(self):
+        """Gibt die aktuell gewählten Release-Optionen als Dict zurück."""
+        return {
+            'build': self.build_var.get(),
+            'update_constants': self.update_constants_var.get(),
+            'update_metadata': self.run_build_var.get(),
+            'remove_bom': self.remove_bom_var.get(),
+            'update_docs': self.update_docs_var.get(),
+            'package': self.package_var.get(),
+            'verify_assets': self.verify_assets_var.get(),
+            'git_add': self.git_add_var.get(),
+            'git_commit': self.git_commit_var.get(),
+            'git_tag': self.git_tag_var.get(),
+            'git_push': self.git_push_var.get(),
+        }
+
     def execute_release(self, test_mode=False):
-        """Führt den vollständigen Release-Prozess aus (wie bisher)."""
-        # Modal zur Eingabe von Changelog
+        """Fragt die Changelog-Eingaben ab und startet den Release im Hintergrund-Thread."""
+        # Modal zur Eingabe von Changelog (muss im Tk-Thread laufen)
         inputs = self.prompt_for_changelog_inputs(test_mode)
         if inputs is None:
             return
         
-        added = inputs["added"]
-        changed = inputs["changed"]
-        fixed = inputs["fixed"]
-        known = inputs["known"]
-        upgrade = inputs["upgrade"]
-        remark = inputs["remark"]
-        new_version = self.get_new_version()
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        
-        print(f"\nStarte {'Test-' if test_mode else ''}Release-Prozess für Version {new_version}")
-        
-        # Pre-Release-Prüfungen (nur im echten Modus)
-        if not test_mode:
-            print("\n🔍 Führe Pre-Release-Prüfungen durch...")
-            validation = validate_release_prerequisites(new_version)
-            
-            # Zeige Warnungen
-            if validation['warnings']:
-                warning_msg = "⚠️ Warnungen vor dem Release:\n\n"
-                warning_msg += "\n".join(f"• {w}" for w in validation['warnings'])
-                warning_msg += "\n\nMöchten Sie trotzdem fortfahren?"
-                
-                if not messagebox.askyesno("Warnungen", warning_msg):
-                    return
-            
-            # Zeige kritische Probleme
-            if validation['issues']:
-                error_msg = "❌ Kritische Probleme gefunden:\n\n"
-                error_msg += "\n".join(f"• {issue}" for issue in validation['issues'])
-                error_msg += "\n\nBitte beheben Sie diese Probleme vor dem Release."
-                
-                messagebox.showerror("Release blockiert", error_msg)
-                return
-            
-            print("  ✅ Alle Pre-Release-Prüfungen bestanden")
+        params = build_release_params(self.get_new_version(), inputs, inputs['remark'],
+                                      self.get_release_options())
+        self._start_worker('run', params, test_mode, self.isolated_var.get())
+    
+    def resume_release(self):
+        """Setzt einen abgebrochenen Release anhand seines Journals fort."""
+        plan = self.engine.plan_resume()
+        if plan is None:
+            messagebox.showinfo("Release fortsetzen", "Kein abgebrochener Release gefunden.")
+            self.update_resume_button()
+            return
         
-        # Bestätigung
-        confirmation = f"Release für Version {new_version} erstellen?\n\n"
-        if test_mode:
-            confirmation = "TEST-MODUS: Keine Dateien werden geändert!\n\n" + confirmation
+        if plan['params'] is None:
+            messagebox.showerror("Release fortsetzen",
+                                 f"Journal enthält keine Release-Eingaben:\n{plan['checkpoint'].journal.path}")
+            return
         
-        if not messagebox.askyesno("Bestätigung", confirmation):
+        if not plan['pending']:
+            self.engine.resume(plan)
+            messagebox.showinfo("Release fortsetzen",
+                                f"Alle Schritte für Version {plan['params']['version']} sind bereits abgeschlossen.")
+            self.update_resume_button()
             return
         
-        # Erstelle Checkpoint für Rollback
-        checkpoint = None
-        if not test_mode:
-            checkpoint = create_release_checkpoint(new_version)
+        if not messagebox.askyesno("Release fortsetzen", self.engine.describe_resume(plan)):
+            return
         
-        try:
-            # 1. Konstantendatei aktualisieren
-            if self.update_constants_var.get():
-                print("\n1. Aktualisiere Version in scripts/constants.cjs...")
-                if not test_mode:
-                    update_version_in_file("scripts/constants.cjs", new_version)
-                    self.refresh_version_display()
-                    if checkpoint:
-                        checkpoint.mark_step_completed("1. Konstantendatei aktualisiert")
-                print("  OK constants.cjs erfolgreich aktualisiert" + (" (simuliert)" if test_mode else ""))
-            
-            # 2. Metadaten aktualisieren
-            if self.run_build_var.get():
-                print("\n2. Aktualisiere Metadaten...")
-                if not test_mode:
-                    update_metadata(new_version)
-                    if not verify_metadata_update(new_version):
-                        raise Exception("Fehler beim Aktualisieren der Metadaten!")
-                    if checkpoint:
-                        checkpoint.mark_step_completed("2. Metadaten aktualisiert")
-                print("  OK Metadaten erfolgreich aktualisiert" + (" (simuliert)" if test_mode else ""))
-            
-            # 3. BOM entfernen
-            if self.remove_bom_var.get():
-                print("\n3. Entferne BOM aus Projektdateien...")
-                if not test_mode:
-                    remove_bom_in_paths(["src", "dist", "templates", "styles", "module.json", "package.json"])
-                    if checkpoint:
-                        checkpoint.mark_step_completed("3. BOM entfernt")
-                print("  OK BOM-Entfernung abgeschlossen" + (" (simuliert)" if test_mode else ""))
-            
-            # 4. Dokumentation aktualisieren
-            if self.update_docs_var.get():
-                print("\n4. Wende GUI-Änderungen auf CHANGELOG.md an...")
-                if not test_mode:
-                    write_unreleased_changes("CHANGELOG.md", added, changed, fixed, known, upgrade)
-                print("  OK Unreleased-Sektion in CHANGELOG.md aktualisiert" + (" (simuliert)" if test_mode else ""))
-
-                print("\n5. Aktualisiere Dokumentation...")
-                if not test_mode:
-                    update_documentation(new_version, current_date)
-                print("  OK Dokumentation erfolgreich aktualisiert" + (" (simuliert)" if test_mode else ""))
+        self._start_worker('resume', plan)
+    
+    def update_resume_button(self):
+        """Aktiviert den Resume-Button nur, wenn ein abgebrochener Release existiert."""
+        if not self._release_running and find_resumable_checkpoint() is not None:
+            self.resume_button.state(['!disabled'])
+        else:
+            self.resume_button.state(['disabled'])
 
-                print("\n6. Generiere CHANGELOG.md aus Release-Notes...")
-                if not test_mode:
-                    if not run_command("python scripts/generate_changelog.py"):
-                        raise Exception("Changelog-Regenerierung fehlgeschlagen")
-                    if checkpoint:
-                        checkpoint.mark_step_completed("6. CHANGELOG regeneriert")
-                print("  OK CHANGELOG.md erfolgreich regeneriert" + (" (simuliert)" if test_mode else ""))
-            
-            # 7. Git-Änderungen stagen
-            if self.git_add_var.get():
-                print("\n7. Git-Änderungen stagen...")
-                if not test_mode:
-                    if not run_command("git add ."):
-                        raise Exception("Git add fehlgeschlagen")
-                    if checkpoint:
-                        checkpoint.mark_step_completed("7. Git add")
-                print("  OK Git add erfolgreich" + (" (simuliert)" if test_mode else ""))
-            
-            # 8. Git-Änderungen committen
-            if self.git_commit_var.get():
-                print("\n8. Git-Änderungen committen...")
-                if not test_mode:
-                    commit_message = f"release: v{new_version}"
-                    if remark:
-                        commit_message += f" - {remark}"
-                    commit_message += "\n\n"
-                    if added and added.strip():
-                        commit_message += "### Hinzugefügt\n" + added + "\n\n"
-                    if changed and changed.strip():
-                        commit_message += "### Geändert\n" + changed + "\n\n"
-                    if fixed and fixed.strip():
-                        commit_message += "### Fehlerbehebungen\n" + fixed + "\n\n"
-                    
-                    # Schreibe Commit-Message in temporäre Datei (für lange Messages)
-                    commit_msg_file = Path(".git/COMMIT_EDITMSG_RELEASE")
-                    commit_msg_file.write_text(commit_message, encoding='utf-8')
-                    
-                    if not run_command(f'git commit -F "{commit_msg_file}"'):
-                        lock_file = Path(".git/index.lock")
-                        error_msg = "Git commit fehlgeschlagen"
-                        if lock_file.exists():
-                            error_msg += f"\n\nUrsache: Git-Lock-Datei gefunden ({lock_file})\n"
-                            error_msg += "Mögliche Lösungen:\n"
-                            error_msg += "1. Warten Sie, bis alle Git-Prozesse beendet sind\n"
-                            error_msg += "2. Prüfen Sie, ob ein Editor oder Git-Client geöffnet ist\n"
-                            error_msg += "3. Falls kein Prozess läuft, entfernen Sie die Lock-Datei manuell"
-                        raise Exception(error_msg)
-                    if checkpoint:
-                        checkpoint.mark_step_completed("8. Git commit")
-                print("  OK Git commit erfolgreich" + (" (simuliert)" if test_mode else ""))
-            
-            # 9. Git-Tag erstellen
-            if self.git_tag_var.get():
-                print("\n9. Git-Tag erstellen...")
-                if not test_mode:
-                    tag_message = f"Release v{new_version}"
-                    if remark:
-                        tag_message += f" - {remark}"
-                    if not run_command(f'git tag -f -a v{new_version} -m "{tag_message}"'):
-                        raise Exception("Git tag fehlgeschlagen")
-                    if checkpoint:
-                        checkpoint.mark_step_completed("9. Git tag")
-                print("  OK Git tag erfolgreich" + (" (simuliert)" if test_mode else ""))
-            
-            # 10. Änderungen hochladen
-            if self.git_push_var.get():
-                print("\n10. Änderungen hochladen...")
-                if not test_mode:
-                    # Pushe zuerst den Branch
-                    branch_result = subprocess.run(
-                        ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-                        capture_output=True,
-                        text=True,
-                        cwd=Path.cwd(),
-                        check=True
-                    )
-                    current_branch = branch_result.stdout.strip()
-                    
-                    print(f"  Pushe Branch {current_branch}...")
-                    if not run_command(f"git push origin {current_branch}"):
-                        raise Exception("Git push (Branch) fehlgeschlagen")
-                    
-                    # Pushe Tags intelligent (nur neue Tags)
-                    tag_name = f"v{new_version}"
-                    print(f"  Pushe Tag {tag_name}...")
-                    tag_push_result = push_tags_smartly(tag_name)
-                    
-                    if not tag_push_result['success']:
-                        # Wenn kritische Fehler aufgetreten sind
-                        if tag_push_result['failed']:
-                            error_msg = "Fehler beim Pushen von Tags:\n"
-                            error_msg += "\n".join(tag_push_result['errors'])
-                            raise Exception(error_msg)
-                    
-                    # Zeige Zusammenfassung
-                    if tag_push_result['pushed']:
-                        print(f"  ✅ {len(tag_push_result['pushed'])} Tag(s) erfolgreich gepusht")
-                    if tag_push_result['skipped']:
-                        print(f"  ⏭️  {len(tag_push_result['skipped'])} Tag(s) übersprungen (bereits im Remote)")
-                    if tag_push_result['failed']:
-                        print(f"  ❌ {len(tag_push_result['failed'])} Tag(s) fehlgeschlagen")
-                    
-                    if checkpoint:
-                        checkpoint.mark_step_completed("10. Git push")
-                print("  OK Git push erfolgreich" + (" (simuliert)" if test_mode else ""))
-            
-            # Erfolgreich abgeschlossen - Cleanup
-            if checkpoint:
-                checkpoint.cleanup()
-            
-            print("\nRelease-Prozess erfolgreich abgeschlossen!" + (" (TEST-MODUS)" if test_mode else ""))
-            messagebox.showinfo("Erfolg", 
-                              "Test-Simulation erfolgreich!" if test_mode else f"Release für Version {new_version} erfolgreich!")
-        except Exception as e:
-            print(f"\nFehler beim Release-Prozess: {str(e)}")
-            
-            # Rollback anbieten
-            if checkpoint and not test_mode:
-                error_msg = f"Release fehlgeschlagen: {str(e)}\n\n"
-                error_msg += "Möchten Sie einen Rollback durchführen?\n"
-                error_msg += "Dies stellt alle geänderten Dateien wieder her."
-                
-                if messagebox.askyesno("Fehler - Rollback?", error_msg):
-                    rollback_result = checkpoint.rollback_all()
-                    if rollback_result['success']:
-                        messagebox.showinfo("Rollback", 
-                                          f"Rollback erfolgreich!\n\n"
-                                          f"Git: {'Wiederhergestellt' if rollback_result['git'] else 'Nicht wiederhergestellt'}\n"
-                                          f"Dateien: {rollback_result['files']} wiederhergestellt")
-                    else:
-                        messagebox.showwarning("Rollback", 
-                                             "Rollback konnte nicht vollständig durchgeführt werden.\n"
-                                             f"Backup-Verzeichnis: {checkpoint.backup_dir}")
-                else:
-                    messagebox.showinfo("Kein Rollback", 
-                                      f"Kein Rollback durchgeführt.\n"
-                                      f"Backup-Verzeichnis: {checkpoint.backup_dir}\n\n"
-                                      f"Sie können später manuell rollbacken.")
-            else:
-                messagebox.showerror("Fehler", f"Release fehlgeschlagen: {str(e)}")
 
 def main():
     print("Starte Release Manager GUI...")
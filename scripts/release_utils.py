@@ -5,11 +5,226 @@ from pathlib import Path
 import json
 import os
 import shutil
+import hashlib
+import difflib
+import fnmatch
+import threading
+import time
+from collections import deque
 from datetime import datetime
 
 # Projekt-Root bestimmen
 PROJECT_ROOT = Path(__file__).parent.parent
 
+def set_project_root(path):
+    """Setzt das Projekt-Root (z.B. ein Fixture-Repository) und wechselt dorthin.
+    
+    Die Release-Schritte arbeiten mit relativen Pfaden, daher wird zusätzlich das
+    Arbeitsverzeichnis gewechselt.
+    """
+    global PROJECT_ROOT
+    PROJECT_ROOT = Path(path).resolve()
+    os.chdir(PROJECT_ROOT)
+
+# ============================================================================
+# Logging (Konsole + Ringpuffer für die GUI + vollständige Log-Datei)
+# ============================================================================
+
+class ReleaseLogBuffer:
+    """Thread-sicherer, begrenzter Ringpuffer für Log-Zeilen.
+    
+    Die GUI holt neue Zeilen gesammelt per drain() ab; ist sie zu langsam, werden
+    die ältesten Zeilen verworfen (gezählt in `dropped`). Optional wird jede Zeile
+    zusätzlich vollständig in eine Log-Datei geschrieben.
+    """
+    
+    def __init__(self, maxlen=5000):
+        self._lines = deque(maxlen=maxlen)
+        self._pending = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._file = None
+        self.dropped = 0
+        self.log_path = None
+    
+    def write(self, line: str):
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._lines.append(line)
+            self._pending.append(line)
+            if self._file:
+                self._file.write(line + "\n")
+                self._file.flush()
+    
+    def drain(self) -> list:
+        """Gibt alle seit dem letzten Aufruf neuen Zeilen zurück."""
+        with self._lock:
+            lines = list(self._pending)
+            self._pending.clear()
+            return lines
+    
+    def snapshot(self) -> list:
+        """Gibt die (höchstens maxlen) zuletzt geloggten Zeilen zurück."""
+        with self._lock:
+            return list(self._lines)
+    
+    def attach_file(self, path):
+        """Schreibt ab jetzt alle Zeilen in eine Datei (inkl. der bereits gepufferten)."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+            self.log_path = Path(path)
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.log_path, 'a', encoding='utf-8')
+            for line in self._lines:
+                self._file.write(line + "\n")
+            self._file.flush()
+    
+    def detach_file(self):
+        """Beendet das Schreiben in die Log-Datei."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+            self._file = None
+            self.log_path = None
+
+# Globaler Puffer, den die GUI ausliest
+log_buffer = ReleaseLogBuffer()
+
+def log(message=""):
+    """Gibt eine Meldung auf der Konsole aus und schreibt sie in den Log-Puffer."""
+    print(message)
+    for line in str(message).split("\n"):
+        log_buffer.write(line)
+
+def stream_command(command, cwd=None, shell=False):
+    """Führt einen Befehl aus und loggt seine Ausgabe (stdout + stderr) zeilenweise live.
+    
+    Args:
+        command (str or list): Befehl (String nur mit shell=True)
+        cwd (str, optional): Arbeitsverzeichnis
+        shell (bool): Über die Shell ausführen
+    
+    Returns:
+        tuple: (Exit-Code, Liste der Ausgabezeilen)
+    """
+    proc = subprocess.Popen(
+        command,
+        shell=shell,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        bufsize=1
+    )
+    output = []
+    for line in proc.stdout:
+        line = line.rstrip('\r\n')
+        output.append(line)
+        log(f"    {line}")
+    proc.stdout.close()
+    return proc.wait(), output
+
+# ============================================================================
+# Dateizugriff der Release-Schritte (optional über ein Copy-on-write-Overlay)
+# ============================================================================
+
+class OverlayFS:
+    """Copy-on-write-Overlay über dem Projektverzeichnis (für Testläufe).
+    
+    Schreibzugriffe landen in Puffern im Speicher, Lesezugriffe sehen zuerst diese
+    Puffer und sonst die Dateien auf der Platte. Die Platte bleibt unverändert.
+    """
+    
+    def __init__(self):
+        self._files = {}
+        self._originals = {}
+        self._lock = threading.Lock()
+    
+    def read_text(self, path) -> str:
+        key = to_project_path(path)
+        with self._lock:
+            if key in self._files:
+                return self._files[key]
+        return (PROJECT_ROOT / key).read_text(encoding='utf-8')
+    
+    def write_text(self, path, content: str):
+        key = to_project_path(path)
+        with self._lock:
+            if key not in self._originals:
+                target = PROJECT_ROOT / key
+                self._originals[key] = target.read_text(encoding='utf-8') if target.exists() else None
+            self._files[key] = content
+    
+    def exists(self, path) -> bool:
+        key = to_project_path(path)
+        with self._lock:
+            if key in self._files:
+                return True
+        return (PROJECT_ROOT / key).exists()
+    
+    def glob(self, directory, pattern) -> list:
+        """Wie Path(directory).glob(pattern), aber inkl. nur im Overlay existierender Dateien."""
+        prefix = to_project_path(directory).rstrip('/') + '/'
+        found = {to_project_path(f) for f in (PROJECT_ROOT / prefix).glob(pattern)}
+        with self._lock:
+            found.update(
+                key for key in self._files
+                if key.startswith(prefix) and '/' not in key[len(prefix):]
+                and fnmatch.fnmatch(key[len(prefix):], pattern)
+            )
+        return sorted(found)
+    
+    def changed_files(self) -> list:
+        """Gibt alle Dateien zurück, deren Inhalt sich gegenüber der Platte ändern würde."""
+        with self._lock:
+            return sorted(key for key, content in self._files.items() if content != self._originals[key])
+    
+    def diff(self) -> str:
+        """Unified Diff aller geänderten Dateien (wie `git diff`)."""
+        chunks = []
+        for key in self.changed_files():
+            original = self._originals[key]
+            chunks.extend(difflib.unified_diff(
+                (original or "").splitlines(keepends=True),
+                self._files[key].splitlines(keepends=True),
+                fromfile=f"a/{key}" if original is not None else "/dev/null",
+                tofile=f"b/{key}"
+            ))
+            if chunks and not chunks[-1].endswith("\n"):
+                chunks[-1] += "\n"
+        return "".join(chunks)
+
+# Aktives Overlay (None = direkt auf die Platte schreiben)
+_overlay = None
+
+def set_overlay(overlay):
+    """Aktiviert ein OverlayFS für alle folgenden Dateizugriffe der Release-Schritte (None = aus)."""
+    global _overlay
+    _overlay = overlay
+
+def read_project_file(path) -> str:
+    """Liest eine Textdatei (UTF-8), ggf. aus dem aktiven Overlay."""
+    if _overlay is not None:
+        return _overlay.read_text(path)
+    return Path(path).read_text(encoding='utf-8')
+
+def write_project_file(path, content: str):
+    """Schreibt eine Textdatei (UTF-8) bzw. nur in das aktive Overlay."""
+    if _overlay is not None:
+        _overlay.write_text(path, content)
+        return
+    Path(path).parent.mkdir(exist_ok=True, parents=True)
+    Path(path).write_text(content, encoding='utf-8')
+
+def glob_project_files(directory, pattern) -> list:
+    """Gibt die zu pattern passenden Dateien in directory zurück (inkl. Overlay)."""
+    if _overlay is not None:
+        return _overlay.glob(directory, pattern)
+    return sorted(str(f) for f in Path(directory).glob(pattern))
+
 def update_version_in_file(file_path, new_version):
     """Aktualisiert die Version in einer Datei.
     
@@ -17,8 +232,7 @@ def update_version_in_file(file_path, new_version):
         file_path (str): Pfad zur Datei
         new_version (str): Die neue Versionsnummer
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = read_project_file(file_path)
     
     # Ersetze die Version in der MODULE_VERSION Konstante
     content = re.sub(
@@ -27,8 +241,19 @@ def update_version_in_file(file_path, new_version):
         content
     )
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    write_project_file(file_path, content)
+
+def read_module_version(file_path="scripts/constants.cjs"):
+    """Liest MODULE_VERSION aus scripts/constants.cjs.
+    
+    Returns:
+        str or None: Version oder None, wenn Datei oder Konstante fehlen
+    """
+    path = Path(file_path)
+    if not path.exists():
+        return None
+    match = re.search(r'MODULE_VERSION:\s*[\'"]([^\'"]+)[\'"]', path.read_text(encoding='utf-8'))
+    return match.group(1) if match else None
 
 def check_and_handle_git_lock():
     """Prüft auf Git-Lock-Dateien und behandelt sie.
@@ -61,46 +286,46 @@ def check_and_handle_git_lock():
             # Wenn Git-Status erfolgreich ist, ist wahrscheinlich kein Prozess aktiv
             if result.returncode == 0:
                 if attempt == 0:
-                    print(f"  Warnung: Lock-Datei gefunden, aber kein aktiver Git-Prozess erkannt.")
-                    print(f"  Entferne Lock-Datei...")
+                    log(f"  Warnung: Lock-Datei gefunden, aber kein aktiver Git-Prozess erkannt.")
+                    log(f"  Entferne Lock-Datei...")
                 
                 try:
                     lock_file.unlink()
-                    print(f"  OK Lock-Datei erfolgreich entfernt")
+                    log(f"  OK Lock-Datei erfolgreich entfernt")
                     return True
                 except FileNotFoundError:
                     # Datei wurde zwischen Prüfung und Entfernung gelöscht - das ist OK
-                    print(f"  OK Lock-Datei wurde bereits entfernt")
+                    log(f"  OK Lock-Datei wurde bereits entfernt")
                     return True
                 except PermissionError as e:
                     if attempt < max_retries - 1:
                         time.sleep(0.5)  # Kurze Pause vor Retry
                         continue
-                    print(f"  Fehler: Keine Berechtigung zum Entfernen der Lock-Datei: {e}")
-                    print(f"  Bitte entfernen Sie die Datei manuell: {lock_file}")
+                    log(f"  Fehler: Keine Berechtigung zum Entfernen der Lock-Datei: {e}")
+                    log(f"  Bitte entfernen Sie die Datei manuell: {lock_file}")
                     return False
                 except Exception as e:
                     if attempt < max_retries - 1:
                         time.sleep(0.5)  # Kurze Pause vor Retry
                         continue
-                    print(f"  Fehler beim Entfernen der Lock-Datei: {e}")
+                    log(f"  Fehler beim Entfernen der Lock-Datei: {e}")
                     return False
             else:
                 # Git-Status fehlgeschlagen - möglicherweise läuft ein Prozess
                 if attempt == 0:
-                    print(f"  Warnung: Lock-Datei gefunden und Git-Status fehlgeschlagen.")
-                    print(f"  Möglicherweise läuft ein anderer Git-Prozess.")
+                    log(f"  Warnung: Lock-Datei gefunden und Git-Status fehlgeschlagen.")
+                    log(f"  Möglicherweise läuft ein anderer Git-Prozess.")
                 
                 if attempt < max_retries - 1:
                     time.sleep(1)  # Längere Pause, da möglicherweise ein Prozess läuft
                     continue
                 
-                print(f"  Bitte warten Sie, bis alle Git-Prozesse beendet sind, oder entfernen Sie die Datei manuell:")
-                print(f"  {lock_file}")
+                log(f"  Bitte warten Sie, bis alle Git-Prozesse beendet sind, oder entfernen Sie die Datei manuell:")
+                log(f"  {lock_file}")
                 return False
         except subprocess.TimeoutExpired:
             if attempt == 0:
-                print(f"  Warnung: Git-Status hat zu lange gedauert - möglicherweise läuft ein Git-Prozess.")
+                log(f"  Warnung: Git-Status hat zu lange gedauert - möglicherweise läuft ein Git-Prozess.")
             
             if attempt < max_retries - 1:
                 time.sleep(1)  # Längere Pause bei Timeout
@@ -109,7 +334,7 @@ def check_and_handle_git_lock():
             return False
         except Exception as e:
             if attempt == 0:
-                print(f"  Fehler beim Prüfen der Lock-Datei: {e}")
+                log(f"  Fehler beim Prüfen der Lock-Datei: {e}")
             
             if attempt < max_retries - 1:
                 time.sleep(0.5)
@@ -133,30 +358,114 @@ def run_command(command, cwd=None):
     # Prüfe auf Git-Lock-Dateien vor Git-Operationen
     if command.strip().startswith('git '):
         if not check_and_handle_git_lock():
-            print(f"  Fehler: Git-Lock-Datei blockiert die Operation. Bitte beheben Sie das Problem manuell.")
+            log(f"  Fehler: Git-Lock-Datei blockiert die Operation. Bitte beheben Sie das Problem manuell.")
             return False
     
     try:
-        subprocess.run(command, shell=True, check=True, cwd=cwd)
+        returncode, _ = stream_command(command, cwd=cwd, shell=True)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"Fehler beim Ausführen des Befehls '{command}': {e}")
+        log(f"Fehler beim Ausführen des Befehls '{command}': {e}")
         # Bei Git-Operationen zusätzliche Hilfe anbieten
         if command.strip().startswith('git '):
             lock_file = PROJECT_ROOT / ".git" / "index.lock"
             if lock_file.exists():
-                print(f"  Hinweis: Eine Git-Lock-Datei existiert noch: {lock_file}")
-                print(f"  Falls kein Git-Prozess läuft, können Sie die Datei manuell entfernen.")
+                log(f"  Hinweis: Eine Git-Lock-Datei existiert noch: {lock_file}")
+                log(f"  Falls kein Git-Prozess läuft, können Sie die Datei manuell entfernen.")
         return False
 
 # ============================================================================
 # Git-Prüfungen und robustes Tag-Handling
 # ============================================================================
 
-def check_git_repository_status():
+# Maximales Alter (Sekunden) eines vorab geholten Remote-Zustands
+REMOTE_STATE_MAX_AGE = 300
+
+_remote_state = {'timestamp': None, 'branch': None, 'refs': None}
+_remote_state_lock = threading.Lock()
+
+def prefetch_remote_state():
+    """
+    Holt den Remote-Zustand vorab (z.B. im Hintergrund beim GUI-Start).
+    
+    Führt einmal `git ls-remote origin` (Branches und Tags) sowie
+    `git fetch origin <branch>` aus und cached das Ergebnis, damit die
+    Pre-Release-Prüfungen ohne weitere Netzwerkzugriffe auskommen.
+    
+    Returns:
+        bool: True wenn der Remote-Zustand erfolgreich geholt wurde
+    """
+    with _remote_state_lock:
+        try:
+            branch = subprocess.run(
+                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
+                capture_output=True,
+                text=True,
+                cwd=PROJECT_ROOT,
+                check=True
+            ).stdout.strip()
+            
+            ls_remote = subprocess.run(
+                ['git', 'ls-remote', 'origin'],
+                capture_output=True,
+                text=True,
+                cwd=PROJECT_ROOT,
+                check=False
+            )
+            if ls_remote.returncode != 0:
+                return False
+            
+            refs = {}
+            for line in ls_remote.stdout.splitlines():
+                parts = line.split()
+                if len(parts) == 2:
+                    refs[parts[1]] = parts[0]
+            
+            if f"refs/heads/{branch}" in refs:
+                subprocess.run(
+                    ['git', 'fetch', 'origin', branch],
+                    capture_output=True,
+                    text=True,
+                    cwd=PROJECT_ROOT,
+                    check=False
+                )
+            
+            _remote_state.update(timestamp=time.monotonic(), branch=branch, refs=refs)
+            return True
+        except Exception as e:
+            log(f"  Warnung: Remote-Zustand konnte nicht vorab geholt werden: {e}")
+            return False
+
+def get_cached_remote_refs(branch=None):
+    """
+    Gibt die vorab geholten Remote-Referenzen zurück, falls sie frisch genug sind.
+    
+    Wartet ggf. auf einen laufenden prefetch_remote_state()-Aufruf.
+    
+    Args:
+        branch (str, optional): Nur gültig, wenn für diesen Branch gefetcht wurde
+    
+    Returns:
+        dict or None: {Ref-Name: Hash} oder None
+    """
+    with _remote_state_lock:
+        if _remote_state['timestamp'] is None:
+            return None
+        if time.monotonic() - _remote_state['timestamp'] > REMOTE_STATE_MAX_AGE:
+            return None
+        if branch is not None and _remote_state['branch'] != branch:
+            return None
+        return _remote_state['refs']
+
+def check_git_repository_status(use_cache=False):
     """
     Prüft den Git-Repository-Status auf potenzielle Probleme.
     
+    Args:
+        use_cache (bool): Vorab geholten Remote-Zustand nutzen (kein erneuter Fetch)
+    
     Returns:
         dict: {
             'is_clean': bool,
@@ -209,25 +518,32 @@ def check_git_repository_status():
         
         # Prüfe ob Remote-Branch existiert
         remote_branch = f"origin/{result['current_branch']}"
-        remote_check = subprocess.run(
-            ['git', 'ls-remote', '--heads', 'origin', result['current_branch']],
-            capture_output=True,
-            text=True,
-            cwd=PROJECT_ROOT,
-            check=False
-        )
-        
-        if remote_check.returncode == 0 and remote_check.stdout.strip():
-            result['remote_branch'] = remote_branch
-            
-            # Prüfe auf ausstehende Pulls (lokal hinter Remote)
-            fetch_result = subprocess.run(
-                ['git', 'fetch', 'origin', result['current_branch']],
+        cached_refs = get_cached_remote_refs(result['current_branch']) if use_cache else None
+        if cached_refs is not None:
+            remote_exists = f"refs/heads/{result['current_branch']}" in cached_refs
+        else:
+            remote_check = subprocess.run(
+                ['git', 'ls-remote', '--heads', 'origin', result['current_branch']],
                 capture_output=True,
                 text=True,
                 cwd=PROJECT_ROOT,
                 check=False
             )
+            remote_exists = remote_check.returncode == 0 and bool(remote_check.stdout.strip())
+        
+        if remote_exists:
+            result['remote_branch'] = remote_branch
+            
+            # Prüfe auf ausstehende Pulls (lokal hinter Remote)
+            # Beim vorab geholten Zustand wurde bereits gefetcht
+            if cached_refs is None:
+                subprocess.run(
+                    ['git', 'fetch', 'origin', result['current_branch']],
+                    capture_output=True,
+                    text=True,
+                    cwd=PROJECT_ROOT,
+                    check=False
+                )
             
             # Vergleiche lokalen und Remote-Branch
             local_hash = subprocess.run(
@@ -301,12 +617,13 @@ def check_git_repository_status():
     
     return result
 
-def check_tag_exists(tag_name):
+def check_tag_exists(tag_name, use_cache=False):
     """
     Prüft ob ein Tag lokal oder remote existiert.
     
     Args:
         tag_name (str): Name des Tags (z.B. 'v0.35.0')
+        use_cache (bool): Vorab geholten Remote-Zustand nutzen (kein ls-remote)
     
     Returns:
         dict: {
@@ -342,13 +659,19 @@ def check_tag_exists(tag_name):
             result['local_hash'] = local_check.stdout.strip()
         
         # Prüfe Remote-Tag
-        remote_check = subprocess.run(
-            ['git', 'ls-remote', '--tags', 'origin', tag_name],
-            capture_output=True,
-            text=True,
-            cwd=PROJECT_ROOT,
-            check=False
-        )
+        cached_refs = get_cached_remote_refs() if use_cache else None
+        if cached_refs is not None:
+            remote_hash = cached_refs.get(f"refs/tags/{tag_name}")
+            stdout = f"{remote_hash}\trefs/tags/{tag_name}" if remote_hash else ""
+            remote_check = subprocess.CompletedProcess([], 0, stdout=stdout)
+        else:
+            remote_check = subprocess.run(
+                ['git', 'ls-remote', '--tags', 'origin', tag_name],
+                capture_output=True,
+                text=True,
+                cwd=PROJECT_ROOT,
+                check=False
+            )
         
         if remote_check.returncode == 0 and remote_check.stdout.strip():
             result['exists_remote'] = True
@@ -366,7 +689,7 @@ def check_tag_exists(tag_name):
             result['is_same'] = (result['local_hash'] == result['remote_hash'])
     
     except Exception as e:
-        print(f"  Warnung: Fehler beim Prüfen des Tags {tag_name}: {e}")
+        log(f"  Warnung: Fehler beim Prüfen des Tags {tag_name}: {e}")
     
     return result
 
@@ -416,7 +739,7 @@ def push_tags_smartly(tag_name=None):
                 if tag_info['exists_local'] and tag_info['is_same']:
                     # Tag existiert bereits remote und ist identisch
                     result['skipped'].append(tag)
-                    print(f"  ⏭️  Tag {tag} existiert bereits im Remote (übersprungen)")
+                    log(f"  ⏭️  Tag {tag} existiert bereits im Remote (übersprungen)")
                 else:
                     # Tag existiert remote aber ist unterschiedlich - Warnung
                     result['skipped'].append(tag)
@@ -424,25 +747,20 @@ def push_tags_smartly(tag_name=None):
                         f"Tag {tag} existiert bereits im Remote mit unterschiedlichem Hash. "
                         f"Bitte manuell prüfen oder mit --force pushen."
                     )
-                    print(f"  ⚠️  Tag {tag} existiert bereits im Remote mit unterschiedlichem Hash (übersprungen)")
+                    log(f"  ⚠️  Tag {tag} existiert bereits im Remote mit unterschiedlichem Hash (übersprungen)")
             else:
-                # Tag existiert nicht remote - pushe ihn
-                push_result = subprocess.run(
-                    ['git', 'push', 'origin', tag],
-                    capture_output=True,
-                    text=True,
-                    cwd=PROJECT_ROOT,
-                    check=False
-                )
+                # Tag existiert nicht remote - pushe ihn (Ausgabe live ins Log)
+                returncode, output = stream_command(['git', 'push', 'origin', tag], cwd=PROJECT_ROOT)
                 
-                if push_result.returncode == 0:
+                if returncode == 0:
                     result['pushed'].append(tag)
-                    print(f"  ✅ Tag {tag} erfolgreich gepusht")
+                    log(f"  ✅ Tag {tag} erfolgreich gepusht")
                 else:
+                    push_error = "\n".join(output)
                     result['failed'].append(tag)
-                    result['errors'].append(f"Fehler beim Pushen von {tag}: {push_result.stderr}")
+                    result['errors'].append(f"Fehler beim Pushen von {tag}: {push_error}")
                     result['success'] = False
-                    print(f"  ❌ Fehler beim Pushen von Tag {tag}: {push_result.stderr}")
+                    log(f"  ❌ Fehler beim Pushen von Tag {tag}")
         
         # Pushe auch den Branch (nur wenn Tags gepusht wurden oder wenn explizit gewünscht)
         # Der Branch wird separat gepusht, daher ist diese Funktion nur für Tags zuständig
@@ -454,12 +772,13 @@ def push_tags_smartly(tag_name=None):
     
     return result
 
-def validate_release_prerequisites(new_version):
+def validate_release_prerequisites(new_version, use_cache=False):
     """
     Validiert alle Voraussetzungen für einen Release.
     
     Args:
         new_version (str): Die neue Versionsnummer
+        use_cache (bool): Vorab geholten Remote-Zustand nutzen (siehe prefetch_remote_state)
     
     Returns:
         dict: {
@@ -477,7 +796,7 @@ def validate_release_prerequisites(new_version):
     }
     
     # Prüfe Git-Status
-    git_status = check_git_repository_status()
+    git_status = check_git_repository_status(use_cache=use_cache)
     
     # Kritische Probleme
     if git_status['is_behind'] or git_status['is_diverged']:
@@ -492,7 +811,7 @@ def validate_release_prerequisites(new_version):
     
     # Prüfe Tag
     tag_name = f"v{new_version}"
-    tag_info = check_tag_exists(tag_name)
+    tag_info = check_tag_exists(tag_name, use_cache=use_cache)
     result['tag_info'] = tag_info
     
     if tag_info['exists_remote']:
@@ -516,11 +835,24 @@ def update_documentation(new_version, date):
         new_version (str): Die neue Versionsnummer
         date (str): Das Release-Datum im Format YYYY-MM-DD
     """
-    # CHANGELOG.md aktualisieren
     changelog_path = "CHANGELOG.md"
-    with open(changelog_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    new_content, release_notes_content = render_release_documentation(
+        read_project_file(changelog_path), new_version, date
+    )
+    write_project_file(changelog_path, new_content)
+    write_project_file(Path("docs/releases") / f"v{new_version}.md", release_notes_content)
+
+def render_release_documentation(content, new_version, date):
+    """Macht aus der Unreleased-Sektion eine Versions-Sektion und erzeugt die Release Notes.
     
+    Args:
+        content (str): Inhalt von CHANGELOG.md
+        new_version (str): Die neue Versionsnummer
+        date (str): Das Release-Datum im Format YYYY-MM-DD
+    
+    Returns:
+        tuple: (neuer Inhalt von CHANGELOG.md, Inhalt von docs/releases/v{version}.md)
+    """
     # Finde die [Unreleased] Sektion
     unreleased_content = ""
     if "## [Unreleased]" in content:
@@ -578,10 +910,7 @@ def update_documentation(new_version, date):
 
 """
     
-    # Aktualisiere die Datei
     new_content = content.replace(unreleased_content, f"{new_unreleased}{new_version_content}")
-    with open(changelog_path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
     
     # Extrahiere relevante Sektionen aus dem Changelog
     sections = {}
@@ -596,10 +925,6 @@ def update_documentation(new_version, date):
                 sections[section] = section_content
     
     # Erstelle Release Notes für diese Version
-    release_notes_dir = Path("docs/releases")
-    release_notes_dir.mkdir(exist_ok=True, parents=True)
-    release_notes_path = release_notes_dir / f"v{new_version}.md"
-    
     release_notes_content = f"""# Release Notes - Version {new_version}
 
 **Veröffentlichungsdatum:** {date}
@@ -619,21 +944,17 @@ def update_documentation(new_version, date):
 ## Upgrade-Hinweise
 - Keine besonderen Maßnahmen erforderlich
 """
-    
-    with open(release_notes_path, 'w', encoding='utf-8') as f:
-        f.write(release_notes_content)
+    return new_content, release_notes_content
 
 def update_json_version(file_path, new_version):
     """Aktualisiert die Version in einer JSON-Datei unter dem Schlüssel 'version'."""
-    path = Path(file_path)
-    data = json.loads(path.read_text(encoding='utf-8'))
+    data = json.loads(read_project_file(file_path))
     data['version'] = new_version
-    path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+    write_project_file(file_path, json.dumps(data, indent=2))
 
 def verify_json_version(file_path, new_version):
     """Verifiziert, dass die Version in JSON-Datei unter 'version' new_version steht."""
-    path = Path(file_path)
-    data = json.loads(path.read_text(encoding='utf-8'))
+    data = json.loads(read_project_file(file_path))
     return data.get('version') == new_version
 
 def verify_metadata_update(new_version):
@@ -643,52 +964,66 @@ def verify_metadata_update(new_version):
     
     for file_path in files_to_check:
         if not verify_json_version(file_path, new_version):
-            print(f"    X Fehler: {file_path} wurde nicht korrekt aktualisiert")
+            log(f"    X Fehler: {file_path} wurde nicht korrekt aktualisiert")
             all_verified = False
         else:
-            print(f"    OK {file_path} erfolgreich verifiziert")
+            log(f"    OK {file_path} erfolgreich verifiziert")
     
     return all_verified
 
 def update_metadata(new_version):
     """Aktualisiert Version in module.json, package.json und package-lock.json auf new_version."""
-    print("    Aktualisiere module.json...")
+    log("    Aktualisiere module.json...")
     update_json_version("module.json", new_version)
-    print("    Aktualisiere package.json...")
+    log("    Aktualisiere package.json...")
     update_json_version("package.json", new_version)
-    print("    Aktualisiere package-lock.json...")
+    log("    Aktualisiere package-lock.json...")
     update_json_version("package-lock.json", new_version)
     # Optional: weitere Dateien aktualisieren (z.B. README.md)
-    # print("    Aktualisiere README.md...")
+    # log("    Aktualisiere README.md...")
     # update_readme(new_version)
 
 def _remove_bom_from_file(path):
-    """Entfernt BOM aus einer einzelnen Datei, falls vorhanden."""
-    content = Path(path).read_text(encoding='utf-8')
+    """Entfernt BOM aus einer einzelnen Datei, falls vorhanden.
+    
+    Returns:
+        bool: True wenn ein BOM entfernt wurde
+    """
+    content = read_project_file(path)
     if content.startswith('\ufeff'):
-        Path(path).write_text(content.lstrip('\ufeff'), encoding='utf-8')
-        print(f"      BOM entfernt: {path}")
+        write_project_file(path, content.lstrip('\ufeff'))
+        log(f"      BOM entfernt: {path}")
+        return True
+    return False
 
 def remove_bom_in_paths(paths, extensions=None):
-    """Scannt die angegebenen Pfade und entfernt BOM aus Dateien mit bestimmten Erweiterungen."""
+    """Scannt die angegebenen Pfade und entfernt BOM aus Dateien mit bestimmten Erweiterungen.
+    
+    Returns:
+        list: Pfade der Dateien, aus denen ein BOM entfernt wurde
+    """
     if extensions is None:
         extensions = ['.js', '.cjs', '.mjs', '.json']
+    modified = []
     for p in paths:
         pth = Path(p)
         if pth.is_file():
-            if pth.suffix in extensions:
-                _remove_bom_from_file(pth)
+            if pth.suffix in extensions and _remove_bom_from_file(pth):
+                modified.append(str(pth))
         elif pth.is_dir():
             for f in pth.rglob('*'):
-                if f.suffix in extensions:
-                    _remove_bom_from_file(f)
+                if f.suffix in extensions and _remove_bom_from_file(f):
+                    modified.append(str(f))
+    return modified
 
 def write_unreleased_changes(changelog_path, added, changed, fixes, known, upgrade):
     """Schreibt die Unreleased-Sektion in CHANGELOG.md mit den angegebenen Änderungen."""
-    path = Path(changelog_path)
-    content = path.read_text(encoding='utf-8')
-    
-    # Baue neuen Unreleased-Abschnitt auf
+    content = read_project_file(changelog_path)
+    section = build_unreleased_section(added, changed, fixes, known, upgrade)
+    write_project_file(changelog_path, replace_unreleased_section(content, section))
+
+def build_unreleased_section(added, changed, fixes, known, upgrade):
+    """Baut den Markdown-Block der Unreleased-Sektion aus den Changelog-Texten."""
     section = "## [Unreleased]\n\n"
     section += "### Hinzugefügt\n"
     for line in added.splitlines():
@@ -716,7 +1051,10 @@ def write_unreleased_changes(changelog_path, added, changed, fixes, known, upgra
             clean = line.strip().lstrip('- ').strip()
             section += f"- {clean}\n"
     section += "\n"
-    
+    return section
+
+def replace_unreleased_section(content, section):
+    """Ersetzt die Unreleased-Sektion in content (oder hängt sie an, falls sie fehlt)."""
     # Prüfe, ob [Unreleased] bereits existiert
     if "## [Unreleased]" in content:
         # Finde den Unreleased-Block
@@ -731,22 +1069,14 @@ def write_unreleased_changes(changelog_path, added, changed, fixes, known, upgra
     else:
         # Wenn kein [Unreleased] existiert, füge es am Ende hinzu
         new_content = content.rstrip() + "\n\n" + section
-    
-    # Schreibe Datei
-    path.write_text(new_content, encoding='utf-8')
+    return new_content
 
-def read_unreleased_changes(changelog_path):
-    """Liest die Unreleased-Sektion aus CHANGELOG.md und gibt Dict mit added, changed, fixed, known, upgrade."""
-    path = Path(changelog_path)
-    content = path.read_text(encoding='utf-8')
-    if "## [Unreleased]" not in content:
-        return {"added":"", "changed":"", "fixed":"", "known":"", "upgrade":""}
-    start = content.index("## [Unreleased]")
-    try:
-        end = content.index("## [", start + len("## [Unreleased]"))
-    except ValueError:
-        end = len(content)
-    block = content[start:end]
+def parse_changelog_sections(block):
+    """Zerlegt einen Changelog-Block (### Hinzugefügt, ### Geändert, ...) in ein Dict.
+    
+    Returns:
+        dict: added, changed, fixed, known, upgrade (fehlende Sektionen leer)
+    """
     def extract(header):
         if header in block:
             idx = block.index(header) + len(header)
@@ -764,6 +1094,19 @@ def read_unreleased_changes(changelog_path):
         "upgrade": extract("### Upgrade-Hinweise")
     }
 
+def read_unreleased_changes(changelog_path):
+    """Liest die Unreleased-Sektion aus CHANGELOG.md und gibt Dict mit added, changed, fixed, known, upgrade."""
+    path = Path(changelog_path)
+    content = path.read_text(encoding='utf-8')
+    if "## [Unreleased]" not in content:
+        return {"added":"", "changed":"", "fixed":"", "known":"", "upgrade":""}
+    start = content.index("## [Unreleased]")
+    try:
+        end = content.index("## [", start + len("## [Unreleased]"))
+    except ValueError:
+        end = len(content)
+    return parse_changelog_sections(content[start:end])
+
 def get_changed_files():
     """
     Gibt eine Liste aller geänderten Dateien zurück (git status).
@@ -793,8 +1136,44 @@ def get_changed_files():
         
         return changed_files
     except Exception as e:
-        print(f"Fehler beim Ermitteln geänderter Dateien: {e}")
+        log(f"Fehler beim Ermitteln geänderter Dateien: {e}")
+        return []
+
+def get_worktree_changes(pathspecs=None):
+    """
+    Gibt alle Dateien mit Änderungen gegenüber HEAD zurück (inkl. untracked, ohne Backups).
+    
+    Im Gegensatz zu get_changed_files() werden untracked Verzeichnisse in einzelne
+    Dateien aufgelöst und bei Umbenennungen beide Pfade geliefert.
+    
+    Args:
+        pathspecs (list, optional): Nur diese Pfade/Verzeichnisse prüfen
+    
+    Returns:
+        list: Sortierte Dateipfade relativ zum Projekt-Root
+    """
+    result = subprocess.run(
+        ['git', 'status', '--porcelain', '-z', '--untracked-files=all', '--'] + list(pathspecs or []),
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        cwd=PROJECT_ROOT,
+        check=False
+    )
+    if result.returncode != 0:
         return []
+    
+    paths = set()
+    entries = iter(result.stdout.split('\0'))
+    for entry in entries:
+        if not entry:
+            continue
+        status, path = entry[:2], entry[3:]
+        paths.add(path)
+        # Bei Umbenennungen/Kopien folgt der ursprüngliche Pfad als eigener Eintrag
+        if 'R' in status or 'C' in status:
+            paths.add(next(entries, ''))
+    return sorted(p for p in paths if p and not p.startswith('.release_backup/'))
 
 def is_code_file(filepath):
     """
@@ -910,6 +1289,586 @@ def get_changed_files_info():
         'type': 'code' if code_files else 'docs'
     }
 
+# ============================================================================
+# Release-Journal (Append-only, für Resume)
+# ============================================================================
+
+def to_project_path(path) -> str:
+    """Normalisiert einen Pfad relativ zum Projekt-Root (POSIX-Schreibweise)."""
+    pth = Path(path)
+    if not pth.is_absolute():
+        pth = Path.cwd() / pth
+    try:
+        return pth.resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+    except ValueError:
+        return pth.as_posix()
+
+def file_sha256(path):
+    """Berechnet den SHA-256-Hash einer Datei.
+    
+    Args:
+        path (str): Pfad relativ zum Projekt-Root oder absolut
+    
+    Returns:
+        str or None: Hex-Digest oder None, falls die Datei nicht existiert
+    """
+    target = PROJECT_ROOT / path
+    if not target.is_file():
+        return None
+    digest = hashlib.sha256()
+    with open(target, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def hash_files(paths) -> dict:
+    """Gibt ein Dict {projekt-relativer Pfad: SHA-256} für die angegebenen Dateien zurück."""
+    hashes = {}
+    for path in paths:
+        rel = to_project_path(path)
+        hashes[rel] = file_sha256(rel)
+    return hashes
+
+def git_rev_parse(ref):
+    """Löst eine Git-Referenz auf.
+    
+    Returns:
+        str or None: Objekt-Hash oder None, falls die Referenz nicht existiert
+    """
+    result = subprocess.run(
+        ['git', 'rev-parse', '--verify', '--quiet', ref],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=False
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+# ============================================================================
+# Build-Cache: `npm run build` nur, wenn sich die Build-Eingaben geändert haben
+# ============================================================================
+
+# Eingaben des Vite-Builds (Quellen, Build-Konfiguration, patch-package-Patches
+# und die von Vite gelesenen .env-Dateien)
+BUILD_INPUTS = [
+    "src/", "templates/", "styles/", "lang/", "patches/",
+    "vite.config.ts", "svelte.config.js", "tailwind.config.js", "postcss.config.js",
+    "tsconfig.json", "package.json", "package-lock.json", ".env*"
+]
+
+# Vom letzten Build geschriebener Stempel: Hash der Build-Eingaben, Build-Modus
+# und SHA-256 jeder erzeugten Datei in dist/. Er wird mit dist/ committet und enthält
+# daher keinen Zeitstempel: bei identischem Build bleibt er byte-gleich.
+BUILD_STAMP = "dist/.build-stamp.json"
+
+# Modus von `npm run build` (vite build --mode production)
+BUILD_MODE = "production"
+
+def _normalized_package_json(path):
+    """Hash von package(-lock).json ohne Versionsfelder (die ändert jeder Release)."""
+    data = json.loads((PROJECT_ROOT / path).read_text(encoding='utf-8'))
+    data.pop('version', None)
+    data.get('packages', {}).get('', {}).pop('version', None)
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+def compute_build_hash(inputs=None):
+    """Berechnet einen Hash über alle Build-Eingaben.
+    
+    Für unveränderte Dateien werden die Blob-Hashes aus dem Git-Index verwendet
+    (`git ls-files -s`, dank Stat-Cache ohne Dateien zu lesen); nur Dateien, die
+    `git status` als geändert oder neu meldet, werden gelesen.
+    
+    Returns:
+        str: SHA-256 Hex-Digest
+    """
+    inputs = list(inputs or BUILD_INPUTS)
+    result = subprocess.run(
+        ['git', 'ls-files', '-s', '-z', '--'] + inputs,
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        cwd=PROJECT_ROOT,
+        check=True
+    )
+    blobs = {}
+    for entry in filter(None, result.stdout.split('\0')):
+        meta, path = entry.split('\t', 1)
+        blobs[path] = meta.split()[1]
+    
+    for path in get_worktree_changes(inputs):
+        digest = file_sha256(path)
+        if digest is None:
+            blobs.pop(path, None)
+        else:
+            blobs[path] = digest
+    
+    # Muster wie .env* direkt von der Platte, da lokale .env-Dateien meist ignoriert sind
+    for pattern in inputs:
+        if '*' in pattern:
+            for target in PROJECT_ROOT.glob(pattern):
+                if target.is_file():
+                    rel = target.relative_to(PROJECT_ROOT).as_posix()
+                    blobs[rel] = file_sha256(rel)
+    
+    for path in ("package.json", "package-lock.json"):
+        if path in blobs:
+            blobs[path] = _normalized_package_json(path)
+    
+    digest = hashlib.sha256()
+    for path in sorted(blobs):
+        digest.update(f"{path}\0{blobs[path]}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def read_build_stamp():
+    """Gibt den Stempel des letzten Builds zurück (None wenn keiner existiert)."""
+    path = PROJECT_ROOT / BUILD_STAMP
+    if not path.is_file():
+        return None
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except ValueError:
+        return None
+
+def compute_dist_hashes():
+    """SHA-256 aller Dateien in dist/ (ohne den Stempel), Pfade relativ zum Projekt-Root."""
+    dist = PROJECT_ROOT / Path(BUILD_STAMP).parent
+    if not dist.is_dir():
+        return {}
+    files = sorted(f.relative_to(PROJECT_ROOT).as_posix() for f in dist.rglob('*') if f.is_file())
+    return {rel: file_sha256(rel) for rel in files if rel != BUILD_STAMP}
+
+def write_build_stamp(build_hash, mode=BUILD_MODE):
+    """Schreibt Build-Hash, Modus und die Hashes der erzeugten Dateien nach dist/."""
+    path = PROJECT_ROOT / BUILD_STAMP
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stamp = {'hash': build_hash, 'mode': mode, 'files': compute_dist_hashes()}
+    _store_build_stamp(stamp)
+    return stamp
+
+def _store_build_stamp(stamp):
+    """Schreibt den Stempel (nur bei geändertem Inhalt, damit er byte-gleich bleibt)."""
+    path = PROJECT_ROOT / BUILD_STAMP
+    content = json.dumps(stamp, indent=2, sort_keys=True) + "\n"
+    if not path.is_file() or path.read_text(encoding='utf-8') != content:
+        path.write_text(content, encoding='utf-8')
+
+def refresh_build_stamp(paths):
+    """Zieht die Datei-Hashes des Build-Stempels nach, wenn die BOM-Entfernung dist/ geändert hat.
+    
+    Übernommen wird der neue Hash nur für Dateien, deren Stempel-Hash genau dem
+    Inhalt mit vorangestelltem BOM entspricht, die also bis auf das BOM unverändert
+    aus dem Build stammen. Ein schon vorher abweichendes dist/ bleibt veraltet.
+    
+    Args:
+        paths (list): Von remove_bom_in_paths() geänderte Dateien
+    
+    Returns:
+        list: Dateien, deren Hash nachgezogen wurde
+    """
+    stamp = read_build_stamp()
+    if not stamp or not stamp.get('files'):
+        return []
+    files = dict(stamp['files'])
+    refreshed = []
+    for path in paths:
+        rel = to_project_path(path)
+        if rel not in files:
+            continue
+        data = (PROJECT_ROOT / rel).read_bytes()
+        if files[rel] == hashlib.sha256(b'\xef\xbb\xbf' + data).hexdigest():
+            files[rel] = hashlib.sha256(data).hexdigest()
+            refreshed.append(rel)
+    if refreshed:
+        _store_build_stamp(dict(stamp, files=files))
+    return refreshed
+
+def build_stamp_mismatch(build_hash=None, mode=BUILD_MODE):
+    """Prüft dist/ gegen den Build-Stempel.
+    
+    Neben dem Hash der Build-Eingaben werden Build-Modus und die Hashes der
+    Dateien in dist/ verglichen. So fällt auch ein dist/ auf, das nach dem
+    Release-Build überschrieben wurde (z.B. `npm run build:dev` aus `check:build`).
+    
+    Returns:
+        str or None: Grund der Abweichung, None wenn dist/ aktuell ist
+    """
+    stamp = read_build_stamp()
+    if stamp is None:
+        return "kein Build-Stempel"
+    if stamp.get('hash') != (build_hash or compute_build_hash()):
+        return "Build-Eingaben geändert"
+    if stamp.get('mode') != mode:
+        return f"Build-Modus {stamp.get('mode') or 'unbekannt'} statt {mode}"
+    recorded = stamp.get('files') or {}
+    current = compute_dist_hashes()
+    changed = sorted(rel for rel in set(recorded) | set(current) if recorded.get(rel) != current.get(rel))
+    if changed:
+        return f"dist/ seit dem Build verändert ({', '.join(changed[:3])}{', ...' if len(changed) > 3 else ''})"
+    return None
+
+def is_build_current(build_hash=None, mode=BUILD_MODE):
+    """True wenn dist/ zu den aktuellen Build-Eingaben und dem Stempel passt."""
+    return build_stamp_mismatch(build_hash, mode) is None
+
+# ============================================================================
+# Git-Plumbing: Release-Commit und -Tag ohne den Index des Arbeitsverzeichnisses
+# ============================================================================
+
+class GitCommitBuilder:
+    """Erstellt Release-Commit und annotierten Tag über Git-Plumbing.
+    
+    Gestaged wird in einem temporären Index (GIT_INDEX_FILE), der vom aktuellen
+    HEAD ausgeht und nur die übergebenen Dateien aktualisiert. Dadurch blockiert
+    eine von IDE oder Git-Client gehaltene `.git/index.lock` den Release nicht, und
+    es wird nicht der komplette Baum (dist/, docs/, ...) durchsucht.
+    
+    Mit `record` (Liste) werden die ändernden Befehle nur aufgezeichnet (Testlauf);
+    die Methoden geben dann Platzhalter wie '<tree>' zurück. Lesende Abfragen
+    (rev-parse, var, check-ignore) laufen auch im Testlauf und werden nicht aufgezeichnet.
+    """
+    
+    def __init__(self, record=None):
+        self.record = record
+    
+    def _git(self, args, stdin=None, env=None, placeholder=None, ok_codes=(0,), readonly=False):
+        """Führt einen Git-Befehl aus und gibt stdout (ohne Zeilenumbruch) zurück.
+        
+        `readonly`: Abfrage ohne Seiteneffekte, wird auch im Testlauf ausgeführt.
+        """
+        if self.record is not None and not readonly:
+            prefix = "".join(f"{key}={value} " for key, value in (env or {}).items())
+            command = prefix + subprocess.list2cmdline(['git'] + args)
+            self.record.append(command)
+            log(f"    $ {command}")
+            return placeholder
+        result = subprocess.run(
+            ['git'] + args,
+            input=stdin,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            cwd=PROJECT_ROOT,
+            env=dict(os.environ, **env) if env else None,
+            check=False
+        )
+        if result.returncode not in ok_codes:
+            raise RuntimeError(f"git {' '.join(args)} fehlgeschlagen: {result.stderr.strip()}")
+        return result.stdout.strip()
+    
+    def stage(self, paths, base='HEAD'):
+        """Schreibt einen Tree aus `base` plus dem aktuellen Inhalt von `paths`.
+        
+        Gelöschte Dateien werden aus dem Tree entfernt.
+        
+        Returns:
+            str: Tree-Hash
+        """
+        paths = sorted({to_project_path(p) for p in paths})
+        if paths:
+            # Wie 'git add': ignorierte, nicht versionierte Dateien bleiben draußen (Exit 1 = keine)
+            ignored = self._git(['check-ignore', '-z', '--stdin'],
+                                stdin="".join(f"{p}\0" for p in paths), ok_codes=(0, 1), readonly=True)
+            ignored = set(filter(None, ignored.split("\0")))
+            paths = [p for p in paths if p not in ignored]
+        git_dir = Path(self._git(['rev-parse', '--absolute-git-dir'], readonly=True))
+        index_file = git_dir / f"index.release-{os.getpid()}"
+        env = {'GIT_INDEX_FILE': str(index_file)}
+        try:
+            self._git(['read-tree', base], env=env)
+            self._git(['update-index', '--add', '--remove', '-z', '--stdin'],
+                      stdin="".join(f"{p}\0" for p in paths), env=env)
+            if self.record is not None:
+                log("\n".join(f"      {p}" for p in paths))
+            return self._git(['write-tree'], env=env, placeholder="<tree>")
+        finally:
+            if self.record is None and index_file.exists():
+                index_file.unlink()
+    
+    def commit(self, tree, message, parent):
+        """Erstellt ein Commit-Objekt (ohne Hooks) und gibt dessen Hash zurück."""
+        if self.record is not None:
+            log("    Commit-Message:")
+            log("\n".join(f"      {line}" for line in message.rstrip().splitlines()))
+        return self._git(['commit-tree', tree, '-p', parent, '-F', '-'], stdin=message, placeholder="<commit>")
+    
+    def update_ref(self, ref, new, old=None, reason="release"):
+        """Setzt eine Referenz; mit `old` nur, wenn sie noch auf `old` zeigt (Compare-and-swap)."""
+        args = ['update-ref', '-m', reason, ref, new]
+        if old is not None:
+            args.append(old)
+        self._git(args)
+    
+    def tag(self, name, target, message):
+        """Erstellt einen annotierten Tag über `git mktag` und setzt refs/tags/<name> (wie tag -f).
+        
+        Returns:
+            str: Hash des Tag-Objekts
+        """
+        tagger = self._git(['var', 'GIT_COMMITTER_IDENT'], readonly=True)
+        tag_object = (
+            f"object {target}\n"
+            f"type commit\n"
+            f"tag {name}\n"
+            f"tagger {tagger}\n"
+            f"\n"
+            f"{message.rstrip()}\n"
+        )
+        tag_hash = self._git(['mktag'], stdin=tag_object, placeholder="<tag>")
+        self.update_ref(f"refs/tags/{name}", tag_hash, reason=f"release: tag {name}")
+        return tag_hash
+    
+    def sync_index(self, paths):
+        """Gleicht den Index des Arbeitsverzeichnisses für `paths` an HEAD an.
+        
+        Nicht kritisch: Ist der Index gesperrt, wird nur ein Hinweis geloggt.
+        
+        Returns:
+            bool: True wenn der Index aktualisiert wurde
+        """
+        paths = sorted({to_project_path(p) for p in paths})
+        if not paths:
+            return True
+        try:
+            self._git(['reset', '-q', '--'] + paths)
+            return True
+        except RuntimeError as e:
+            log(f"  Hinweis: Index konnte nicht aktualisiert werden ({e}).")
+            log(f"  Commit und Tag sind davon nicht betroffen; ggf. 'git reset -q -- <Dateien>' ausführen.")
+            return False
+
+class ReleaseWorktree:
+    """Temporärer `git worktree` für einen isolierten Release.
+    
+    Der Worktree wird detached auf HEAD des Projekts angelegt (gemeinsamer
+    Objektspeicher, daher fast ohne Kosten). Die Release-Schritte ändern und
+    committen dort; anschließend wird der Branch des Haupt-Checkouts per
+    Fast-Forward nachgezogen. Bei Fehlern genügt es, den Worktree zu löschen.
+    """
+    
+    def __init__(self, root, path, branch, base):
+        self.root = Path(root)
+        self.path = Path(path)
+        self.branch = branch
+        self.base = base
+    
+    @staticmethod
+    def _git(args, cwd):
+        result = subprocess.run(
+            ['git'] + args,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            cwd=cwd,
+            check=False
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"git {' '.join(args)} fehlgeschlagen: {result.stderr.strip()}")
+        return result.stdout.strip()
+    
+    @classmethod
+    def create(cls, version, root=None):
+        """Legt den Worktree für `version` an (Verzeichnis unter dem System-Temp).
+        
+        Raises:
+            RuntimeError: Wenn HEAD auf keinem Branch steht oder `git worktree add` fehlschlägt
+        """
+        import tempfile
+        root = Path(root or PROJECT_ROOT)
+        branch = cls._git(['rev-parse', '--abbrev-ref', 'HEAD'], root)
+        if branch == 'HEAD':
+            raise RuntimeError("Isolierter Release benötigt einen ausgecheckten Branch (HEAD ist detached)")
+        base = cls._git(['rev-parse', 'HEAD'], root)
+        path = Path(tempfile.mkdtemp(prefix=f"release-v{version}-"))
+        try:
+            cls._git(['worktree', 'add', '--detach', str(path), base], root)
+        except RuntimeError:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+        # Build-Werkzeuge des Haupt-Checkouts mitbenutzen (Schritt 0: npm run build)
+        if (root / "node_modules").is_dir():
+            try:
+                (path / "node_modules").symlink_to(root / "node_modules", target_is_directory=True)
+            except OSError as e:
+                log(f"  Hinweis: node_modules konnte nicht verlinkt werden ({e})")
+        log(f"  Temporärer Worktree: {path} ({branch} @ {base[:12]})")
+        return cls(root, path, branch, base)
+    
+    def fast_forward(self, commit):
+        """Zieht den Branch des Haupt-Checkouts auf `commit` nach (nur Fast-Forward).
+        
+        Ist der Branch noch ausgecheckt, läuft `git merge --ff-only`, damit auch
+        Index und Arbeitsverzeichnis den Release-Stand bekommen. Sonst wird nur die
+        Referenz gesetzt, sofern sie noch auf der Basis steht.
+        """
+        current = self._git(['rev-parse', '--abbrev-ref', 'HEAD'], self.root)
+        if current == self.branch:
+            self._git(['merge', '--ff-only', '-q', commit], self.root)
+        else:
+            self._git(['update-ref', '-m', 'release: fast-forward',
+                       f"refs/heads/{self.branch}", commit, self.base], self.root)
+        log(f"  Branch {self.branch} auf {commit[:12]} vorgespult")
+    
+    def copy_back(self, paths):
+        """Kopiert nicht versionierte Ausgaben (Dateien/Verzeichnisse) in den Haupt-Checkout.
+        
+        Was die Schritte außerhalb von Git erzeugen (z.B. release-artifacts/), ginge
+        sonst mit dem Worktree verloren. Vorhandene Dateien im Checkout werden ersetzt.
+        
+        Returns:
+            list: Kopierte Pfade (relativ)
+        """
+        copied = []
+        for rel in paths:
+            source, target = self.path / rel, self.root / rel
+            if source.is_dir():
+                shutil.copytree(source, target, dirs_exist_ok=True)
+            elif source.is_file():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, target)
+            else:
+                continue
+            copied.append(rel)
+        return copied
+    
+    def remove(self):
+        """Entfernt den Worktree samt Verzeichnis (auch nach Fehlern)."""
+        try:
+            self._git(['worktree', 'remove', '--force', str(self.path)], self.root)
+        except RuntimeError as e:
+            log(f"  Hinweis: Worktree konnte nicht entfernt werden ({e})")
+            shutil.rmtree(self.path, ignore_errors=True)
+            subprocess.run(['git', 'worktree', 'prune'], cwd=self.root, capture_output=True, check=False)
+
+class ReleaseJournal:
+    """Append-only JSONL-Journal eines Release-Laufs.
+    
+    Jeder Eintrag wird als eigene Zeile angehängt und per fsync auf die Platte
+    geschrieben, damit ein abgebrochener Release später fortgesetzt werden kann.
+    """
+    
+    FILENAME = "journal.jsonl"
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+    
+    def append(self, event: str, **data) -> dict:
+        """Hängt einen Eintrag an das Journal an."""
+        record = {'ts': datetime.now().isoformat(timespec='seconds'), 'event': event}
+        record.update(data)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        return record
+    
+    def read(self) -> list:
+        """Liest alle Einträge (eine abgeschnittene letzte Zeile wird ignoriert)."""
+        if not self.path.exists():
+            return []
+        records = []
+        for line in self.path.read_text(encoding='utf-8').splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return records
+    
+    def find(self, event: str):
+        """Gibt den letzten Eintrag mit dem angegebenen Event zurück (oder None)."""
+        for record in reversed(self.read()):
+            if record.get('event') == event:
+                return record
+        return None
+    
+    def completed_steps(self) -> dict:
+        """Gibt {Schritt-ID: Eintrag} aller abgeschlossenen Schritte in Reihenfolge zurück."""
+        steps = {}
+        for record in self.read():
+            if record.get('event') == 'step_completed' and record.get('step') is not None:
+                steps[record['step']] = record
+        return dict(sorted(steps.items()))
+    
+    def is_finished(self) -> bool:
+        """True wenn der Release abgeschlossen oder zurückgerollt wurde."""
+        return any(
+            r.get('event') in ('release_completed', 'release_rolled_back')
+            for r in self.read()
+        )
+
+def verify_release_journal(journal: ReleaseJournal) -> dict:
+    """
+    Gleicht die abgeschlossenen Schritte im Journal mit dem aktuellen Repository ab.
+    
+    Ein Schritt gilt als verifiziert, wenn alle von ihm geschriebenen Dateien noch
+    den zuletzt im Journal festgehaltenen Hash haben und seine Git-Ergebnisse
+    (Commit, Tag, Index) unverändert sind. Nach dem ersten ungültigen Schritt
+    werden alle folgenden Schritte ebenfalls als unvollständig betrachtet.
+    
+    Returns:
+        dict: {
+            'verified': list,  # IDs der übersprungbaren Schritte
+            'invalid': list,  # IDs der Schritte, die wiederholt werden müssen
+            'diverged': list  # Abweichende Dateien/Referenzen
+        }
+    """
+    steps = journal.completed_steps()
+    expected = {}
+    writers = {}
+    for step_id, record in steps.items():
+        for path, digest in record.get('outputs', {}).get('files', {}).items():
+            expected[path] = digest
+            writers.setdefault(path, []).append(step_id)
+    
+    invalid = set()
+    diverged = []
+    for path, digest in expected.items():
+        if file_sha256(path) != digest:
+            diverged.append(path)
+            invalid.update(writers[path])
+    
+    commit_steps = [s for s, r in steps.items() if r.get('outputs', {}).get('git', {}).get('commit')]
+    for step_id, record in steps.items():
+        git = record.get('outputs', {}).get('git', {})
+        if git.get('commit') and git_rev_parse('HEAD') != git['commit']:
+            diverged.append('HEAD')
+            invalid.add(step_id)
+        if git.get('tag') and git_rev_parse(f"refs/tags/{git['tag']}") != git.get('object'):
+            diverged.append(f"refs/tags/{git['tag']}")
+            invalid.add(step_id)
+        # Der Index-Stand ist nur relevant, solange noch kein Commit darauf aufbaut
+        if git.get('tree') and git.get('base') and not any(s > step_id for s in commit_steps):
+            # Tree aus temporärem Index: gültig, solange HEAD noch auf seiner Basis steht
+            if git_rev_parse('HEAD') != git['base']:
+                diverged.append('HEAD')
+                invalid.add(step_id)
+        elif git.get('tree') and not any(s > step_id for s in commit_steps):
+            tree = subprocess.run(
+                ['git', 'write-tree'],
+                capture_output=True,
+                text=True,
+                cwd=PROJECT_ROOT,
+                check=False
+            ).stdout.strip()
+            if tree != git['tree']:
+                diverged.append('index')
+                invalid.add(step_id)
+    
+    first_invalid = min(invalid) if invalid else None
+    verified = [s for s in steps if first_invalid is None or s < first_invalid]
+    return {
+        'verified': verified,
+        'invalid': [s for s in steps if s not in verified],
+        'diverged': diverged
+    }
+
 # ============================================================================
 # Rollback-System für Release-Prozess
 # ============================================================================
@@ -917,14 +1876,49 @@ def get_changed_files_info():
 class ReleaseCheckpoint:
     """Verwaltet Checkpoints und Rollbacks für den Release-Prozess."""
     
-    def __init__(self, version: str):
+    def __init__(self, version: str, backup_dir=None):
         self.version = version
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.backup_dir = PROJECT_ROOT / ".release_backup" / f"{version}_{self.timestamp}"
+        if backup_dir is None:
+            self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.backup_dir = PROJECT_ROOT / ".release_backup" / f"{version}_{self.timestamp}"
+        else:
+            self.backup_dir = Path(backup_dir)
+            self.timestamp = self.backup_dir.name.split('_', 1)[-1]
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self.journal = ReleaseJournal(self.backup_dir / ReleaseJournal.FILENAME)
+        # Log liegt neben (nicht im) Backup-Verzeichnis und überlebt so cleanup()
+        self.log_path = self.backup_dir.parent / f"{self.backup_dir.name}.log"
         self.git_commit_hash = None
         self.completed_steps = []
         self.files_backed_up = []
+    
+    @classmethod
+    def load(cls, backup_dir):
+        """Lädt einen bestehenden Checkpoint aus seinem Journal (für Resume).
+        
+        Returns:
+            ReleaseCheckpoint or None: None wenn das Journal keinen Checkpoint enthält
+        """
+        journal = ReleaseJournal(Path(backup_dir) / ReleaseJournal.FILENAME)
+        created = journal.find('checkpoint_created')
+        if created is None:
+            return None
+        checkpoint = cls(created['version'], backup_dir=backup_dir)
+        checkpoint.git_commit_hash = created.get('git_commit')
+        checkpoint.files_backed_up = list(created.get('files', {}))
+        checkpoint.completed_steps = [
+            r.get('label') for r in checkpoint.journal.completed_steps().values()
+        ]
+        return checkpoint
+    
+    def record_release_start(self, params: dict):
+        """Hält die Eingaben des Release-Laufs im Journal fest."""
+        self.journal.append('release_started', params=params)
+    
+    def get_release_params(self):
+        """Gibt die beim Start festgehaltenen Release-Eingaben zurück (oder None)."""
+        record = self.journal.find('release_started')
+        return record.get('params') if record else None
         
     def create_git_checkpoint(self) -> bool:
         """Erstellt einen Git-Checkpoint (speichert aktuellen Commit-Hash)."""
@@ -939,10 +1933,10 @@ class ReleaseCheckpoint:
             self.git_commit_hash = result.stdout.strip()
             checkpoint_file = self.backup_dir / "git_checkpoint.txt"
             checkpoint_file.write_text(f"Commit: {self.git_commit_hash}\n", encoding='utf-8')
-            print(f"  Git-Checkpoint erstellt: {self.git_commit_hash[:8]}")
+            log(f"  Git-Checkpoint erstellt: {self.git_commit_hash[:8]}")
             return True
         except Exception as e:
-            print(f"  Warnung: Git-Checkpoint konnte nicht erstellt werden: {e}")
+            log(f"  Warnung: Git-Checkpoint konnte nicht erstellt werden: {e}")
             return False
     
     def backup_file(self, file_path: str) -> bool:
@@ -962,7 +1956,7 @@ class ReleaseCheckpoint:
             self.files_backed_up.append(file_path)
             return True
         except Exception as e:
-            print(f"  Warnung: Backup von {file_path} fehlgeschlagen: {e}")
+            log(f"  Warnung: Backup von {file_path} fehlgeschlagen: {e}")
             return False
     
     def backup_files(self, file_paths: list) -> int:
@@ -973,11 +1967,27 @@ class ReleaseCheckpoint:
                 backed_up += 1
         return backed_up
     
-    def mark_step_completed(self, step_name: str):
-        """Markiert einen Schritt als abgeschlossen."""
+    def mark_step_completed(self, step_name: str, step_id=None, inputs=None, outputs=None):
+        """Markiert einen Schritt als abgeschlossen (Append ins Journal).
+        
+        Args:
+            step_name (str): Anzeigename des Schritts
+            step_id (int, optional): Nummer des Schritts (für Resume)
+            inputs (dict, optional): Eingaben des Schritts (Parameter, Datei-Hashes vorher)
+            outputs (dict, optional): Ergebnisse ({'files': {pfad: hash}, 'git': {...}})
+        """
         self.completed_steps.append(step_name)
-        status_file = self.backup_dir / "steps_completed.txt"
-        status_file.write_text("\n".join(self.completed_steps) + "\n", encoding='utf-8')
+        self.journal.append(
+            'step_completed',
+            step=step_id,
+            label=step_name,
+            inputs=inputs or {},
+            outputs=outputs or {}
+        )
+    
+    def mark_release_completed(self):
+        """Markiert den Release im Journal als abgeschlossen."""
+        self.journal.append('release_completed')
     
     def rollback_file(self, file_path: str) -> bool:
         """Stellt eine Datei aus dem Backup wieder her."""
@@ -993,59 +2003,163 @@ class ReleaseCheckpoint:
             shutil.copy2(backup_path, target)
             return True
         except Exception as e:
-            print(f"  Fehler beim Rollback von {file_path}: {e}")
+            log(f"  Fehler beim Rollback von {file_path}: {e}")
             return False
     
+    def _git(self, *args, check=False):
+        """Führt einen Git-Befehl im Projekt-Root aus."""
+        return subprocess.run(
+            ['git', *args],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+            check=check
+        )
+    
+    def get_release_git_results(self) -> dict:
+        """Ermittelt aus dem Journal die vom Release erzeugten Commits und Tags.
+        
+        Returns:
+            dict: {
+                'commits': list,  # Vom Release erstellte Commit-Hashes
+                'tags': list  # Dicts {'tag', 'object', 'previous_object'}
+            }
+        """
+        results = {'commits': [], 'tags': []}
+        for record in self.journal.read():
+            if record.get('event') != 'step_completed':
+                continue
+            git = record.get('outputs', {}).get('git', {})
+            if git.get('commit'):
+                results['commits'].append(git['commit'])
+            if git.get('tag'):
+                results['tags'].append(git)
+        return results
+    
+    def rollback_tags(self) -> bool:
+        """Entfernt nur die vom Release erstellten Tags (bzw. stellt überschriebene wieder her)."""
+        ok = True
+        for tag in reversed(self.get_release_git_results()['tags']):
+            ref = f"refs/tags/{tag['tag']}"
+            current = git_rev_parse(ref)
+            if current is None or current != tag.get('object'):
+                # Tag existiert nicht mehr oder wurde seitdem neu gesetzt - nicht anfassen
+                continue
+            if tag.get('previous_object'):
+                log(f"  Stelle vorherigen Tag {tag['tag']} wieder her")
+                result = self._git('update-ref', ref, tag['previous_object'], current)
+            else:
+                log(f"  Entferne lokalen Tag {tag['tag']}")
+                result = self._git('tag', '-d', tag['tag'])
+            if result.returncode != 0:
+                log(f"  Fehler beim Zurücksetzen von Tag {tag['tag']}: {result.stderr.strip()}")
+                ok = False
+        return ok
+    
     def rollback_git(self) -> bool:
-        """Rollback zu Git-Checkpoint."""
+        """Macht nur die vom Release erstellten Commits und Tags rückgängig.
+        
+        Der Branch wird per Soft-Reset auf den Checkpoint gesetzt und nur die
+        Index-Einträge der vom Release committeten Pfade werden zurückgesetzt.
+        Das Working Directory bleibt unberührt (Dateien stellt rollback_files() her),
+        sodass fremde, nicht zum Release gehörende Änderungen erhalten bleiben.
+        """
         if not self.git_commit_hash:
-            print("  Kein Git-Checkpoint vorhanden")
+            log("  Kein Git-Checkpoint vorhanden")
             return False
         
         try:
-            # Prüfe ob wir uns noch im gleichen Repository befinden
-            result = subprocess.run(
-                ['git', 'rev-parse', 'HEAD'],
-                capture_output=True,
-                text=True,
-                cwd=PROJECT_ROOT,
-                check=True
-            )
-            current_hash = result.stdout.strip()
+            ok = self.rollback_tags()
             
+            current_hash = git_rev_parse('HEAD')
             if current_hash == self.git_commit_hash:
-                print("  Bereits am Checkpoint - kein Rollback nötig")
-                return True
+                log("  Bereits am Checkpoint - kein Commit-Rollback nötig")
+                return ok
             
-            # Reset zu Checkpoint (nur Working Directory, nicht HEAD)
-            print(f"  Rollback zu Git-Checkpoint: {self.git_commit_hash[:8]}")
-            subprocess.run(
-                ['git', 'reset', '--hard', self.git_commit_hash],
-                cwd=PROJECT_ROOT,
-                check=True
-            )
-            return True
+            new_commits = self._git('rev-list', f'{self.git_commit_hash}..HEAD', check=True).stdout.split()
+            release_commits = set(self.get_release_git_results()['commits'])
+            foreign = [c for c in new_commits if c not in release_commits]
+            if foreign:
+                log(f"  Warnung: {len(foreign)} Commit(s) seit dem Checkpoint stammen nicht vom Release "
+                      f"- Commit-Rollback übersprungen")
+                return False
+            
+            # Bereits gepushte Commits nicht lokal umschreiben (Branch würde divergieren)
+            upstream = self._git('rev-parse', '--abbrev-ref', '--symbolic-full-name', '@{u}')
+            if upstream.returncode == 0:
+                pushed = self._git('merge-base', '--is-ancestor', current_hash, upstream.stdout.strip())
+                if pushed.returncode == 0:
+                    log("  Warnung: Release-Commit ist bereits gepusht - Commit-Rollback übersprungen")
+                    return False
+            
+            changed_paths = self._git(
+                'diff', '--name-only', '-z', self.git_commit_hash, current_hash, check=True
+            ).stdout.split('\0')
+            changed_paths = [p for p in changed_paths if p]
+            
+            log(f"  Entferne {len(new_commits)} Release-Commit(s), zurück zu {self.git_commit_hash[:8]}")
+            self._git('reset', '--soft', self.git_commit_hash, check=True)
+            if changed_paths:
+                self._git('reset', '-q', self.git_commit_hash, '--', *changed_paths, check=True)
+            return ok
         except Exception as e:
-            print(f"  Fehler beim Git-Rollback: {e}")
+            log(f"  Fehler beim Git-Rollback: {e}")
             return False
     
     def rollback_files(self) -> int:
-        """Stellt alle gesicherten Dateien wieder her."""
+        """Stellt nur die gesicherten Dateien wieder her, deren Inhalt abweicht.
+        
+        Zusätzlich werden Dateien entfernt, die der Release neu angelegt hat
+        (z.B. Release Notes), sofern sie seitdem nicht verändert wurden.
+        """
+        created = self.journal.find('checkpoint_created') or {}
+        original_hashes = created.get('files', {})
+        
         restored = 0
         for file_path in self.files_backed_up:
+            backup_hash = original_hashes.get(file_path) or file_sha256(self.backup_dir / file_path)
+            if file_sha256(file_path) == backup_hash:
+                continue
             if self.rollback_file(file_path):
+                log(f"  Wiederhergestellt: {file_path}")
+                restored += 1
+        
+        for file_path, digest in self._files_created_by_release().items():
+            target = PROJECT_ROOT / file_path
+            if file_sha256(file_path) != digest:
+                continue
+            try:
+                target.unlink()
+                log(f"  Entfernt (vom Release erstellt): {file_path}")
                 restored += 1
+            except OSError as e:
+                log(f"  Fehler beim Entfernen von {file_path}: {e}")
         return restored
     
+    def _files_created_by_release(self) -> dict:
+        """Gibt {Pfad: letzter Hash} der Dateien zurück, die vor dem Release nicht existierten."""
+        created = {}
+        for record in self.journal.read():
+            if record.get('event') != 'step_completed':
+                continue
+            before = record.get('inputs', {}).get('files', {})
+            for path, digest in record.get('outputs', {}).get('files', {}).items():
+                if path in self.files_backed_up:
+                    continue
+                # Im Journal steht vor dem Schritt None, wenn die Datei noch nicht existierte
+                if path in created or (path in before and before[path] is None):
+                    created[path] = digest
+        return {p: d for p, d in created.items() if d is not None}
+    
     def rollback_all(self) -> dict:
-        """Führt vollständigen Rollback durch."""
+        """Führt einen selektiven Rollback durch (nur vom Release verursachte Änderungen)."""
         result = {
             'git': False,
             'files': 0,
             'success': False
         }
         
-        print("\nStarte Rollback...")
+        log("\nStarte Rollback...")
         
         # Rollback Git
         result['git'] = self.rollback_git()
@@ -1053,12 +2167,13 @@ class ReleaseCheckpoint:
         # Rollback Dateien
         result['files'] = self.rollback_files()
         
-        result['success'] = result['git'] or result['files'] > 0
+        result['success'] = result['git']
         
         if result['success']:
-            print(f"  Rollback abgeschlossen: {result['files']} Dateien wiederhergestellt")
+            self.journal.append('release_rolled_back', git=result['git'], files=result['files'])
+            log(f"  Rollback abgeschlossen: {result['files']} Dateien wiederhergestellt")
         else:
-            print("  Warnung: Rollback konnte nicht vollständig durchgeführt werden")
+            log("  Warnung: Rollback konnte nicht vollständig durchgeführt werden")
         
         return result
     
@@ -1067,9 +2182,9 @@ class ReleaseCheckpoint:
         try:
             if self.backup_dir.exists():
                 shutil.rmtree(self.backup_dir)
-                print(f"  Backup-Verzeichnis entfernt: {self.backup_dir}")
+                log(f"  Backup-Verzeichnis entfernt: {self.backup_dir}")
         except Exception as e:
-            print(f"  Warnung: Backup-Verzeichnis konnte nicht entfernt werden: {e}")
+            log(f"  Warnung: Backup-Verzeichnis konnte nicht entfernt werden: {e}")
     
     def get_backup_info(self) -> str:
         """Gibt Informationen über das Backup zurück."""
@@ -1082,6 +2197,32 @@ class ReleaseCheckpoint:
         info += f"Abgeschlossene Schritte: {len(self.completed_steps)}\n"
         return info
 
+def find_resumable_checkpoint():
+    """
+    Sucht den jüngsten Release-Checkpoint, dessen Release weder abgeschlossen
+    noch zurückgerollt wurde.
+    
+    Returns:
+        ReleaseCheckpoint or None
+    """
+    backup_root = PROJECT_ROOT / ".release_backup"
+    if not backup_root.is_dir():
+        return None
+    
+    journals = sorted(
+        backup_root.glob(f"*/{ReleaseJournal.FILENAME}"),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True
+    )
+    for journal_path in journals:
+        journal = ReleaseJournal(journal_path)
+        if journal.is_finished() or journal.find('release_started') is None:
+            continue
+        checkpoint = ReleaseCheckpoint.load(journal_path.parent)
+        if checkpoint is not None:
+            return checkpoint
+    return None
+
 def create_release_checkpoint(version: str) -> ReleaseCheckpoint:
     """Erstellt einen neuen Release-Checkpoint."""
     checkpoint = ReleaseCheckpoint(version)
@@ -1095,9 +2236,15 @@ def create_release_checkpoint(version: str) -> ReleaseCheckpoint:
         "CHANGELOG.md"
     ]
     
-    print(f"\nErstelle Release-Checkpoint für Version {version}...")
+    log(f"\nErstelle Release-Checkpoint für Version {version}...")
     checkpoint.create_git_checkpoint()
     backed_up = checkpoint.backup_files(important_files)
-    print(f"  {backed_up} Dateien gesichert")
+    log(f"  {backed_up} Dateien gesichert")
+    checkpoint.journal.append(
+        'checkpoint_created',
+        version=version,
+        git_commit=checkpoint.git_commit_hash,
+        files=hash_files(checkpoint.files_backed_up)
+    )
     
     return checkpoint 
\ No newline at end of file